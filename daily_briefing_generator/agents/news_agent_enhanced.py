@@ -2,7 +2,7 @@
 import asyncio
 import os
 import sys
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 import google.generativeai as genai
 
@@ -10,6 +10,10 @@ import google.generativeai as genai
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.news_tool import get_news_data
+from tools.prompt_builder import PromptBuilder
+from tools.ranking import rank_articles
+from tools.intent import DEFAULT_NEWS_COUNTRY, Intent, parse_intent
+from tools.llm_cache import CachedModel
 
 # Load environment variables from parent directory
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
@@ -25,13 +29,26 @@ class NewsAgent:
         if not api_key:
             raise ValueError("Google AI API key not found. Please set GOOGLE_AI_API_KEY in your .env file")
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-flash-lite-latest')
+        # Responses go through the shared cache (see tools/llm_cache.py)
+        self.model = CachedModel(genai.GenerativeModel('gemini-flash-lite-latest'))
         
-    async def get_news_briefing(self, user_request: str) -> str:
+    async def get_news_briefing(self, user_request: str, location: str = None,
+                                intent: Optional[Intent] = None) -> str:
         """
         Enhanced news curation with robust fallback strategies.
         This agent understands context and filters content appropriately.
+        The extracted KEYWORDS and the optional location (e.g. a city) are sent
+        to the news providers as search terms.
+        Category, country, count and keywords come from `intent` (the master
+        agent's parse) or a local parse of the request; the AI extraction only
+        runs when the local parse is not confident.
         """
+        briefing, _ = await self.get_news_briefing_with_status(user_request, location=location, intent=intent)
+        return briefing
+    
+    async def get_news_briefing_with_status(self, user_request: str, location: str = None,
+                                            intent: Optional[Intent] = None) -> Tuple[str, bool]:
+        """(briefing, ok) - ok is False when no articles could be fetched and the reply only explains why"""
         # Let AI analyze what kind of news the user wants
         analysis_prompt = f"""
 Analyze this news request from the perspective of providing relevant and timely news for India: "{user_request}"
@@ -50,24 +67,34 @@ KEYWORDS: [keywords, if any, else "None"]
 """
         
         try:
-            # Get AI analysis
-            response = await self.model.generate_content_async(analysis_prompt)
-            analysis = response.text
-            
-            # Parse the analysis
-            category = self._extract_value(analysis, "CATEGORY:") or "general"
-            country = self._extract_value(analysis, "COUNTRY:")
-            # Handle unspecified or invalid country codes
-            if not country or country in ["unspecified", "unknown", "none"]:
-                country = "us"  # Default to US
-            count = int(self._extract_value(analysis, "COUNT:") or "5")
+            intent = intent or parse_intent(user_request)
+            if intent.needs_news and intent.confident():
+                category = intent.category
+                country = intent.country or DEFAULT_NEWS_COUNTRY
+                count = intent.count or 5
+                keywords = intent.keywords
+            else:
+                # Get AI analysis
+                response = await self.model.generate_content_async(analysis_prompt, kind="analysis")
+                analysis = response.text
+                
+                # Parse the analysis
+                category = self._extract_value(analysis, "CATEGORY:") or "general"
+                country = self._extract_value(analysis, "COUNTRY:")
+                # Handle unspecified or invalid country codes
+                if not country or country in ["unspecified", "unknown", "none"]:
+                    country = DEFAULT_NEWS_COUNTRY
+                count = int(self._extract_value(analysis, "COUNT:") or "5")
+                keywords = self._extract_keywords(analysis)
             
             # Fetch news data using enhanced tool with fallbacks
             news_data = await get_news_data(
                 query=category,  # Use category as query
                 category=category,
                 country=country,
-                max_articles=min(count, 10)  # Respect rate limits
+                max_articles=min(count, 10),  # Respect rate limits
+                keywords=keywords,
+                location=location
             )
             
             # Enhanced error handling
@@ -75,23 +102,27 @@ KEYWORDS: [keywords, if any, else "None"]
                 error_msg = news_data.get("error", "Unknown error occurred")
                 # Try to provide a fallback response based on the request
                 fallback_response = await self._generate_fallback_response(user_request, category, country)
-                return fallback_response
+                return fallback_response, False
             
             # Check if we have valid articles
             articles = news_data.get("articles", [])
             if not articles:
                 # Generate a meaningful response even without articles
                 fallback_response = await self._generate_fallback_response(user_request, category, country)
-                return fallback_response
+                return fallback_response, False
             
-            # Let AI create a curated briefing with enhanced context
-            articles_summary = self._format_articles_for_ai(articles)
+            # Only the most relevant articles (BM25 on category + keywords, freshness,
+            # source) go into the prompt
+            articles = rank_articles(articles, category, keywords, location, top_k=min(count, 10))
             
-            briefing_prompt = f"""
+            # Let AI create a curated briefing with enhanced context; the prompt is
+            # assembled within a token budget (lowest-ranked articles dropped first)
+            prompt = PromptBuilder("news_briefing")
+            prompt.add("""
 Create a professional news briefing based on these articles:
-
-{articles_summary}
-
+""")
+            prompt.add_articles(articles)
+            prompt.add(f"""
 User's original request: "{user_request}"
 Request Context: Category={category}, Country={country}
 
@@ -104,13 +135,14 @@ Guidelines:
 - End with key takeaways relevant to the user's location/interests
 
 Make it sound like a professional news briefing for {country.upper() if country else 'international'} audience.
-"""
+""")
+            briefing_prompt = prompt.build()
             
-            final_response = await self.model.generate_content_async(briefing_prompt)
-            return final_response.text
+            final_response = await self.model.generate_content_async(briefing_prompt, kind="narration")
+            return final_response.text, True
             
         except Exception as e:
-            return f"I encountered an error processing your news request: {str(e)}"
+            return f"I encountered an error processing your news request: {str(e)}", False
     
     async def _generate_fallback_response(self, user_request: str, category: str, country: str) -> str:
         """Generate a meaningful response when no news articles are available"""
@@ -128,11 +160,18 @@ Keep it concise and actionable.
 """
         
         try:
-            response = await self.model.generate_content_async(fallback_prompt)
+            response = await self.model.generate_content_async(fallback_prompt, kind="fallback")
             return response.text
         except Exception:
             return f"I apologize, but I'm currently unable to fetch news for {category} from {country}. This could be due to API limitations or regional availability. Please try again later or consider a broader search term."
     
+    def _extract_keywords(self, analysis: str) -> List[str]:
+        """KEYWORDS line of the analysis as a list (empty for "None")"""
+        keywords = self._extract_value(analysis, "KEYWORDS:").strip("[]")
+        if keywords.lower() in ("", "none"):
+            return []
+        return [k.strip() for k in keywords.split(",") if k.strip()]
+    
     def _extract_value(self, text: str, key: str) -> str:
         """Helper method to parse AI responses"""
         lines = text.split('\n')
@@ -140,24 +179,6 @@ Keep it concise and actionable.
             if line.strip().startswith(key):
                 return line.split(':', 1)[1].strip()
         return ""
-    
-    def _format_articles_for_ai(self, articles: List[Dict]) -> str:
-        """Format articles for AI processing - following content filtering best practices"""
-        formatted = []
-        for i, article in enumerate(articles, 1):
-            # Filter out articles with missing critical information
-            if not article.get('title') or not article.get('description'):
-                continue
-                
-            formatted.append(f"""
-Article {i}:
-Title: {article['title']}
-Source: {article['source']['name']}
-Description: {article['description']}
-Published: {article['publishedAt']}
-""")
-        
-        return "\n".join(formatted)
 
 # Test function following your testing best practices
 async def test_news_agent():
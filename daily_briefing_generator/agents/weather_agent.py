@@ -2,7 +2,7 @@
 import asyncio
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 import google.generativeai as genai
 
@@ -10,6 +10,8 @@ import google.generativeai as genai
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.weather_tool import get_weather_data
+from tools.intent import Intent, parse_intent
+from tools.llm_cache import CachedModel
 
 load_dotenv()
 
@@ -24,13 +26,22 @@ class WeatherAgent:
         if not api_key:
             raise ValueError("Google AI API key not found. Please set GOOGLE_AI_API_KEY in your .env file")
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-flash-lite-latest')
+        # Responses go through the shared cache (see tools/llm_cache.py)
+        self.model = CachedModel(genai.GenerativeModel('gemini-flash-lite-latest'))
         
-    async def get_weather_briefing(self, user_request: str) -> str:
+    async def get_weather_briefing(self, user_request: str, intent: Optional[Intent] = None) -> str:
         """
         This is where your agent becomes intelligent!
         It analyzes the user's request and decides how to respond.
+        The city comes from `intent` (the master agent's parse) or a local parse
+        of the request; the AI extraction only runs when neither names a city.
         """
+        briefing, _ = await self.get_weather_briefing_with_status(user_request, intent=intent)
+        return briefing
+    
+    async def get_weather_briefing_with_status(self, user_request: str,
+                                               intent: Optional[Intent] = None) -> Tuple[str, bool]:
+        """(briefing, ok) - ok is False when the reply explains why there is no weather data"""
         # First, let the AI understand what the user wants
         analysis_prompt = f"""
         Analyze this weather request: "{user_request}"
@@ -47,22 +58,26 @@ class WeatherAgent:
         """
         
         try:
-            # Get AI analysis
-            response = await self.model.generate_content_async(analysis_prompt)
-            analysis = response.text
-            
-            # Parse the AI's analysis
-            city = self._extract_value(analysis, "CITY:")
-            country = self._extract_value(analysis, "COUNTRY:")
+            intent = intent or parse_intent(user_request)
+            if intent.city and intent.confident():
+                city, country = intent.city, (intent.country or "").upper()
+            else:
+                # Get AI analysis
+                response = await self.model.generate_content_async(analysis_prompt, kind="analysis")
+                analysis = response.text
+                
+                # Parse the AI's analysis
+                city = self._extract_value(analysis, "CITY:")
+                country = self._extract_value(analysis, "COUNTRY:")
             
             if not city:
-                return "I couldn't identify which city you're asking about. Could you please specify?"
+                return "I couldn't identify which city you're asking about. Could you please specify?", False
             
             # Fetch real weather data using your tool
             weather_data = await get_weather_data(city, country or "US")
             
             if "error" in weather_data:
-                return f"Sorry, I couldn't get weather data: {weather_data['error']}"
+                return f"Sorry, I couldn't get weather data: {weather_data['error']}", False
             
             # Let AI create a natural response
             briefing_prompt = f"""
@@ -80,11 +95,11 @@ class WeatherAgent:
             Make it conversational and helpful, addressing their specific request.
             """
             
-            final_response = await self.model.generate_content_async(briefing_prompt)
-            return final_response.text
+            final_response = await self.model.generate_content_async(briefing_prompt, kind="narration")
+            return final_response.text, True
             
         except Exception as e:
-            return f"I encountered an error processing your request: {str(e)}"
+            return f"I encountered an error processing your request: {str(e)}", False
     
     def _extract_value(self, text: str, key: str) -> str:
         """Helper method to parse AI responses"""
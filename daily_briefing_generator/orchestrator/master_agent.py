@@ -2,7 +2,7 @@ import asyncio
 import os
 import sys
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
 import google.generativeai as genai
 
@@ -18,6 +18,37 @@ load_dotenv(os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
 
 from agents.weather_agent import WeatherAgent
 from agents.news_agent import NewsAgent
+from tools.prompt_builder import PromptBuilder
+from tools.intent import DEFAULT_NEWS_COUNTRY, Intent, parse_intent
+from tools.weather_tool import get_weather_data
+from tools.news_tool import get_news_data
+from tools.llm_cache import CachedModel
+from tools.prompts import system_instruction
+from tools.semantic_cache import get_semantic_cache
+
+# Orchestration modes: sub-agents analyze and narrate their own data, or the master's plan
+# goes straight to the data tools and one synthesis call writes the whole briefing
+MODE_AGENTS = "agents"
+MODE_SINGLE_PASS = "single_pass"
+ORCHESTRATION_MODES = (MODE_AGENTS, MODE_SINGLE_PASS)
+
+# Start of the reply when a briefing could not be prepared
+ERROR_REPLY = "I encountered an error while preparing your briefing"
+
+MODEL_NAME = "gemini-flash-lite-latest"
+
+
+def _create_model(call_type: Optional[str] = None) -> CachedModel:
+    """Model for a call type, carrying that call type's static instructions (see tools/prompts.py)"""
+    if call_type is None:
+        return CachedModel(genai.GenerativeModel(MODEL_NAME))
+    system = system_instruction(call_type)
+    try:
+        return CachedModel(genai.GenerativeModel(MODEL_NAME, system_instruction=system))
+    except TypeError:
+        # google-generativeai < 0.5 has no system instructions: send them with every prompt
+        return CachedModel(genai.GenerativeModel(MODEL_NAME), preamble=system)
+
 
 class MasterAgent:
     """DAILY BRIEFING MASTER - Elite orchestration agent for comprehensive briefings"""
@@ -30,93 +61,12 @@ class MasterAgent:
             raise ValueError("Google AI API key not found. Please set GOOGLE_AI_API_KEY in your .env file")
         genai.configure(api_key=api_key)
         
-        # Initialize with optimized system instructions
-        self.system_instructions = """You are the DAILY BRIEFING MASTER - an elite orchestration agent that coordinates specialized sub-agents to deliver comprehensive, professional daily briefings.
-
-## YOUR CORE MISSION
-Transform user requests into perfectly coordinated briefings by intelligently delegating to your specialized team:
-- 🌤️ WEATHER AGENT: Real-time weather data for any city worldwide
-- 📰 NEWS AGENT: Curated news across technology, business, sports, health categories
-
-## DELEGATION EXAMPLES
-USER: "Morning briefing for Mumbai with tech news"
-→ DELEGATE: Weather Agent (city: "Mumbai") + News Agent (category: "technology")
-→ SYNTHESIZE: Professional briefing combining both responses
-
-USER: "What's the weather in London?"  
-→ DELEGATE: Weather Agent only (city: "London")
-→ RESPONSE: Direct weather information
-
-USER: "Business news updates"
-→ DELEGATE: News Agent only (category: "business") 
-→ RESPONSE: Curated business news briefing
-
-## SYNTHESIS REQUIREMENTS
-1. **Natural Flow**: Create seamless transitions between weather and news sections
-2. **Professional Tone**: Executive-level briefing quality
-3. **Contextual Relevance**: Connect weather to daily planning, news to business impact
-4. **Clear Structure**: Use headers and bullets for easy scanning
-
-## RESPONSE FORMAT CONSTRAINT
-Your response must contain exactly three sections with the headers:
-- ## Weather & Environment
-- ## News & Updates
-- ## Insights & Analysis
-
-CRITICAL RULES:
-❌ NO additional sections (no "OPENING", no "CLOSING", no "EXECUTIVE SUMMARY")
-❌ NO forward-looking statements or tomorrow's outlook
-❌ NO closing remarks or conclusions
-❌ NO section numbering (1, 2, 3, 4, etc.)
-✅ ONLY the three required sections listed above
-✅ Use proper markdown headers (## Header Name)
-✅ Keep content factual and based solely on data provided by your Weather and News sub-agents
-
-## STRICT CONSTRAINTS
-❌ NEVER provide weather/news data directly - always delegate to sub-agents
-❌ NEVER make assumptions about user location without explicit mention
-❌ NEVER include more than 5 news articles per category to maintain focus
-✅ ALWAYS explain your delegation strategy before calling sub-agents
-✅ ALWAYS synthesize responses into cohesive narratives
-✅ ALWAYS end with actionable insights or recommendations
-
-## ADVANCED SYNTHESIS PATTERNS
-
-### EXECUTIVE BRIEFING STRUCTURE
-1. **WEATHER & ENVIRONMENT**: Weather-driven day planning insight
-2. **NEWS & UPDATES**: Category-organized updates 
-3. **INSIGHTS & ANALYSIS**: Weather + news correlation for decision making
-
-### NATURAL TRANSITIONS
-Weather → News: "With [weather condition] expected, here's what's happening in [news category]..."
-News → Weather: "Given these [industry] developments, today's [weather] conditions suggest..."
-Multiple Topics: "While [weather insight], the [news category] landscape shows..."
-
-### PROFESSIONAL LANGUAGE PATTERNS
-- Use executive vocabulary: "market dynamics," "strategic implications," "operational considerations"
-- Quantify when possible: "temperatures reaching X°C," "Y new developments," "Z% increase"
-- Time-sensitive framing: "This morning's conditions," "Today's key developments," "This week's trends"
-
-## ERROR HANDLING PROTOCOLS
-When sub-agents fail:
-1. **GRACEFUL DEGRADATION**: Provide partial briefings if one service fails
-2. **TRANSPARENT COMMUNICATION**: Inform users about service limitations
-3. **ALTERNATIVE SOLUTIONS**: Suggest retry timing or alternative approaches
-
-## RECOVERY PATTERNS
-❌ Weather Agent Fails → Focus on news + apologize for weather unavailability
-❌ News Agent Fails → Provide weather + suggest checking news sources directly  
-❌ Both Fail → Provide system status + estimated recovery time
-✅ Partial Success → Highlight available information + note limitations
-
-## RESPONSE STRUCTURE WITH ERRORS
-"I apologize, but [specific service] is currently experiencing issues. Here's what I can provide:
-[Available information]
-Please try again in a few minutes for complete briefing coverage."
-
-ALWAYS maintain professional tone even during service disruptions."""
-        
-        self.model = genai.GenerativeModel('gemini-flash-lite-latest')
+        # Static instructions are defined once in tools/prompts.py and sent as each model's
+        # system instruction; per-call prompts only carry the request and its data.
+        # Responses go through the shared cache (see tools/llm_cache.py)
+        self.model = _create_model()
+        self.analysis_model = _create_model("analysis")
+        self.synthesis_model = _create_model("synthesis")
         
         # Initialize specialized agents
         self.weather_agent = WeatherAgent()
@@ -125,6 +75,9 @@ ALWAYS maintain professional tone even during service disruptions."""
         # Error recovery configuration
         self.max_retries = 3
         self.timeout_seconds = 30
+        
+        # Token budget for each sub-agent output quoted in the synthesis prompt
+        self.source_token_budget = int(os.getenv("PROMPT_SOURCE_TOKENS", "1000"))
         self.fallback_responses = {
             "weather": "Weather information temporarily unavailable. Please try again later.",
             "news": "News updates temporarily unavailable. Please try again later.",
@@ -133,51 +86,26 @@ ALWAYS maintain professional tone even during service disruptions."""
     
     async def process_request(self, user_request: str) -> str:
         """Main orchestration method with optimized delegation strategy"""
-        
-        # Enhanced analysis prompt using the system instructions
-        analysis_prompt = f"""
-        {self.system_instructions}
-        
-        ANALYZE THIS REQUEST: "{user_request}"
-        
-        Step 1: LOCATION DETECTION
-        Extract the EXACT location mentioned by the user (city, state, country). If a specific location is mentioned, ALL information (weather AND news) should be focused on that location and its immediate region.
-        
-        Step 2: DELEGATION STRATEGY
-        Determine which agents to call:
-        
-        LOCATION PRIORITY RULES:
-        - If user mentions "Delhi", focus ONLY on Delhi weather and India/Delhi-specific news
-        - If user mentions "Mumbai", focus ONLY on Mumbai weather and India/Mumbai-specific news  
-        - If user mentions "New York", focus ONLY on New York weather and US/New York-specific news
-        - If user mentions "London", focus ONLY on London weather and UK/London-specific news
-        - If NO specific location mentioned, use default location preferences
-        
-        Step 3: RESPOND IN THIS EXACT FORMAT:
-        NEEDS_WEATHER: yes/no
-        WEATHER_LOCATION: [EXACT city name if mentioned, otherwise "default"]
-        LOCATION_COUNTRY: [country code - in for India, us for USA, uk for UK, etc.]
-        NEEDS_NEWS: yes/no
-        NEWS_CATEGORIES: [categories mentioned, otherwise "general"]
-        NEWS_LOCATION_FOCUS: [same location as weather for geo-specific news]
-        DELEGATION_EXPLANATION: [brief explanation of your strategy]
-        """
-        
+        briefing, _ = await self._process_request(user_request)
+        return briefing
+    
+    async def _process_request(self, user_request: str) -> Tuple[str, bool]:
+        """process_request as (briefing, complete); complete is False when a sub-agent failed"""
         try:
-            # Get AI analysis of the request
-            response = await self.model.generate_content_async(analysis_prompt)
-            analysis = response.text
+            # Analyze the request locally, asking the AI only when the parse is unsure
+            analysis, intent = await self._analyze_request(user_request)
             
             # Parse the analysis
-            needs_weather = self._extract_value(analysis, "NEEDS_WEATHER:").lower() == "yes"
-            weather_location = self._extract_value(analysis, "WEATHER_LOCATION:")
-            location_country = self._extract_value(analysis, "LOCATION_COUNTRY:")
-            needs_news = self._extract_value(analysis, "NEEDS_NEWS:").lower() == "yes"
-            news_categories = self._extract_value(analysis, "NEWS_CATEGORIES:")
-            news_location_focus = self._extract_value(analysis, "NEWS_LOCATION_FOCUS:")
+            needs_weather = analysis["NEEDS_WEATHER"].lower() == "yes"
+            weather_location = analysis["WEATHER_LOCATION"]
+            location_country = analysis["LOCATION_COUNTRY"]
+            needs_news = analysis["NEEDS_NEWS"].lower() == "yes"
+            news_categories = analysis["NEWS_CATEGORIES"]
+            news_location_focus = analysis["NEWS_LOCATION_FOCUS"]
             
             # Collect responses from agents
             responses = []
+            complete = True
             
             # Prepare tasks for parallel execution
             weather_task = None
@@ -188,7 +116,7 @@ ALWAYS maintain professional tone even during service disruptions."""
                     weather_request = f"What's the weather like in {weather_location}?"
                 else:
                     weather_request = "What's the weather like?"
-                weather_task = self.weather_agent.get_weather_briefing(weather_request)
+                weather_task = self.weather_agent.get_weather_briefing_with_status(weather_request, intent=intent)
             
             if needs_news:
                 # Create location-aware news request
@@ -200,7 +128,9 @@ ALWAYS maintain professional tone even during service disruptions."""
                         news_request = f"Give me today's top news from {news_location_focus} and surrounding region"
                 elif news_categories and news_categories != "general":
                     news_request = f"Give me {news_categories} news"
-                news_task = self.news_agent.get_news_briefing(news_request)
+                news_location = news_location_focus if news_location_focus and news_location_focus != "default" else None
+                news_task = self.news_agent.get_news_briefing_with_status(news_request, location=news_location,
+                                                                          intent=intent)
             
             # Execute tasks in parallel
             # We use return_exceptions=True to ensure one failure doesn't crash the other
@@ -217,111 +147,174 @@ ALWAYS maintain professional tone even during service disruptions."""
                 if isinstance(weather_result, Exception):
                     logger.error(f"Weather agent parallel execution failed: {weather_result}")
                     responses.append(f"🌤️ **Weather Update:**\n⚠️ Weather data currently unavailable.")
+                    complete = False
                 else:
-                    responses.append(f"🌤️ **Weather Update:**\n{weather_result}")
+                    weather_text, weather_ok = weather_result
+                    responses.append(f"🌤️ **Weather Update:**\n{weather_text}")
+                    complete = complete and weather_ok
             
             # Process News Result
             if news_task:
                 if isinstance(news_result, Exception):
                     logger.error(f"News agent parallel execution failed: {news_result}")
                     responses.append(f"📰 **News Update:**\n⚠️ News updates currently unavailable.")
+                    complete = False
                 else:
-                    responses.append(f"📰 **News Update:**\n{news_result}")
+                    news_text, news_ok = news_result
+                    responses.append(f"📰 **News Update:**\n{news_text}")
+                    complete = complete and news_ok
             
             if not responses:
-                return "I'm not sure what kind of briefing you need. Could you please specify if you want weather, news, or both?"
+                return "I'm not sure what kind of briefing you need. Could you please specify if you want weather, news, or both?", False
             
-            # Combine responses into a cohesive briefing
-            combined_content = "\n\n".join(responses)
+            # Use AI to create a final polished briefing with enhanced synthesis; each
+            # sub-agent output is cleaned and cut to its token budget
+            prompt = PromptBuilder("master_synthesis", system=system_instruction("synthesis"))
+            prompt.add("SOURCE DATA:")
+            for i, agent_response in enumerate(responses, 1):
+                prompt.add(agent_response + "\n", budget=self.source_token_budget, name=f"source_{i}")
+            prompt.add(self._synthesis_instructions(user_request, weather_location, location_country))
+            synthesis_prompt = prompt.build()
+            logger.info(f"Synthesis prompt: ~{prompt.report()['total']['tokens']} tokens")
             
-            # Use AI to create a final polished briefing with enhanced synthesis
-            synthesis_prompt = f"""
-            You are creating a professional daily briefing. You MUST follow this EXACT format.
+            final_response = await self.synthesis_model.generate_content_async(synthesis_prompt, kind="synthesis")
+            return final_response.text, complete
             
-            SOURCE DATA:
-            {combined_content}
+        except Exception as e:
+            logger.error(f"Error processing request '{user_request}': {str(e)}")
+            return f"{ERROR_REPLY}: {str(e)}", False
+    
+    async def process_request_single_pass(self, user_request: str) -> str:
+        """
+        Single-pass orchestration: the request analysis (local, or one AI call) is
+        passed straight to get_weather_data / get_news_data, and the raw results go
+        to one synthesis call. Skips the sub-agents' own analysis and narration
+        calls, so a complete briefing takes one or two model calls instead of six.
+        """
+        briefing, _ = await self._process_request_single_pass(user_request)
+        return briefing
+    
+    async def _process_request_single_pass(self, user_request: str) -> Tuple[str, bool]:
+        """process_request_single_pass as (briefing, complete); complete is False when a data tool failed"""
+        try:
+            analysis, intent = await self._analyze_request(user_request)
+            
+            needs_weather = analysis["NEEDS_WEATHER"].lower() == "yes"
+            weather_location = analysis["WEATHER_LOCATION"]
+            location_country = analysis["LOCATION_COUNTRY"]
+            needs_news = analysis["NEEDS_NEWS"].lower() == "yes"
+            news_location_focus = analysis["NEWS_LOCATION_FOCUS"]
+            if not (needs_weather or needs_news):
+                return "I'm not sure what kind of briefing you need. Could you please specify if you want weather, news, or both?", False
+            
+            # Country codes as the data tools expect them (the AI answers "uk" for the UK)
+            country = location_country.strip().lower()
+            country = "gb" if country == "uk" else country
+            category = intent.category if intent else self._first_category(analysis["NEWS_CATEGORIES"])
+            
+            has_city = bool(weather_location) and weather_location != "default"
+            weather_task = get_weather_data(weather_location, country.upper() or "US") if needs_weather and has_city else None
+            news_task = get_news_data(
+                query=category,
+                category=category,
+                country=country or DEFAULT_NEWS_COUNTRY,
+                max_articles=min(intent.count or 5, 10) if intent else 5,
+                keywords=intent.keywords if intent else None,
+                location=news_location_focus if news_location_focus and news_location_focus != "default" else None
+            ) if needs_news else None
+            
+            weather_result, news_result = await asyncio.gather(
+                weather_task if weather_task else asyncio.sleep(0),
+                news_task if news_task else asyncio.sleep(0),
+                return_exceptions=True
+            )
             
+            # One synthesis prompt over the raw data, within the same token budgets
+            prompt = PromptBuilder("single_pass_synthesis", system=system_instruction("synthesis"))
+            prompt.add("SOURCE DATA:")
+            complete = True
+            if needs_weather:
+                if not has_city:
+                    weather_text = "⚠️ No city specified, so weather data was not fetched."
+                elif isinstance(weather_result, Exception) or "error" in weather_result:
+                    logger.error(f"Weather data failed: {weather_result if isinstance(weather_result, Exception) else weather_result['error']}")
+                    weather_text = "⚠️ Weather data currently unavailable."
+                    complete = False
+                else:
+                    weather_text = self._format_weather(weather_result)
+                prompt.add(f"🌤️ **Weather Data:**\n{weather_text}\n")
+            if needs_news:
+                if isinstance(news_result, Exception):
+                    logger.error(f"News data failed: {news_result}")
+                    articles = []
+                else:
+                    articles = news_result.get("articles", [])
+                prompt.add(f"📰 **News Articles** (category: {category}):")
+                if articles:
+                    prompt.add_articles(articles, budget=self.source_token_budget)
+                else:
+                    prompt.add("⚠️ News updates currently unavailable.\n")
+                    complete = False
+            prompt.add(self._synthesis_instructions(user_request, weather_location, location_country))
+            synthesis_prompt = prompt.build()
+            logger.info(f"Single-pass synthesis prompt: ~{prompt.report()['total']['tokens']} tokens")
+            
+            final_response = await self.synthesis_model.generate_content_async(synthesis_prompt, kind="synthesis")
+            return final_response.text, complete
+            
+        except Exception as e:
+            logger.error(f"Error processing single-pass request '{user_request}': {str(e)}")
+            return f"{ERROR_REPLY}: {str(e)}", False
+    
+    def _first_category(self, categories: str) -> str:
+        """First category of an AI NEWS_CATEGORIES answer ("general" if none)"""
+        first = categories.strip("[]").split(",")[0].strip().strip('"\'').lower()
+        return first or "general"
+    
+    def _format_weather(self, weather_data: Dict[str, Any]) -> str:
+        """Raw weather observation as prompt lines"""
+        return (
+            f"City: {weather_data['name']}, {weather_data['sys']['country']}\n"
+            f"Temperature: {weather_data['main']['temp']}°C\n"
+            f"Feels like: {weather_data['main']['feels_like']}°C\n"
+            f"Weather: {weather_data['weather'][0]['description']}\n"
+            f"Humidity: {weather_data['main']['humidity']}%\n"
+            f"Wind: {weather_data['wind']['speed']} m/s"
+        )
+    
+    def _analysis_prompt(self, user_request: str) -> str:
+        """Request analysis prompt; the steps and answer format are in the analysis system instruction"""
+        return PromptBuilder("master_analysis", system=system_instruction("analysis")).add(
+            f'ANALYZE THIS REQUEST: "{user_request}"').build()
+    
+    def _synthesis_instructions(self, user_request: str, weather_location: str, location_country: str) -> str:
+        """Location context that follows the source data; the format rules are in the synthesis system instruction"""
+        return f"""
             LOCATION CONTEXT: 
             User Request: "{user_request}"
             Target Location: {weather_location if weather_location != "default" else "General"}
             Location Country: {location_country if location_country else "Multiple"}
             
-            CRITICAL LOCATION RULE: 
-            If a specific location was mentioned (like Delhi, Mumbai, New York, etc.), ALL content must be geo-focused on that location and its immediate region. Do not mix global news with local weather - keep everything location-consistent.
-            
-            CRITICAL: Your response must have EXACTLY these three sections in this EXACT order:
-            
-            ## Weather & Environment
-            [Write weather content here - if location specified, focus ONLY on that location]
-            
-            ## News & Updates  
-            [Write news content here - if location specified, prioritize news from that region/country]
-            
-            ## Insights & Analysis
-            [Write location-specific insights combining weather + regional news - if location specified, give advice relevant to that specific place]
-            
-            STOP IMMEDIATELY after the Insights & Analysis section.
-            
-            FORBIDDEN ELEMENTS (DO NOT INCLUDE):
-            ❌ NO "CLOSING" section
-            ❌ NO "CONCLUSION" section  
-            ❌ NO "OUTLOOK" section
-            ❌ NO "SUMMARY" section
-            ❌ NO "TOMORROW" references
-            ❌ NO "LOOKING AHEAD" statements
-            ❌ NO section numbers (1, 2, 3, etc.)
-            ❌ NO **bold** formatting for headers - use ## markdown only
-            
-            REQUIRED FORMAT:
-            ✅ Use ## for headers (not **bold**)
-            ✅ Three sections only
-            ✅ Stop after Actionable Insights
-            ✅ Present tense content only
-            ✅ Executive-level language
-            
-            CONTENT GUIDELINES:
-            - Weather & Environment: Include temperature, conditions, and business/travel implications
-            - News & Updates: Summarize key developments with business relevance
-            - Insights & Analysis: Provide specific recommendations based on weather + news correlation
-            
-            Remember: EXACTLY three sections, proper ## headers, stop after Insights & Analysis.
-            
-            ## NATURAL TRANSITIONS
-            Weather → News: "With [weather condition] expected, here's what's happening in [news category]..."
-            News → Weather: "Given these [industry] developments, today's [weather] conditions suggest..."
-            Multiple Topics: "While [weather insight], the [news category] landscape shows..."
-            
-            ## PROFESSIONAL LANGUAGE PATTERNS
-            - Use executive vocabulary: "market dynamics," "strategic implications," "operational considerations"
-            - Quantify when possible: "temperatures reaching X°C," "Y new developments," "Z% increase"
-            - Time-sensitive framing: "This morning's conditions," "Today's key developments," "This week's trends"
-            
-            ## ERROR HANDLING PROTOCOLS
-            When sub-agents fail:
-            1. **GRACEFUL DEGRADATION**: Provide partial briefings if one service fails
-            2. **TRANSPARENT COMMUNICATION**: Inform users about service limitations
-            3. **ALTERNATIVE SOLUTIONS**: Suggest retry timing or alternative approaches
-            
-            ## RECOVERY PATTERNS
-            ❌ Weather Agent Fails → Focus on news + apologize for weather unavailability
-            ❌ News Agent Fails → Provide weather + suggest checking news sources directly  
-            ❌ Both Fail → Provide system status + estimated recovery time
-            ✅ Partial Success → Highlight available information + note limitations
-            
-            ## RESPONSE STRUCTURE WITH ERRORS
-            "I apologize, but [specific service] is currently experiencing issues. Here's what I can provide:
-            [Available information]
-            Please try again in a few minutes for complete briefing coverage."
-            
-            Make it feel like a single, unified executive briefing with natural flow and actionable insights.
+            Write the briefing now: EXACTLY three sections, proper ## headers, stop after Insights & Analysis.
             """
-            
-            final_response = await self.model.generate_content_async(synthesis_prompt)
-            return final_response.text
-            
-        except Exception as e:
-            logger.error(f"Error processing request '{user_request}': {str(e)}")
-            return f"I encountered an error while preparing your briefing: {str(e)}"
+    
+    async def _analyze_request(self, user_request: str) -> Tuple[Dict[str, str], Optional[Intent]]:
+        """
+        Analysis fields (NEEDS_WEATHER, WEATHER_LOCATION, ...) for a request and the
+        local Intent they came from. Common phrasings are parsed locally; the AI
+        analysis round-trip only runs when the local parse is not confident, in
+        which case the Intent is None and the sub-agents do their own extraction.
+        """
+        intent = parse_intent(user_request)
+        if intent.confident():
+            logger.info(f"Request analyzed locally: {intent}")
+            return intent.analysis_fields(), intent
+        
+        logger.info(f"Local analysis not confident ({intent.confidence:.2f}), asking the model")
+        response = await self.analysis_model.generate_content_async(self._analysis_prompt(user_request), kind="analysis")
+        keys = ("NEEDS_WEATHER", "WEATHER_LOCATION", "LOCATION_COUNTRY", "NEEDS_NEWS",
+                "NEWS_CATEGORIES", "NEWS_LOCATION_FOCUS")
+        return {key: self._extract_value(response.text, f"{key}:") for key in keys}, None
     
     def _extract_value(self, text: str, key: str) -> str:
         """Helper method to parse AI responses"""
@@ -439,18 +432,38 @@ ALWAYS maintain professional tone even during service disruptions."""
         
         print(f"\n🛡️ Error recovery testing completed!")
 
-    async def run_with_recovery(self, user_request: str) -> str:
-        """Main execution with comprehensive error recovery"""
-        logger.info(f"Processing request: {user_request}")
+    async def run_with_recovery(self, user_request: str, mode: str = MODE_AGENTS) -> str:
+        """
+        Main execution with comprehensive error recovery.
+        mode="agents" delegates to the weather/news sub-agents; mode="single_pass"
+        uses process_request_single_pass. Fresh briefings are reused for the same
+        and paraphrased requests (see tools/semantic_cache.py).
+        """
+        if mode not in ORCHESTRATION_MODES:
+            raise ValueError(f"Unknown orchestration mode '{mode}' (expected one of {ORCHESTRATION_MODES})")
+        process = self._process_request_single_pass if mode == MODE_SINGLE_PASS else self._process_request
+        logger.info(f"Processing request ({mode}): {user_request}")
+        
+        # A fresh briefing for the same plan, possibly asked for in other words
+        semantic_cache = get_semantic_cache()
+        cached = semantic_cache.lookup(user_request, mode)
+        if cached is not None:
+            response, cached_request, similarity = cached
+            logger.info(f"Serving cached briefing for '{cached_request}' (similarity {similarity:.2f})")
+            return response
         
         for attempt in range(self.max_retries):
             try:
                 # Attempt normal execution with timeout
-                response = await asyncio.wait_for(
-                    self.process_request(user_request), 
+                response, complete = await asyncio.wait_for(
+                    process(user_request), 
                     timeout=self.timeout_seconds
                 )
                 logger.info(f"Request successful on attempt {attempt + 1}")
+                # Only briefings built from every sub-agent's data are reused; a degraded one
+                # ("weather data currently unavailable") would outlive the outage
+                if complete:
+                    semantic_cache.store(user_request, mode, response)
                 return response
                 
             except asyncio.TimeoutError:
@@ -471,35 +484,22 @@ ALWAYS maintain professional tone even during service disruptions."""
 
     async def process_request_with_agent_recovery(self, user_request: str) -> str:
         """Enhanced process_request with individual agent error handling"""
+        briefing, _ = await self._process_request_with_agent_recovery(user_request)
+        return briefing
+    
+    async def _process_request_with_agent_recovery(self, user_request: str) -> Tuple[str, bool]:
+        """process_request_with_agent_recovery as (briefing, complete); complete is False when a service failed"""
         logger.info(f"Processing request with agent recovery: {user_request}")
         
-        # Enhanced analysis prompt using the system instructions
-        analysis_prompt = f"""
-        {self.system_instructions}
-        
-        ANALYZE THIS REQUEST: "{user_request}"
-        
-        Step 1: DELEGATION STRATEGY
-        Determine which agents to call:
-        
-        Step 2: RESPOND IN THIS EXACT FORMAT:
-        NEEDS_WEATHER: yes/no
-        WEATHER_LOCATION: [city name if mentioned, otherwise "default"]
-        NEEDS_NEWS: yes/no
-        NEWS_CATEGORIES: [categories mentioned, otherwise "general"]
-        DELEGATION_EXPLANATION: [brief explanation of your strategy]
-        """
-        
         try:
-            # Get AI analysis of the request
-            response = await self.model.generate_content_async(analysis_prompt)
-            analysis = response.text
+            # Analyze the request locally, asking the AI only when the parse is unsure
+            analysis, intent = await self._analyze_request(user_request)
             
             # Parse the analysis
-            needs_weather = self._extract_value(analysis, "NEEDS_WEATHER:").lower() == "yes"
-            weather_location = self._extract_value(analysis, "WEATHER_LOCATION:")
-            needs_news = self._extract_value(analysis, "NEEDS_NEWS:").lower() == "yes"
-            news_categories = self._extract_value(analysis, "NEWS_CATEGORIES:")
+            needs_weather = analysis["NEEDS_WEATHER"].lower() == "yes"
+            weather_location = analysis["WEATHER_LOCATION"]
+            needs_news = analysis["NEEDS_NEWS"].lower() == "yes"
+            news_categories = analysis["NEWS_CATEGORIES"]
             
             # Collect responses from agents with individual error handling
             responses = []
@@ -513,12 +513,15 @@ ALWAYS maintain professional tone even during service disruptions."""
                     else:
                         weather_request = "What's the weather like?"
                     
-                    weather_response = await asyncio.wait_for(
-                        self.weather_agent.get_weather_briefing(weather_request),
+                    weather_response, weather_ok = await asyncio.wait_for(
+                        self.weather_agent.get_weather_briefing_with_status(weather_request, intent=intent),
                         timeout=15
                     )
                     responses.append(f"🌤️ **Weather Update:**\n{weather_response}")
-                    logger.info("Weather agent successful")
+                    if weather_ok:
+                        logger.info("Weather agent successful")
+                    else:
+                        failed_services.append("weather")
                     
                 except Exception as e:
                     logger.error(f"Weather agent failed: {str(e)}")
@@ -533,12 +536,15 @@ ALWAYS maintain professional tone even during service disruptions."""
                     else:
                         news_request = "Give me today's top news"
                     
-                    news_response = await asyncio.wait_for(
-                        self.news_agent.get_news_briefing(news_request),
+                    news_response, news_ok = await asyncio.wait_for(
+                        self.news_agent.get_news_briefing_with_status(news_request, intent=intent),
                         timeout=15
                     )
                     responses.append(f"📰 **News Update:**\n{news_response}")
-                    logger.info("News agent successful")
+                    if news_ok:
+                        logger.info("News agent successful")
+                    else:
+                        failed_services.append("news")
                     
                 except Exception as e:
                     logger.error(f"News agent failed: {str(e)}")
@@ -546,69 +552,30 @@ ALWAYS maintain professional tone even during service disruptions."""
                     responses.append(f"📰 **News Update:**\n⚠️ {self.fallback_responses['news']}")
             
             if not responses:
-                return "I'm not sure what kind of briefing you need. Could you please specify if you want weather, news, or both?"
+                return "I'm not sure what kind of briefing you need. Could you please specify if you want weather, news, or both?", False
             
-            # Combine responses into a cohesive briefing
-            combined_content = "\n\n".join(responses)
+            # Use AI to create a final polished briefing with enhanced synthesis; each
+            # sub-agent output is cleaned and cut to its token budget
+            prompt = PromptBuilder("master_synthesis", system=system_instruction("synthesis"))
+            prompt.add("SOURCE DATA:")
+            for i, agent_response in enumerate(responses, 1):
+                prompt.add(agent_response + "\n", budget=self.source_token_budget, name=f"source_{i}")
             
             # Add service status note if there were failures
             if failed_services:
-                service_note = f"\n\n📋 **Service Status**: {', '.join(failed_services).title()} service(s) temporarily unavailable. Please try again in a few minutes for complete coverage."
-                combined_content += service_note
-            
-            # Use AI to create a final polished briefing with enhanced synthesis
-            synthesis_prompt = f"""
-            You are creating a professional daily briefing. You MUST follow this EXACT format.
-            
-            SOURCE DATA:
-            {combined_content}
-            
-            CRITICAL: Your response must have EXACTLY these three sections in this EXACT order:
-            
-            ## Weather & Environment
-            [Write weather content here]
+                service_note = f"📋 **Service Status**: {', '.join(failed_services).title()} service(s) temporarily unavailable. Please try again in a few minutes for complete coverage."
+                prompt.add(service_note)
+                prompt.add("Note: Some services were unavailable, so focus on available information and maintain professional tone.")
+            prompt.add(self._synthesis_instructions(user_request, weather_location, analysis["LOCATION_COUNTRY"]))
+            synthesis_prompt = prompt.build()
+            logger.info(f"Synthesis prompt: ~{prompt.report()['total']['tokens']} tokens")
             
-            ## News & Updates
-            [Write news content here]
-            
-            ## Insights & Analysis
-            [Write insights content here]
-            
-            STOP IMMEDIATELY after the Insights & Analysis section.
-            
-            FORBIDDEN ELEMENTS (DO NOT INCLUDE):
-            ❌ NO "CLOSING" section
-            ❌ NO "CONCLUSION" section  
-            ❌ NO "OUTLOOK" section
-            ❌ NO "SUMMARY" section
-            ❌ NO "TOMORROW" references
-            ❌ NO "LOOKING AHEAD" statements
-            ❌ NO section numbers (1, 2, 3, etc.)
-            ❌ NO **bold** formatting for headers - use ## markdown only
-            
-            REQUIRED FORMAT:
-            ✅ Use ## for headers (not **bold**)
-            ✅ Three sections only
-            ✅ Stop after Actionable Insights
-            ✅ Present tense content only
-            ✅ Executive-level language
-            
-            CONTENT GUIDELINES:
-            - Weather & Environment: Include temperature, conditions, and business/travel implications
-            - News & Updates: Summarize key developments with business relevance
-            - Insights & Analysis: Provide specific recommendations based on weather + news correlation
-            
-            {"Note: Some services were unavailable, so focus on available information and maintain professional tone." if failed_services else ""}
-            
-            Remember: EXACTLY three sections, proper ## headers, stop after Insights & Analysis.
-            """
-            
-            final_response = await self.model.generate_content_async(synthesis_prompt)
-            return final_response.text
+            final_response = await self.synthesis_model.generate_content_async(synthesis_prompt, kind="synthesis")
+            return final_response.text, not failed_services
             
         except Exception as e:
             logger.error(f"Critical error in process_request_with_agent_recovery: {str(e)}")
-            return f"I encountered an error while preparing your briefing: {str(e)}"
+            return f"{ERROR_REPLY}: {str(e)}", False
 
     def _get_timeout_fallback(self, request: str) -> str:
         """Provide fallback response for timeout scenarios"""
@@ -731,7 +698,7 @@ I encountered an issue while processing your daily briefing request.
             [One bold recommendation based on the combined data]
             """
             
-            final_response = await self.model.generate_content_async(synthesis_prompt)
+            final_response = await self.model.generate_content_async(synthesis_prompt, kind="synthesis")
             return final_response.text
             
         except Exception as e:
@@ -0,0 +1,26 @@
+# tests/conftest.py - Shared fixtures for the offline unit tests (no API keys or network needed)
+import os
+import sys
+
+import pytest
+
+# Tests import the app's modules the way the app does ("from tools.x import y")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    """Stand-in for time.time / time.monotonic that only moves when told to"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
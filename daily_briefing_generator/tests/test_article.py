@@ -0,0 +1,53 @@
+# tests/test_article.py - The compact article record and the dicts handed out of the tool layer
+import asyncio
+import json
+
+from tools import news_tool
+from tools.article import Article, as_dicts
+from tools.timestamps import stamp_articles
+
+
+def make_article():
+    return Article(title="Startup raises funds", description="Series A", url="https://example.com/a",
+                   published_at="2024-05-01T10:00:00Z", source_name="Example Times", content="The whole story")
+
+
+def test_to_dict_round_trips():
+    data = make_article().to_dict()
+    assert data["source"] == {"name": "Example Times"}
+    assert data["publishedAt"] == data["published_at"] == "2024-05-01T10:00:00Z"
+    again = Article.from_dict(json.loads(json.dumps(data)))
+    assert (again.title, again.source_name, again.content, again.published_ts) == \
+        ("Startup raises funds", "Example Times", "The whole story", 1714557600)
+
+
+def test_as_dicts_leaves_dicts_alone():
+    plain = {"title": "Already a dict"}
+    converted = as_dicts([make_article(), plain])
+    assert converted[0]["title"] == "Startup raises funds" and converted[1] is plain
+
+
+def test_get_news_data_results_are_json_serializable(monkeypatch):
+    class FakeAggregator:
+        async def get_comprehensive_news(self, category, region, max_articles, **kwargs):
+            return {"status": "success", "total_results": 1, "articles": [make_article()]}
+
+    monkeypatch.setattr(news_tool, "ENHANCED_AVAILABLE", True)
+    monkeypatch.setattr(news_tool, "MultiSourceNewsAggregator", FakeAggregator)
+    result = asyncio.run(news_tool.get_news_data(category="business"))
+    assert json.loads(json.dumps(result))["articles"][0]["source"]["name"] == "Example Times"
+
+
+def test_only_set_fields_are_contained():
+    article = Article(title="Undated", published_at="yesterday", content=lambda: 1 / 0)
+    assert "title" in article and "content" in article  # lazy content is not run
+    assert "published_ts" not in article and "nonsense" not in article
+    assert "publishedAt" in make_article() and "published_ts" in make_article()
+
+
+def test_stamp_articles_restamps_undated_articles():
+    undated = Article(title="Undated", published_at="yesterday")
+    dated = Article(title="Dated", published_at="not a date", published_ts=5)
+    stamp_articles([undated, dated])
+    assert (undated.published_ts, dated.published_ts) == (0, 5)
+    assert "published_ts" in undated
@@ -0,0 +1,28 @@
+# tests/test_call_failures.py - A provider call's failure is decided from its own requests only
+import asyncio
+
+from tools.enhanced_news_tool import MultiSourceNewsAggregator
+
+
+def test_concurrent_calls_report_only_their_own_failures():
+    aggregator = MultiSourceNewsAggregator()
+
+    async def failing_fetcher():
+        await asyncio.sleep(0.01)
+        aggregator._note_failure("HTTP 500")  # what _get_json does, then the fetcher swallows it
+        return []
+
+    async def working_fetcher():
+        await asyncio.sleep(0.02)  # still running while the other call fails
+        return ["article"]
+
+    async def scenario():
+        bad = asyncio.create_task(aggregator._tracked_call(failing_fetcher))
+        good = asyncio.create_task(aggregator._tracked_call(working_fetcher))
+        return await bad, await good
+
+    assert asyncio.run(scenario()) == (([], True), (["article"], False))
+
+
+def test_failures_outside_a_tracked_call_are_ignored():
+    MultiSourceNewsAggregator()._note_failure("timeout")
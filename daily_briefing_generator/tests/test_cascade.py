@@ -0,0 +1,130 @@
+# tests/test_cascade.py - Priority order, cancellation and request sharing of the speculative cascade
+import asyncio
+
+from tools.cascade import SpeculativeCascade
+
+
+def strategy(result, delay=0.0, log=None, name=None):
+    async def run():
+        if log is not None:
+            log.append(("start", name))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(("cancelled", name))
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return run
+
+
+def test_preferred_strategy_wins_even_when_slower():
+    async def scenario():
+        cascade = SpeculativeCascade()
+        cascade.add(2, "fallback", strategy("fallback", delay=0.0))
+        cascade.add(1, "primary", strategy("primary", delay=0.05))
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == ("primary", "primary")
+
+
+def test_falls_through_failures_in_priority_order():
+    async def scenario():
+        cascade = SpeculativeCascade()
+        cascade.add(1, "raises", strategy(RuntimeError("down"), delay=0.02))
+        cascade.add(2, "empty", strategy([], delay=0.01))
+        cascade.add(3, "works", strategy(["article"]))
+        cascade.add(4, "also works", strategy(["other"]))
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == ("works", ["article"])
+
+
+def test_all_failing_returns_none():
+    async def scenario():
+        cascade = SpeculativeCascade()
+        cascade.add(1, "a", strategy(RuntimeError("down")))
+        cascade.add(2, "b", strategy(None))
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == (None, None)
+
+
+def test_lower_ranked_strategies_are_cancelled_once_a_winner_is_known():
+    log = []
+
+    async def scenario():
+        cascade = SpeculativeCascade()
+        cascade.add(1, "primary", strategy("primary", delay=0.01, log=log, name="primary"))
+        cascade.add(2, "slow", strategy("slow", delay=10, log=log, name="slow"))
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == ("primary", "primary")
+    assert ("cancelled", "slow") in log
+    assert ("cancelled", "primary") not in log
+
+
+def test_strategies_start_in_priority_order_under_the_concurrency_limit():
+    log = []
+
+    async def scenario():
+        cascade = SpeculativeCascade(max_concurrency=1)
+        for priority, name in ((3, "c"), (1, "a"), (2, "b")):
+            cascade.add(priority, name, strategy(None, log=log, name=name))
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert [name for event, name in log if event == "start"] == ["a", "b", "c"]
+
+
+def test_identical_requests_run_once_and_are_shared():
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["shared"]
+
+    async def scenario():
+        cascade = SpeculativeCascade()
+
+        async def uses_request():
+            return await cascade.dedupe(("GNews", "technology"), request)
+
+        cascade.add(1, "first", uses_request)
+        cascade.add(2, "second", uses_request)
+        result = await cascade.run(bool)
+        return result, cascade.requests_deduplicated
+
+    result, deduplicated = asyncio.run(scenario())
+    assert result == ("first", ["shared"])
+    assert len(calls) == 1 and deduplicated == 1
+
+
+def test_shared_request_survives_a_cancelled_strategy():
+    async def scenario():
+        cascade = SpeculativeCascade()
+        started = asyncio.Event()
+
+        async def request():
+            started.set()
+            await asyncio.sleep(0.02)
+            return ["shared"]
+
+        async def gives_up():
+            task = asyncio.ensure_future(cascade.dedupe("key", request))
+            await started.wait()
+            task.cancel()
+            return None
+
+        async def waits():
+            await started.wait()
+            return await cascade.dedupe("key", request)
+
+        cascade.add(1, "gives up", gives_up)
+        cascade.add(2, "waits", waits)
+        return await cascade.run(bool)
+
+    assert asyncio.run(scenario()) == ("waits", ["shared"])
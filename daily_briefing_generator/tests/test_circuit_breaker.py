@@ -0,0 +1,93 @@
+# tests/test_circuit_breaker.py - Breaker state transitions and status classification
+import types
+
+import pytest
+
+from tools import circuit_breaker
+from tools.circuit_breaker import (AUTH_COOLDOWN, CLOSED, HALF_OPEN, MAX_COOLDOWN, OPEN, TRANSIENT_COOLDOWN,
+                                   CircuitBreaker, classify_status)
+
+
+@pytest.fixture
+def breaker(clock, monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "time", types.SimpleNamespace(time=clock))
+    return CircuitBreaker("Test", failure_threshold=3, probe_timeout=30)
+
+
+def test_opens_after_consecutive_transient_failures(breaker):
+    breaker.record_failure("HTTP 500")
+    breaker.record_failure("HTTP 500")
+    assert breaker.state == CLOSED and breaker.allow_request()
+
+    breaker.record_failure("HTTP 500")
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.calls_skipped == 1
+
+
+def test_success_resets_the_failure_streak(breaker):
+    breaker.record_failure("HTTP 500")
+    breaker.record_failure("HTTP 500")
+    breaker.record_success()
+    breaker.record_failure("HTTP 500")
+    assert breaker.state == CLOSED
+
+
+def test_trip_opens_immediately(breaker):
+    breaker.record_failure("HTTP 401", cooldown=AUTH_COOLDOWN, trip=True)
+    assert breaker.state == OPEN
+    assert breaker.get_state()["retry_in_seconds"] == AUTH_COOLDOWN
+
+
+def test_half_open_allows_a_single_probe_after_cooldown(breaker, clock):
+    breaker.record_failure("timeout", trip=True)
+    clock.advance(TRANSIENT_COOLDOWN - 1)
+    assert not breaker.allow_request()
+
+    clock.advance(1)
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # probe in flight
+
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow_request()
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(breaker, clock):
+    breaker.record_failure("timeout", trip=True)
+    clock.advance(TRANSIENT_COOLDOWN)
+    assert breaker.allow_request()
+
+    breaker.record_failure("timeout")
+    assert breaker.state == OPEN
+    assert breaker.cooldown == TRANSIENT_COOLDOWN * 2
+
+    breaker.cooldown = MAX_COOLDOWN
+    clock.advance(MAX_COOLDOWN)
+    assert breaker.allow_request()
+    breaker.record_failure("timeout")
+    assert breaker.cooldown == MAX_COOLDOWN
+
+
+def test_abandoned_probe_expires_and_released_probe_frees_the_slot(breaker, clock):
+    breaker.record_failure("timeout", trip=True)
+    clock.advance(TRANSIENT_COOLDOWN)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+    clock.advance(31)  # probe never reported back
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize("status, trip", [(401, True), (403, True), (429, True), (426, True), (500, False)])
+def test_classify_status(status, trip):
+    reason, cooldown, tripped = classify_status(status)
+    assert str(status) in reason
+    assert tripped is trip
+
+
+def test_classify_status_success():
+    assert classify_status(200) is None
@@ -0,0 +1,66 @@
+# tests/test_dedup.py - URL canonicalization and near-duplicate removal across providers
+import pytest
+
+from tools.dedup import NearDuplicateIndex, canonicalize_url, overlap_similarity, remove_near_duplicates, word_set
+
+
+@pytest.mark.parametrize("url", [
+    "http://www.example.com/story/",
+    "https://example.com:443/story?utm_source=x&fbclid=abc",
+    "https://EXAMPLE.com/story#comments",
+])
+def test_canonical_url_drops_what_does_not_select_content(url):
+    assert canonicalize_url(url) == "https://example.com/story"
+
+
+def test_canonical_url_keeps_and_sorts_real_parameters():
+    assert canonicalize_url("https://example.com/a?page=2&id=7&utm_medium=rss") == "https://example.com/a?id=7&page=2"
+    assert canonicalize_url("") == ""
+    assert canonicalize_url("not a url") == "not a url"
+
+
+def test_overlap_similarity():
+    assert overlap_similarity(word_set("a b c d"), word_set("a b c e")) == 0.75
+    assert overlap_similarity(set(), word_set("a")) == 0.0
+
+
+def test_same_story_from_two_providers_is_kept_once():
+    articles = [
+        {"title": "Apple unveils new iPhone with faster chip", "url": "https://a.com/1"},
+        {"title": "Apple unveils new iPhone with faster chip!", "url": "https://b.com/2"},
+        {"title": "Monsoon arrives early in Kerala", "url": "https://c.com/3"},
+    ]
+    assert remove_near_duplicates(articles) == [articles[0], articles[2]]
+
+
+def test_same_url_is_a_duplicate_whatever_the_title():
+    articles = [
+        {"title": "Markets rally", "url": "https://www.example.com/markets?utm_source=feed"},
+        {"title": "Stocks close higher on Friday", "url": "http://example.com/markets/"},
+    ]
+    assert remove_near_duplicates(articles) == articles[:1]
+
+
+def test_shared_long_description_is_a_duplicate():
+    description = "The central bank kept its benchmark rate unchanged for the fourth straight meeting on Thursday"
+    articles = [
+        {"title": "RBI holds rates", "description": description, "url": "https://a.com/1"},
+        {"title": "Repo rate unchanged again", "description": description, "url": "https://b.com/2"},
+    ]
+    assert remove_near_duplicates(articles) == articles[:1]
+
+
+def test_short_generic_descriptions_are_ignored():
+    articles = [
+        {"title": "RBI holds rates", "description": "Read more here", "url": "https://a.com/1"},
+        {"title": "Monsoon arrives early", "description": "Read more here", "url": "https://b.com/2"},
+    ]
+    assert remove_near_duplicates(articles) == articles
+
+
+def test_threshold_and_untitled_articles():
+    index = NearDuplicateIndex(threshold=0.9)
+    assert index.add({"title": "India wins the test series against Australia"})
+    assert index.add({"title": "India wins the test series against England"})
+    assert not index.add({"title": ""})
+    assert len(index) == 2
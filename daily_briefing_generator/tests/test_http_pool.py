@@ -0,0 +1,28 @@
+# tests/test_http_pool.py - One pooled session per event loop, none left open
+import asyncio
+import warnings
+
+from tools.http_pool import HTTPConnectionPool
+
+
+def test_session_is_reused_within_a_loop():
+    pool = HTTPConnectionPool()
+
+    async def scenario():
+        first = await pool.get_session()
+        second = await pool.get_session()
+        await pool.close()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second and first.closed
+
+
+def test_previous_loops_session_is_closed_on_a_new_loop():
+    pool = HTTPConnectionPool()
+    first = asyncio.run(pool.get_session())
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        second = asyncio.run(pool.get_session())
+    assert first.closed and not second.closed and first is not second
+    asyncio.run(second.close())
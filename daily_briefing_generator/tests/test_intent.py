@@ -0,0 +1,133 @@
+# tests/test_intent.py - Rule-based request parsing and when it defers to the LLM
+import pytest
+
+from tools.intent import DEFAULT_NEWS_COUNTRY, Intent, parse_intent
+
+
+@pytest.fixture(autouse=True)
+def default_threshold(monkeypatch):
+    monkeypatch.delenv("INTENT_CONFIDENCE_THRESHOLD", raising=False)
+
+
+def test_morning_briefing_with_category():
+    intent = parse_intent("Morning briefing for Mumbai with tech news")
+    assert intent.needs_weather and intent.needs_news
+    assert (intent.city, intent.country, intent.location) == ("Mumbai", "in", "Mumbai")
+    assert intent.categories == ["technology"] and intent.keywords == []
+    assert intent.confident()
+
+
+def test_filler_words_do_not_become_keywords():
+    intent = parse_intent("Complete briefing for New York with all news categories")
+    assert intent.needs_weather and intent.needs_news
+    assert (intent.city, intent.country) == ("New York", "us")
+    assert intent.keywords == []
+
+
+def test_weather_context_word_is_not_a_news_request():
+    intent = parse_intent("Weather conditions for Mumbai today for business travel")
+    assert intent.needs_weather and not intent.needs_news
+    assert not intent.confident()
+
+
+@pytest.mark.parametrize("text, category, keywords", [
+    ("tech updates", "technology", []),
+    ("cricket scores", "sports", ["cricket"]),
+    ("Business news updates", "business", []),
+])
+def test_category_words_alone_ask_for_news(text, category, keywords):
+    intent = parse_intent(text)
+    assert intent.needs_news and not intent.needs_weather
+    assert intent.category == category and intent.keywords == keywords
+    assert intent.confident()
+
+
+@pytest.mark.parametrize("text, weather, news", [
+    ("Weather briefing for London", True, False),
+    ("News briefing for London", False, True),
+    ("Mumbai morning briefing with technology updates", True, True),
+    ("Daily briefing for Delhi", True, True),
+])
+def test_briefing_kinds(text, weather, news):
+    intent = parse_intent(text)
+    assert (intent.needs_weather, intent.needs_news) == (weather, news)
+    assert intent.confident()
+
+
+def test_weather_only_request():
+    intent = parse_intent("What's the weather in London?")
+    assert intent.needs_weather and not intent.needs_news
+    assert (intent.city, intent.country) == ("London", "gb")
+    assert intent.confident()
+
+
+def test_proper_nouns_become_keywords():
+    intent = parse_intent("Latest news about Tesla")
+    assert intent.needs_news and intent.keywords == ["Tesla"]
+
+
+def test_unknown_lowercase_words_only_lower_confidence():
+    intent = parse_intent("news about quantum widgets")
+    assert intent.keywords == []
+    assert intent.confidence < 1.0
+
+
+def test_negation_defers_to_the_llm():
+    assert not parse_intent("Briefing for Mumbai without weather").confident()
+
+
+def test_unknown_place_defers_to_the_llm():
+    intent = parse_intent("Weather in Timbuktu")
+    assert intent.city is None and not intent.confident()
+
+
+def test_several_places_defer_to_the_llm():
+    assert not parse_intent("Weather in Mumbai and London").confident()
+
+
+def test_country_without_city_names_no_weather_city():
+    intent = parse_intent("News from India")
+    assert intent.needs_news and intent.city is None
+    assert (intent.country, intent.location) == ("in", "India")
+    assert intent.confident()
+    assert not parse_intent("Weather in India").confident()
+
+
+def test_us_is_only_a_country_in_capitals():
+    assert parse_intent("Tech news from the US").country == "us"
+    assert parse_intent("Give us tech news").country is None
+
+
+def test_nothing_recognizable_is_not_confident():
+    assert not parse_intent("hello there").confident()
+
+
+def test_article_count():
+    assert parse_intent("Top 5 tech news").count == 5
+    assert parse_intent("three business headlines").count == 3
+
+
+def test_confidence_threshold_from_argument_and_env(monkeypatch):
+    intent = Intent(needs_news=True, confidence=0.6)
+    assert not intent.confident()
+    assert intent.confident(threshold=0.5)
+    monkeypatch.setenv("INTENT_CONFIDENCE_THRESHOLD", "0.5")
+    assert intent.confident()
+
+
+def test_analysis_fields_match_the_llm_format():
+    fields = parse_intent("Morning briefing for Mumbai with tech news").analysis_fields()
+    assert fields == {
+        "NEEDS_WEATHER": "yes",
+        "WEATHER_LOCATION": "Mumbai",
+        "LOCATION_COUNTRY": "in",
+        "NEEDS_NEWS": "yes",
+        "NEWS_CATEGORIES": "technology",
+        "NEWS_LOCATION_FOCUS": "Mumbai",
+    }
+    assert Intent(needs_news=True).analysis_fields()["WEATHER_LOCATION"] == "default"
+
+
+def test_default_news_country():
+    assert DEFAULT_NEWS_COUNTRY == "in"
+    assert parse_intent("tech news").country is None  # callers fill in the default
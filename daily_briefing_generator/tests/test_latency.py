@@ -0,0 +1,67 @@
+# tests/test_latency.py - Adaptive provider timeouts from observed latency
+import pytest
+
+from tools.latency import LatencyTracker
+
+
+@pytest.fixture
+def tracker():
+    return LatencyTracker(window=20, margin=1.5, padding=0.5, min_timeout=2, max_timeout=15, min_samples=5)
+
+
+def test_unknown_provider_gets_the_maximum(tracker):
+    assert tracker.timeout_for("GNews") == 15
+    for _ in range(4):
+        tracker.record("GNews", 0.2)
+    assert tracker.timeout_for("GNews") == 15
+
+
+def test_timeout_follows_the_tail_latency(tracker):
+    for seconds in (1.0, 1.0, 1.0, 1.0, 4.0):
+        tracker.record("GNews", seconds)
+    assert tracker.percentile("GNews", 95) == 4.0
+    assert tracker.timeout_for("GNews") == pytest.approx(4.0 * 1.5 + 0.5)
+
+
+def test_timeout_is_clamped(tracker):
+    for _ in range(5):
+        tracker.record("Fast", 0.1)
+        tracker.record("Slow", 30.0)
+    assert tracker.timeout_for("Fast") == 2
+    assert tracker.timeout_for("Slow") == 15
+    assert tracker.timeout_for("Slow", remaining=3.0) == 3.0
+    assert tracker.timeout_for("Slow", remaining=-1.0) == 0.1
+
+
+def test_old_samples_leave_the_window(tracker):
+    for _ in range(20):
+        tracker.record("GNews", 9.0)
+    for _ in range(20):
+        tracker.record("GNews", 1.0)
+    assert tracker.percentile("GNews", 99) == 1.0
+
+
+def test_timeouts_widen_a_learned_timeout(tracker):
+    for _ in range(5):
+        tracker.record("GNews", 0.5)
+    timeout = tracker.timeout_for("GNews")
+    assert timeout == 2
+
+    for _ in range(5):
+        tracker.record_timeout("GNews", tracker.timeout_for("GNews"))
+    assert tracker.timeout_for("GNews") > timeout
+    assert tracker.get_stats()["GNews"]["timeouts"] == 5
+
+
+def test_timeouts_cut_by_the_deadline_are_not_samples(tracker):
+    for _ in range(5):
+        tracker.record("GNews", 2.0)
+    tracker.record_timeout("GNews", tracker.timeout_for("GNews", remaining=0.5))
+    assert len(tracker.samples["GNews"]) == 5
+    assert tracker.timeouts["GNews"] == 1
+
+
+def test_stats_cover_providers_with_only_timeouts(tracker):
+    tracker.record_timeout("GNews", 15)
+    stats = tracker.get_stats()["GNews"]
+    assert stats["samples"] == 1 and stats["timeouts"] == 1 and stats["next_timeout"] == 15
@@ -0,0 +1,136 @@
+# tests/test_llm_cache.py - Prompt fingerprints, per-kind TTLs, persistence and the cached model wrapper
+import asyncio
+import types
+
+import pytest
+
+from tools import llm_cache
+from tools.llm_cache import CachedModel, CachedResponse, LLMResponseCache, prompt_fingerprint
+
+TTLS = {"analysis": 100, "synthesis": 10, "narration": 0}
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(clock, monkeypatch):
+    monkeypatch.setattr(llm_cache, "time", types.SimpleNamespace(time=clock, monotonic=clock, perf_counter=clock))
+    for kind in ("ANALYSIS", "SYNTHESIS", "NARRATION"):
+        monkeypatch.delenv(f"LLM_CACHE_TTL_{kind}", raising=False)
+
+
+@pytest.fixture
+def cache():
+    return LLMResponseCache(max_entries=3, ttls=TTLS, persist_file="", enabled=True)
+
+
+class FakeModel:
+    model_name = "models/fake"
+
+    def __init__(self, system_instruction=None):
+        self._system_instruction = system_instruction
+        self.prompts = []
+
+    async def generate_content_async(self, contents, **kwargs):
+        self.prompts.append(contents)
+        return types.SimpleNamespace(text=f"answer {len(self.prompts)}", usage_metadata=None)
+
+
+def test_fingerprint_ignores_whitespace_only():
+    base = prompt_fingerprint("m", "Analyze:  Mumbai\n tech news", {"temperature": 0.2}, "You are  a planner")
+    assert base == prompt_fingerprint("m", " Analyze: Mumbai tech news ", {"temperature": 0.2}, "You are a planner")
+
+
+@pytest.mark.parametrize("changed", [
+    dict(model_name="other"),
+    dict(prompt="Analyze: Delhi tech news"),
+    dict(generation_config={"temperature": 0.7}),
+    dict(system_instruction="You are a narrator"),
+])
+def test_fingerprint_separates_what_changes_the_answer(changed):
+    call = dict(model_name="m", prompt="Analyze: Mumbai tech news", generation_config={"temperature": 0.2},
+                system_instruction="You are a planner")
+    assert prompt_fingerprint(**call) != prompt_fingerprint(**dict(call, **changed))
+
+
+def test_entries_expire_by_kind(cache, clock):
+    cache.put("a", "analysis", "plan")
+    cache.put("s", "synthesis", "briefing")
+    clock.advance(11)
+    assert cache.get("s", "synthesis") is None
+    assert cache.get("a", "analysis") == "plan"
+    assert cache.get_stats()["by_kind"]["synthesis"] == {"hits": 0, "misses": 1, "hit_ratio": 0.0}
+
+
+def test_kinds_without_a_ttl_are_not_stored(cache):
+    cache.put("n", "narration", "text")
+    cache.put("u", "unknown", "text")
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_dropped(cache):
+    for key in ("a", "b", "c"):
+        cache.put(key, "analysis", key)
+    cache.get("a", "analysis")
+    cache.put("d", "analysis", "d")
+    assert list(cache._entries) == ["c", "a", "d"]
+
+
+def test_entries_survive_a_restart(tmp_path, clock):
+    persist_file = str(tmp_path / "llm_cache.json")
+    cache = LLMResponseCache(ttls=TTLS, persist_file=persist_file, enabled=True, save_interval=60)
+    cache.put("a", "analysis", "plan")
+    cache.put("s", "synthesis", "briefing")
+    cache.flush()
+
+    clock.advance(50)  # the synthesis entry expired while we were down
+    restarted = LLMResponseCache(ttls=TTLS, persist_file=persist_file, enabled=True)
+    assert restarted.get("a", "analysis") == "plan"
+    assert "s" not in restarted._entries
+
+
+def test_cached_model_serves_repeated_calls_from_the_cache(cache):
+    model = FakeModel()
+    wrapped = CachedModel(model, cache=cache)
+
+    async def scenario():
+        first = await wrapped.generate_content_async("Analyze: Mumbai", kind="analysis")
+        second = await wrapped.generate_content_async("Analyze:   Mumbai", kind="analysis")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert isinstance(second, CachedResponse) and second.text == first.text == "answer 1"
+    assert len(model.prompts) == 1
+    assert wrapped.model_name == "models/fake"
+
+
+def test_cached_model_skips_the_cache_without_a_kind(cache):
+    model = FakeModel()
+    wrapped = CachedModel(model, cache=cache)
+
+    async def scenario():
+        for _ in range(2):
+            await wrapped.generate_content_async("Analyze: Mumbai")
+
+    asyncio.run(scenario())
+    assert len(model.prompts) == 2
+    assert cache.get_stats()["model_calls"]["uncached"]["calls"] == 2
+
+
+def test_system_instruction_is_part_of_the_key(cache):
+    planner = CachedModel(FakeModel("You are a planner"), cache=cache)
+    narrator = CachedModel(FakeModel("You are a narrator"), cache=cache)
+
+    async def scenario():
+        await planner.generate_content_async("Mumbai", kind="analysis")
+        return await narrator.generate_content_async("Mumbai", kind="analysis")
+
+    assert not isinstance(asyncio.run(scenario()), CachedResponse)
+
+
+def test_preamble_is_sent_and_keyed_with_the_prompt(cache):
+    model = FakeModel()
+    wrapped = CachedModel(model, cache=cache, preamble="You are a planner")
+    asyncio.run(wrapped.generate_content_async("Mumbai", kind="analysis"))
+    assert model.prompts == ["You are a planner\n\nMumbai"]
+
+    other = CachedModel(FakeModel(), cache=cache, preamble="You are a narrator")
+    assert not isinstance(asyncio.run(other.generate_content_async("Mumbai", kind="analysis")), CachedResponse)
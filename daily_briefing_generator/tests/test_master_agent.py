@@ -0,0 +1,111 @@
+# tests/test_master_agent.py - Only briefings built from every sub-agent's data are reused
+import asyncio
+import types
+
+import pytest
+
+from orchestrator import master_agent
+from orchestrator.master_agent import MODE_AGENTS, MODE_SINGLE_PASS, MasterAgent
+from tools.semantic_cache import SemanticRequestCache
+
+REQUEST = "Morning briefing for Mumbai with tech news"
+
+
+class FakeWeatherAgent:
+    def __init__(self, ok=True):
+        self.ok = ok
+
+    async def get_weather_briefing_with_status(self, user_request, intent=None):
+        if self.ok:
+            return "Sunny, 31°C", True
+        return "Sorry, I couldn't get weather data: HTTP 503", False
+
+
+class FakeNewsAgent:
+    def __init__(self, ok=True, raises=False):
+        self.ok = ok
+        self.raises = raises
+
+    async def get_news_briefing_with_status(self, user_request, location=None, intent=None):
+        if self.raises:
+            raise RuntimeError("news agent crashed")
+        if self.ok:
+            return "Startup raises funds", True
+        return "No news articles are available right now", False
+
+
+class FakeSynthesisModel:
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, kind=None):
+        self.prompts.append(prompt)
+        return types.SimpleNamespace(text=f"briefing {len(self.prompts)}")
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.delenv("INTENT_CONFIDENCE_THRESHOLD", raising=False)
+    cache = SemanticRequestCache(max_entries=8, dim=256, enabled=True)
+    monkeypatch.setattr(master_agent, "get_semantic_cache", lambda: cache)
+    return cache
+
+
+def make_agent(weather_agent=None, news_agent=None):
+    # Skips __init__, which needs a Google AI key and builds real models
+    agent = MasterAgent.__new__(MasterAgent)
+    agent.weather_agent = weather_agent or FakeWeatherAgent()
+    agent.news_agent = news_agent or FakeNewsAgent()
+    agent.synthesis_model = FakeSynthesisModel()
+    agent.max_retries = 1
+    agent.timeout_seconds = 5
+    agent.source_token_budget = 1000
+    agent.fallback_responses = {"weather": "Weather unavailable.", "news": "News unavailable."}
+    return agent
+
+
+def run_twice(agent, mode=MODE_AGENTS):
+    async def scenario():
+        first = await agent.run_with_recovery(REQUEST, mode=mode)
+        second = await agent.run_with_recovery(REQUEST, mode=mode)
+        return first, second
+    return asyncio.run(scenario())
+
+
+def test_complete_briefing_is_reused(cache):
+    agent = make_agent()
+    assert run_twice(agent) == ("briefing 1", "briefing 1")
+    assert len(agent.synthesis_model.prompts) == 1
+
+
+@pytest.mark.parametrize("weather_agent, news_agent", [
+    (FakeWeatherAgent(ok=False), None),
+    (None, FakeNewsAgent(ok=False)),
+    (None, FakeNewsAgent(raises=True)),
+])
+def test_briefing_with_a_failed_sub_agent_is_not_stored(cache, weather_agent, news_agent):
+    agent = make_agent(weather_agent, news_agent)
+    assert run_twice(agent) == ("briefing 1", "briefing 2")
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_single_pass_briefing_with_failed_data_is_not_stored(cache, monkeypatch):
+    async def get_weather_data(city, country):
+        return {"error": "HTTP 503"}
+
+    async def get_news_data(**kwargs):
+        return {"status": "success", "articles": [{"title": "Startup raises funds", "description": ""}]}
+
+    monkeypatch.setattr(master_agent, "get_weather_data", get_weather_data)
+    monkeypatch.setattr(master_agent, "get_news_data", get_news_data)
+    agent = make_agent()
+    assert run_twice(agent, MODE_SINGLE_PASS) == ("briefing 1", "briefing 2")
+    assert "Weather data currently unavailable" in agent.synthesis_model.prompts[0]
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_agent_recovery_reports_sub_agent_failures(cache):
+    agent = make_agent(news_agent=FakeNewsAgent(ok=False))
+    briefing, complete = asyncio.run(agent._process_request_with_agent_recovery(REQUEST))
+    assert briefing == "briefing 1" and not complete
+    assert "News service(s) temporarily unavailable" in agent.synthesis_model.prompts[0]
@@ -0,0 +1,160 @@
+# tests/test_news_cache.py - Key normalization, what gets stored, staleness and request coalescing
+import asyncio
+import types
+
+import pytest
+
+from tools import news_cache
+from tools.news_cache import NewsResultCache, news_cache_key
+
+
+@pytest.fixture
+def cache(clock, monkeypatch):
+    # Only the cache's clock is faked; the event loop keeps the real time.monotonic
+    monkeypatch.setattr(news_cache, "time", types.SimpleNamespace(monotonic=clock))
+    return NewsResultCache(ttl=60, stale_ttl=120, max_bytes=1024 * 1024, enabled=True)
+
+
+def fetcher(*results):
+    """Coroutine function returning the given results in turn, counting its calls"""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return results[min(len(calls), len(results)) - 1]
+    return fetch, calls
+
+
+def success(*titles, **extra):
+    return dict({"status": "success", "articles": [{"title": t} for t in titles]}, **extra)
+
+
+def test_key_ignores_case_whitespace_and_keyword_order():
+    assert news_cache_key("Technology ", "IN", ["AI", " startups", ""], 10, "Mumbai") == \
+        news_cache_key("technology", "in", ["startups", "ai", "ai"], 10, "mumbai ")
+    assert news_cache_key(None, None, None, 10) == news_cache_key("general", "global", [], 10)
+
+
+@pytest.mark.parametrize("changed", [
+    dict(category="business"),
+    dict(region="us"),
+    dict(keywords=["ai", "chips"]),
+    dict(max_articles=5),
+    dict(location="Delhi"),
+    dict(max_age_hours=6),
+    dict(mode="first_sufficient"),
+])
+def test_key_separates_requests_that_fetch_different_data(changed):
+    request = dict(category="technology", region="in", keywords=["ai"], max_articles=10, location="Mumbai")
+    assert news_cache_key(**request) != news_cache_key(**dict(request, **changed))
+
+
+def test_fresh_hit_is_a_copy(cache):
+    async def scenario():
+        fetch, calls = fetcher(success("a"))
+        first = await cache.get_or_fetch(("k",), fetch)
+        first["articles"].append({"title": "mutated"})
+        second = await cache.get_or_fetch(("k",), fetch)
+        return first, second, calls
+
+    first, second, calls = asyncio.run(scenario())
+    assert (first["cache"], second["cache"]) == ("miss", "hit")
+    assert second["articles"] == [{"title": "a"}]
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("result", [
+    {"status": "error", "articles": []},
+    success(),
+    success("partial", deadline_reached=True),
+])
+def test_unusable_results_are_not_stored(cache, result):
+    async def scenario():
+        fetch, calls = fetcher(result)
+        await cache.get_or_fetch(("k",), fetch)
+        await cache.get_or_fetch(("k",), fetch)
+        return calls
+
+    assert len(asyncio.run(scenario())) == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_stale_entry_is_served_while_refreshing(cache, clock):
+    async def scenario():
+        fetch, calls = fetcher(success("old"), success("new"))
+        await cache.get_or_fetch(("k",), fetch)
+        clock.advance(90)
+        stale = await cache.get_or_fetch(("k",), fetch)
+        await asyncio.sleep(0.01)  # let the background refresh finish
+        fresh = await cache.get_or_fetch(("k",), fetch)
+        return stale, fresh, calls
+
+    stale, fresh, calls = asyncio.run(scenario())
+    assert stale["cache"] == "stale" and stale["articles"] == [{"title": "old"}]
+    assert fresh["cache"] == "hit" and fresh["articles"] == [{"title": "new"}]
+    assert len(calls) == 2 and cache.refreshes == 1
+
+
+def test_expired_entry_is_refetched(cache, clock):
+    async def scenario():
+        fetch, calls = fetcher(success("old"), success("new"))
+        await cache.get_or_fetch(("k",), fetch)
+        clock.advance(60 + 120)
+        return await cache.get_or_fetch(("k",), fetch), calls
+
+    result, calls = asyncio.run(scenario())
+    assert result["cache"] == "miss" and len(calls) == 2
+
+
+def test_concurrent_misses_share_one_fetch(cache):
+    async def scenario():
+        fetch, calls = fetcher(success("a"))
+        results = await asyncio.gather(*(cache.get_or_fetch(("k",), fetch) for _ in range(3)))
+        return results, calls
+
+    results, calls = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert sorted(r["cache"] for r in results) == ["coalesced", "coalesced", "miss"]
+
+
+def test_result_cut_short_by_another_callers_deadline_is_refetched(cache):
+    async def scenario():
+        hurried, hurried_calls = fetcher(success("a", deadline_reached=True))
+        patient, patient_calls = fetcher(success("a", "b"))
+        first = asyncio.ensure_future(cache.get_or_fetch(("k",), hurried))
+        await asyncio.sleep(0)
+        second = await cache.get_or_fetch(("k",), patient)
+        return await first, second, hurried_calls, patient_calls
+
+    first, second, hurried_calls, patient_calls = asyncio.run(scenario())
+    assert first["deadline_reached"] and first["cache"] == "miss"
+    assert [a["title"] for a in second["articles"]] == ["a", "b"] and second["cache"] == "miss"
+    assert len(hurried_calls) == len(patient_calls) == 1
+    assert cache.get_stats()["coalesced"] == 0
+
+
+def test_disabled_cache_always_fetches():
+    async def scenario():
+        cache = NewsResultCache(enabled=False)
+        fetch, calls = fetcher(success("a"))
+        await cache.get_or_fetch(("k",), fetch)
+        await cache.get_or_fetch(("k",), fetch)
+        return calls
+
+    assert len(asyncio.run(scenario())) == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    async def scenario():
+        for key in ("a", "b", "c"):
+            fetch, _ = fetcher(success("x" * 400))
+            await cache.get_or_fetch((key,), fetch)
+            if key == "b":
+                await cache.get_or_fetch(("a",), fetch)  # touch "a"
+
+    size = news_cache.estimate_result_bytes(success("x" * 400))
+    cache.max_bytes = size * 2
+    asyncio.run(scenario())
+    assert set(cache._entries) == {("a",), ("c",)}
+    assert cache.evictions == 1
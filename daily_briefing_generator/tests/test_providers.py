@@ -0,0 +1,71 @@
+# tests/test_providers.py - Provider call planning from the capability registry
+import pytest
+
+from tools.article import Article
+from tools.enhanced_news_tool import MultiSourceNewsAggregator
+from tools.providers import PROVIDER_CAPABILITIES, get_capabilities, plan_call
+
+
+def test_supported_filters_are_translated():
+    plan, reason = plan_call("NewsCatcher", "technology", "india", 10)
+    assert reason == ""
+    assert (plan.provider_category, plan.country, plan.search_terms) == ("tech", "IN", [])
+
+
+def test_unsupported_category_becomes_a_search_term():
+    plan, _ = plan_call("NewsCatcher", "health", "us", 10)
+    assert plan.provider_category is None and plan.search_terms == ["health"]
+
+
+def test_unsupported_region_becomes_a_country_search():
+    plan, _ = plan_call("NewsAPI", "business", "india", 10)
+    assert (plan.provider_category, plan.country, plan.search_terms) == ("business", None, ["India"])
+
+
+def test_filters_the_provider_does_not_need():
+    plan, _ = plan_call("Currents", "general", "global", 10)
+    assert (plan.provider_category, plan.country, plan.search_terms) == (None, None, [])
+
+
+@pytest.mark.parametrize("provider, region, language, reason", [
+    ("Nobody", "us", "en", "unknown provider"),
+    ("GNews", "mars", "en", "region 'mars' not supported"),
+    ("GNews", "us", "fr", "language 'fr' not supported"),
+])
+def test_impossible_calls_are_refused(provider, region, language, reason):
+    assert plan_call(provider, "general", region, 10, language) == (None, reason)
+
+
+def test_page_size_is_capped_by_the_provider():
+    assert plan_call("GNews", "general", "us", 50)[0].page_size == 10
+    assert plan_call("NewsAPI", "general", "us", 50)[0].page_size == 50
+    assert plan_call("NewsAPI", "general", "us", 0)[0].page_size == 1
+
+
+def test_defaults_and_case():
+    plan, _ = plan_call("GNews", None, None, 5)
+    assert (plan.category, plan.region, plan.provider_category, plan.country) == ("general", "global", "general", None)
+    assert plan_call("GNews", "Sports", "UK", 5)[0].country == "gb"
+
+
+def test_every_provider_serves_the_standard_requests():
+    for name in PROVIDER_CAPABILITIES:
+        assert get_capabilities(name).name == name
+        for region in ("global", "india", "us", "uk"):
+            plan, reason = plan_call(name, "technology", region, 10)
+            assert plan is not None, f"{name}/{region}: {reason}"
+
+
+def test_full_content_providers():
+    assert {name for name, caps in PROVIDER_CAPABILITIES.items() if caps.full_content} == \
+        {"GNews", "WorldNews", "NewsCatcher"}
+
+
+def test_truncated_teasers_are_dropped_for_providers_without_full_content():
+    aggregator = MultiSourceNewsAggregator()
+    teaser = Article(title="t", description="Short summary", content="First lines of the story… [+2345 chars]")
+    full = Article(title="t", description="Short summary", content="The whole story")
+    aggregator._drop_teasers("NewsAPI", [teaser])
+    aggregator._drop_teasers("GNews", [full])
+    assert teaser.content == "Short summary"
+    assert full.content == "The whole story"
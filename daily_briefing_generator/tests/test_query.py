@@ -0,0 +1,36 @@
+# tests/test_query.py - Provider search queries from request keywords and location
+import pytest
+
+from tools.query import MAX_QUERY_TERMS, keyword_query, normalize_keywords
+
+
+@pytest.mark.parametrize("keywords, expected", [
+    (None, []),
+    ("None", []),
+    ("[AI, 'startups', None]", ["AI", "startups"]),
+    (["AI", "ai ", "", "Tesla"], ["AI", "Tesla"]),
+])
+def test_normalize_keywords(keywords, expected):
+    assert normalize_keywords(keywords) == expected
+
+
+def test_normalize_keywords_caps_the_term_count():
+    assert len(normalize_keywords([f"k{i}" for i in range(10)])) == MAX_QUERY_TERMS
+
+
+def test_boolean_query():
+    assert keyword_query(["AI", "machine learning"], "Mumbai") == '(AI OR "machine learning") AND Mumbai'
+    assert keyword_query(["AI"], "New York") == 'AI AND "New York"'
+    assert keyword_query(["AI", "chips"]) == "AI OR chips"
+    assert keyword_query([], "Mumbai") == "Mumbai"
+    assert keyword_query(None) == ""
+
+
+def test_required_terms_are_anded_once():
+    assert keyword_query(["AI"], "India", required=["health", "india"]) == "AI AND India AND health"
+    assert keyword_query([], None, required=["United Kingdom"]) == '"United Kingdom"'
+
+
+def test_free_text_query():
+    assert keyword_query(["AI", "machine learning"], "Mumbai", boolean=False) == "AI machine learning Mumbai"
+    assert keyword_query([], "Mumbai", boolean=False, required=["health"]) == "Mumbai health"
@@ -0,0 +1,110 @@
+# tests/test_quota.py - Token bucket refill and persisted daily quota accounting
+import json
+import types
+
+import pytest
+
+from tools import quota
+from tools.quota import QuotaManager, TokenBucket
+
+LIMITS = {"Test": (2, 1000)}
+
+
+@pytest.fixture(autouse=True)
+def fake_monotonic(clock, monkeypatch):
+    monkeypatch.setattr(quota, "time", types.SimpleNamespace(monotonic=clock))
+    for name in ("TEST_PER_MINUTE", "TEST_DAILY_QUOTA"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "quota_state.json")
+
+
+def test_bucket_starts_full_and_refills_at_rate(clock):
+    bucket = TokenBucket(rate_per_minute=6)
+    assert all(bucket.try_acquire() for _ in range(6))
+    assert not bucket.try_acquire()
+
+    clock.advance(10)  # 6 per minute = one token every 10 s
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_bucket_never_exceeds_capacity(clock):
+    bucket = TokenBucket(rate_per_minute=6, capacity=2)
+    clock.advance(3600)
+    assert bucket.available() == 2
+
+
+def test_per_minute_limit_denies_and_counts(clock, state_file):
+    manager = QuotaManager(state_file=state_file, limits=LIMITS)
+    assert manager.try_acquire("Test") == (True, "")
+    assert manager.try_acquire("Test") == (True, "")
+
+    allowed, reason = manager.try_acquire("Test")
+    assert not allowed and reason == "per-minute rate limit"
+    assert manager.utilization()["Test"]["denied_today"] == 1
+
+    clock.advance(30)
+    assert manager.try_acquire("Test")[0]
+    assert manager.utilization()["Test"]["used_today"] == 3
+
+
+def test_daily_quota_exhausted(state_file):
+    manager = QuotaManager(state_file=state_file, limits={"Test": (100, 3)})
+    manager.usage["Test"] = 3
+    allowed, reason = manager.try_acquire("Test")
+    assert not allowed and reason.startswith("daily quota exhausted")
+
+
+def test_unknown_provider_is_not_limited(state_file):
+    manager = QuotaManager(state_file=state_file, limits=LIMITS)
+    assert manager.try_acquire("Elsewhere") == (True, "")
+
+
+def test_usage_survives_a_restart(clock, state_file):
+    manager = QuotaManager(state_file=state_file, limits=LIMITS, save_interval=60)
+    manager.try_acquire("Test")
+    manager.try_acquire("Test")
+    manager.flush()
+
+    restarted = QuotaManager(state_file=state_file, limits=LIMITS)
+    assert restarted.usage == {"Test": 2}
+    assert restarted.utilization()["Test"]["used_today"] == 2
+
+
+def test_saves_are_throttled_until_flush(clock, state_file):
+    manager = QuotaManager(state_file=state_file, limits=LIMITS, save_interval=60)
+    manager.try_acquire("Test")  # first save goes through
+    manager.try_acquire("Test")
+    with open(state_file, encoding="utf-8") as f:
+        assert json.load(f)["usage"] == {"Test": 1}
+
+    manager.flush()
+    with open(state_file, encoding="utf-8") as f:
+        assert json.load(f)["usage"] == {"Test": 2}
+
+
+def test_state_from_another_day_is_ignored(state_file):
+    with open(state_file, "w", encoding="utf-8") as f:
+        json.dump({"day": "2000-01-01", "usage": {"Test": 999}}, f)
+    manager = QuotaManager(state_file=state_file, limits=LIMITS)
+    assert manager.usage == {}
+
+
+def test_corrupt_state_file_starts_fresh(state_file):
+    with open(state_file, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    manager = QuotaManager(state_file=state_file, limits=LIMITS)
+    assert manager.usage == {}
+    assert manager.try_acquire("Test")[0]
+
+
+def test_day_rollover_resets_counters(state_file, monkeypatch):
+    manager = QuotaManager(state_file=state_file, limits=LIMITS)
+    manager.try_acquire("Test")
+    monkeypatch.setattr(manager, "_today", lambda: "2999-01-01")
+    assert manager.utilization()["Test"]["used_today"] == 0
+    assert manager.day == "2999-01-01"
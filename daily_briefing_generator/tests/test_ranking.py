@@ -0,0 +1,61 @@
+# tests/test_ranking.py - BM25 relevance, freshness and source weight blending
+import pytest
+
+from tools.article import Article
+from tools.ranking import ArticleRanker, build_query, tokenize
+
+NOW = 1_714_557_600
+
+
+@pytest.fixture
+def ranker():
+    return ArticleRanker(relevance_weight=0.6, freshness_weight=0.3, source_weight=0.1, half_life_hours=12)
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The latest AI news for Mumbai") == ["ai", "mumbai"]
+    assert tokenize("") == []
+
+
+def test_build_query_expands_categories_and_deduplicates():
+    query = build_query("technology", ["AI chips", "software"], "New York")
+    assert query[:3] == ["technology", "tech", "software"]
+    assert query.count("software") == 1 and query.count("ai") == 1
+    assert query[-3:] == ["chips", "new", "york"]
+    assert build_query("climate") == ["climate"]
+
+
+def test_bm25_prefers_matching_articles(ranker):
+    articles = [
+        {"title": "Monsoon arrives in Kerala", "description": "Rain expected across the state"},
+        {"title": "Startup raises funds for AI chip", "description": "The semiconductor startup plans to hire"},
+    ]
+    scores = ranker.bm25(articles, build_query("technology"))
+    assert scores[1] == 1.0 and scores[0] == 0.0
+    assert not ranker.bm25(articles, []).any()
+
+
+def test_freshness_halves_every_half_life(ranker):
+    articles = [{"published_ts": NOW}, {"published_ts": NOW - 12 * 3600}, {"published_ts": 0}]
+    assert ranker.freshness(articles, now=NOW).tolist() == pytest.approx([1.0, 0.5, 0.0])
+
+
+def test_source_weights_match_by_substring(ranker):
+    articles = [{"source": {"name": "Reuters India"}}, {"source": "Some Blog"},
+                Article(title="x", source_name="BBC News")]
+    assert ranker.source_weights(articles).tolist() == [1.0, 0.7, 1.0]
+
+
+def test_rank_blends_signals_and_cuts_to_top_k(ranker):
+    relevant_old = {"title": "AI startup unveils chip", "published_ts": NOW - 48 * 3600, "source": "Blog"}
+    relevant_fresh = {"title": "AI startup unveils chip", "published_ts": NOW, "source": "Reuters"}
+    unrelated = {"title": "Monsoon arrives in Kerala", "published_ts": NOW, "source": "Blog"}
+    ranked = ranker.rank([unrelated, relevant_old, relevant_fresh], build_query("technology"), now=NOW)
+    assert ranked == [relevant_fresh, relevant_old, unrelated]
+    assert ranker.rank([unrelated, relevant_old], [], top_k=1, now=NOW) == [unrelated]
+    assert ranker.rank([], ["ai"]) == []
+
+
+def test_ties_keep_input_order(ranker):
+    articles = [{"title": f"Story {i}", "source": "Blog"} for i in range(5)]
+    assert ranker.rank(articles, ["missing"], now=NOW) == articles
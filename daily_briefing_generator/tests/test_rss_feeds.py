@@ -0,0 +1,58 @@
+# tests/test_rss_feeds.py - Feed downloads shared between RSS stages within one request
+import asyncio
+
+import pytest
+
+from tools.enhanced_news_tool import MultiSourceNewsAggregator
+
+
+@pytest.fixture
+def aggregator(monkeypatch):
+    aggregator = MultiSourceNewsAggregator()
+    downloads = []
+
+    async def fetch_feed(feed_url, max_articles):
+        downloads.append(feed_url)
+        await asyncio.sleep(0.05)
+        return [{"title": f"From {feed_url}"}]
+
+    monkeypatch.setattr(aggregator, "_get_rss_feeds", lambda category, region: ["https://feeds.example/shared"])
+    monkeypatch.setattr(aggregator, "_fetch_rss_feed", fetch_feed)
+    aggregator.downloads = downloads
+    return aggregator
+
+
+def test_a_caller_giving_up_does_not_cancel_a_shared_feed(aggregator):
+    async def scenario():
+        feed_cache = {}
+        impatient, patient = await asyncio.gather(
+            aggregator._fetch_from_rss("general", "us", 5, deadline=0.01, feed_cache=feed_cache),
+            aggregator._fetch_from_rss("general", "uk", 5, deadline=1.0, feed_cache=feed_cache),
+        )
+        return impatient, patient
+
+    impatient, patient = asyncio.run(scenario())
+    assert impatient == []
+    assert patient == [{"title": "From https://feeds.example/shared"}]
+    assert len(aggregator.downloads) == 1
+
+
+def test_a_feed_a_later_stage_still_waits_for_is_reused(aggregator):
+    async def scenario():
+        feed_cache = {}
+        first = await aggregator._fetch_from_rss("general", "us", 5, deadline=0.01, feed_cache=feed_cache)
+        second = await aggregator._fetch_from_rss("general", "uk", 5, deadline=1.0, feed_cache=feed_cache)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == [] and len(second) == 1
+    assert len(aggregator.downloads) == 1
+
+
+def test_without_a_shared_cache_stragglers_are_cancelled(aggregator):
+    async def scenario():
+        articles = await aggregator._fetch_from_rss("general", "us", 5, deadline=0.01)
+        return articles, asyncio.all_tasks()
+
+    articles, tasks = asyncio.run(scenario())
+    assert articles == [] and len(tasks) == 1  # only the scenario itself
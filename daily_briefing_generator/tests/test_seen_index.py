@@ -0,0 +1,81 @@
+# tests/test_seen_index.py - Reuse of processed articles across requests, copies and expiry
+import types
+
+import pytest
+
+from tools import seen_index
+from tools.article import Article
+from tools.seen_index import SeenArticleIndex
+
+RAW = {"title": "Monsoon arrives early in Kerala", "url": "https://example.com/monsoon",
+       "description": "The southwest monsoon set in over Kerala three days ahead of schedule"}
+
+
+@pytest.fixture
+def index(clock, monkeypatch):
+    monkeypatch.setattr(seen_index, "time", types.SimpleNamespace(monotonic=clock))
+    return SeenArticleIndex(ttl=60, max_entries=2, resolve_redirects=False)
+
+
+def counting_process():
+    calls = []
+
+    def process(raw):
+        calls.append(raw)
+        return Article.from_dict(raw, default_source="Feed")
+    return process, calls
+
+
+def test_repeat_sighting_skips_processing(index):
+    process, calls = counting_process()
+    first = index.processed("rss", RAW, process)
+    second = index.processed("rss", dict(RAW), process)
+    assert len(calls) == 1
+    assert second.title == first.title and second.source_name == "Feed"
+    assert (index.hits, index.misses) == (1, 1)
+
+
+def test_each_caller_gets_its_own_copy(index):
+    process, _ = counting_process()
+    first = index.processed("rss", RAW, process)
+    first["title"] = "Trimmed by one request"
+    first.description = ""
+
+    second = index.processed("rss", RAW, process)
+    assert second is not first
+    assert second.title == RAW["title"] and second.description == RAW["description"]
+
+
+def test_processed_results_are_kept_per_tool(index):
+    process, calls = counting_process()
+    index.processed("rss", RAW, process)
+    index.processed("newsapi", RAW, process)
+    assert len(calls) == 2
+
+
+def test_fingerprint_is_computed_once(index):
+    assert index.fingerprint(RAW) is index.fingerprint(dict(RAW))
+    assert index.fingerprint(RAW).canonical_url == "https://example.com/monsoon"
+
+
+def test_entries_expire(index, clock):
+    process, calls = counting_process()
+    index.processed("rss", RAW, process)
+    clock.advance(61)
+    index.processed("rss", RAW, process)
+    assert len(calls) == 2 and index.evictions == 1
+
+
+def test_least_recently_used_entries_are_dropped(index):
+    first = index.fingerprint(RAW)
+    index.fingerprint({"title": "Second", "url": "https://example.com/2"})
+    index.fingerprint(RAW)  # touch
+    index.fingerprint({"title": "Third", "url": "https://example.com/3"})
+    assert index.get_stats()["entries"] == 2
+    assert index.fingerprint(RAW) is first
+
+
+def test_redirector_hosts():
+    index = SeenArticleIndex(resolve_redirects=False)
+    assert index._is_redirector("http://feeds.feedburner.com/~r/example/~3/abc/")
+    assert not index._is_redirector("https://example.com/feeds.feedburner.com")
@@ -0,0 +1,84 @@
+# tests/test_semantic_cache.py - Paraphrase hits, and what must never share a cached briefing
+import types
+
+import pytest
+
+from tools import semantic_cache
+from tools.semantic_cache import SemanticRequestCache
+
+REQUEST = "Tech news and weather for Mumbai"
+
+
+@pytest.fixture
+def cache(clock, monkeypatch):
+    monkeypatch.setattr(semantic_cache, "time", types.SimpleNamespace(time=clock, perf_counter=clock))
+    monkeypatch.delenv("INTENT_CONFIDENCE_THRESHOLD", raising=False)
+    cache = SemanticRequestCache(max_entries=4, dim=512, threshold=0.85, ttl=300, enabled=True)
+    cache.store(REQUEST, "complete", "Mumbai briefing")
+    return cache
+
+
+@pytest.mark.parametrize("paraphrase", [
+    "Mumbai morning briefing with technology updates",
+    "tech news and weather for mumbai",
+    "Weather and tech news for Mumbai please",
+])
+def test_paraphrase_is_served(cache, paraphrase):
+    briefing, cached_request, similarity = cache.lookup(paraphrase, "complete")
+    assert briefing == "Mumbai briefing" and cached_request == REQUEST
+    assert similarity >= 0.85
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize("request_text", [
+    "Tech news and weather for Delhi",      # another city
+    "Business news and weather for Mumbai",  # another category
+    "Tech news about Tesla and weather for Mumbai",  # an extra search keyword
+    "Tech news for Mumbai",                  # no weather
+    "Top 3 tech news and weather for Mumbai",  # a different article count
+])
+def test_different_plan_is_never_served(cache, request_text):
+    assert cache.lookup(request_text, "complete") is None
+
+
+def test_different_mode_is_never_served(cache):
+    assert cache.lookup(REQUEST, "first_sufficient") is None
+    assert cache.lookup(REQUEST, "complete") is not None
+
+
+def test_expired_entry_is_not_served(cache, clock):
+    clock.advance(301)
+    assert cache.lookup(REQUEST, "complete") is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_unparsed_requests_are_skipped(cache):
+    assert cache.lookup("Briefing for Mumbai without weather", "complete") is None
+    assert cache.skipped == 1 and cache.misses == 0
+    cache.store("hello there", "complete", "nothing")
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_restoring_the_same_request_reuses_its_slot(cache):
+    cache.store(REQUEST, "complete", "newer briefing")
+    assert cache.get_stats()["entries"] == 1
+    assert cache.lookup(REQUEST, "complete")[0] == "newer briefing"
+
+
+def test_least_recently_used_entry_is_replaced_when_full(cache, clock):
+    for city in ("Delhi", "London", "Paris"):
+        clock.advance(1)
+        cache.store(f"Tech news and weather for {city}", "complete", city)
+    clock.advance(1)
+    cache.lookup(REQUEST, "complete")  # Mumbai is now the most recently used
+    cache.store("Tech news and weather for Tokyo", "complete", "Tokyo")
+
+    assert cache.lookup("Tech news and weather for Delhi", "complete") is None
+    assert cache.lookup(REQUEST, "complete")[0] == "Mumbai briefing"
+    assert cache.lookup("Tech news and weather for Tokyo", "complete")[0] == "Tokyo"
+
+
+def test_disabled_cache_stores_nothing():
+    cache = SemanticRequestCache(max_entries=4, dim=64, enabled=False)
+    cache.store(REQUEST, "complete", "Mumbai briefing")
+    assert cache.lookup(REQUEST, "complete") is None
@@ -0,0 +1,57 @@
+# tests/test_timestamps.py - Provider publish dates normalized to UTC epoch seconds
+import types
+
+import pytest
+
+from tools import timestamps
+from tools.timestamps import age_cutoff, filter_by_age, stamp_articles, to_epoch
+
+EPOCH = 1714557600  # 2024-05-01 10:00:00 UTC
+
+
+@pytest.mark.parametrize("value", [
+    "2024-05-01T10:00:00Z",                 # NewsAPI, GNews
+    "2024-05-01T10:00:00.000Z",
+    "2024-05-01T15:30:00+05:30",
+    "2024-05-01 10:00:00",                  # NewsData (UTC, no offset)
+    "2024-05-01 10:00:00 +0000",            # Currents
+    "Wed, 01 May 2024 10:00:00 GMT",        # RSS
+    "Wed, 01 May 2024 06:00:00 -0400",
+    "2024/05/01 10:00:00",
+    "1714557600",
+    "1714557600000",                        # milliseconds
+    EPOCH,
+    EPOCH + 0.5,
+])
+def test_provider_formats(value):
+    assert to_epoch(value) == EPOCH
+
+
+@pytest.mark.parametrize("value", [None, "", "yesterday", "12", 0, -1, 12.5, -1714557600, 0.0])
+def test_unparseable_is_none(value):
+    assert to_epoch(value) is None
+
+
+def test_same_shape_different_format_is_still_parsed():
+    assert to_epoch("Wed, 01 May 2024 10:00:00 GMT") == EPOCH
+    assert to_epoch("Thu, 02 May 2024 10:00:00 GMT") == EPOCH + 86400
+
+
+def test_stamp_articles_keeps_existing_stamps():
+    articles = [{"published_at": "2024-05-01T10:00:00Z"}, {"published_at": "junk"}, {"published_ts": 5}]
+    stamp_articles(articles)
+    assert [a["published_ts"] for a in articles] == [EPOCH, 0, 5]
+
+
+def test_age_cutoff(monkeypatch):
+    monkeypatch.setattr(timestamps, "time", types.SimpleNamespace(time=lambda: EPOCH))
+    assert age_cutoff() == 0
+    assert age_cutoff(since=100) == 100
+    assert age_cutoff(max_age_hours=2) == EPOCH - 7200
+    assert age_cutoff(since=EPOCH, max_age_hours=2) == EPOCH
+
+
+def test_filter_by_age_keeps_undated_articles():
+    articles = [{"published_ts": EPOCH}, {"published_ts": EPOCH - 10}, {"published_ts": 0}, {}]
+    assert filter_by_age(articles, EPOCH) == [articles[0], articles[2], articles[3]]
+    assert filter_by_age(articles, 0) == articles
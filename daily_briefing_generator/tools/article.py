@@ -0,0 +1,134 @@
+# tools/article.py - Compact article record shared by the news tools and agents
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from tools.timestamps import to_epoch
+except ImportError:
+    from timestamps import to_epoch
+
+# Legacy dict keys -> attribute names ("publishedAt"/"urlToImage" are NewsAPI's spelling)
+_KEY_ALIASES = {"publishedAt": "published_at", "urlToImage": "image_url"}
+KEYS = ("title", "description", "url", "published_at", "published_ts", "source", "content", "image_url")
+
+
+class Article:
+    """
+    One news article, as produced by every fetcher.
+
+    Uses __slots__ instead of a per-article dict, stores the source as an
+    interned name instead of a nested {"name": ...} dict, and only keeps
+    `content` when it differs from the description. Content may also be given
+    as a zero-argument callable that is only run if something reads it.
+
+    Supports the mapping-style access of the old article dicts (article["title"],
+    article.get("publishedAt"), article["source"]["name"]) so existing callers
+    keep working; use to_dict() for JSON (get_news_data results already hold
+    plain dicts, see as_dicts()).
+    """
+    __slots__ = ("title", "description", "url", "published_at", "published_ts", "source_name", "image_url", "_content")
+
+    def __init__(self, title: str = "", description: str = "", url: str = "", published_at: str = "",
+                 source_name: str = "", content: Union[str, Callable[[], str], None] = None,
+                 image_url: str = "", published_ts: Optional[int] = None):
+        self.title = (title or "").strip()
+        self.description = (description or "").strip()
+        self.url = url or ""
+        self.published_at = published_at or ""
+        # None when the date is unknown, so stamp_articles() still stamps it like a dict article
+        self.published_ts = published_ts if published_ts is not None else to_epoch(self.published_at)
+        self.source_name = sys.intern(source_name or "Unknown")
+        self.image_url = image_url or ""
+        self._content = None if content == self.description else content
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_source: str = "") -> "Article":
+        """Build an Article from a normalized or NewsAPI-style article dict"""
+        if isinstance(data, Article):
+            return data
+        source = data.get("source")
+        source_name = source.get("name") if isinstance(source, dict) else source
+        return cls(
+            title=data.get("title", ""),
+            description=data.get("description", ""),
+            url=data.get("url", ""),
+            published_at=data.get("published_at") or data.get("publishedAt", ""),
+            source_name=source_name or default_source,
+            content=data.get("content"),
+            image_url=data.get("image_url") or data.get("urlToImage", ""),
+        )
+
+    @property
+    def content(self) -> str:
+        if callable(self._content):
+            self._content = self._content() or None
+        return self._content or self.description
+
+    @content.setter
+    def content(self, value: Union[str, Callable[[], str], None]) -> None:
+        self._content = value
+
+    @property
+    def source(self) -> Dict[str, str]:
+        return {"name": self.source_name}
+
+    def copy(self) -> "Article":
+        """Independent copy (lazy content stays lazy)"""
+        article = Article.__new__(Article)
+        for slot in Article.__slots__:
+            setattr(article, slot, getattr(self, slot))
+        return article
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict (published_at, publishedAt and a source dict) for JSON responses"""
+        data = {key: self[key] for key in KEYS}
+        data["publishedAt"] = self.published_at
+        return data
+
+    # Mapping-style access for code written against article dicts
+
+    def __getitem__(self, key: str) -> Any:
+        name = _KEY_ALIASES.get(key, key)
+        if name not in KEYS:
+            raise KeyError(key)
+        return getattr(self, name)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        name = _KEY_ALIASES.get(key, key)
+        if name not in KEYS:
+            raise KeyError(key)
+        if name == "source":
+            self.source_name = sys.intern((value.get("name") if isinstance(value, dict) else value) or "Unknown")
+        else:
+            setattr(self, name, value)
+
+    def __contains__(self, key: str) -> bool:
+        # Like a dict key: only fields that are actually set (not None). Content always
+        # is (it falls back to the description), so lazy content is not run for this
+        name = _KEY_ALIASES.get(key, key)
+        if name not in KEYS:
+            return False
+        return name == "content" or self[name] is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        return iter(KEYS)
+
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled copies (process-pool feed parsing) re-intern the source
+        return (Article, (self.title, self.description, self.url, self.published_at, self.source_name,
+                          self._content if isinstance(self._content, str) else self.content,
+                          self.image_url, self.published_ts))
+
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, source={self.source_name!r}, published_at={self.published_at!r})"
+
+
+def as_dicts(articles: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Articles as plain dicts, for results that leave the tool layer (JSON, callers' caches)"""
+    return [article.to_dict() if isinstance(article, Article) else article for article in articles]
@@ -0,0 +1,70 @@
+# tools/cascade.py - Speculative parallel execution of prioritized fallback strategies
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class SpeculativeCascade:
+    """
+    Runs a list of fallback strategies concurrently instead of one after another.
+
+    Strategies are started in priority order (lower number = preferred) under a
+    concurrency limit. The result of the highest-priority strategy that succeeds
+    is returned as soon as every strategy ranked above it has failed; everything
+    still running is cancelled. Identical requests issued by different
+    strategies are executed once and shared through `dedupe()`.
+    """
+
+    def __init__(self, max_concurrency: int = 3):
+        self.max_concurrency = max_concurrency
+        self._strategies: List[Tuple[int, str, Callable[[], Awaitable[Any]]]] = []
+        self._requests: Dict[Any, asyncio.Task] = {}
+        self.requests_deduplicated = 0
+
+    def add(self, priority: int, name: str, strategy: Callable[[], Awaitable[Any]]) -> None:
+        """Register a strategy; `strategy` is a zero-argument coroutine function"""
+        self._strategies.append((priority, name, strategy))
+
+    async def dedupe(self, key: Any, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `request` once per key for the whole cascade and share its result"""
+        task = self._requests.get(key)
+        if task is None:
+            task = self._requests[key] = asyncio.create_task(request())
+        else:
+            self.requests_deduplicated += 1
+        # Shield so a cancelled strategy does not cancel a request another strategy awaits
+        return await asyncio.shield(task)
+
+    async def run(self, is_success: Callable[[Any], bool]) -> Tuple[Optional[str], Any]:
+        """
+        Execute all strategies and return (name, result) of the winning one,
+        or (None, None) when every strategy failed.
+        """
+        ordered = sorted(self._strategies, key=lambda s: s[0])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(strategy):
+            async with semaphore:
+                return await strategy()
+
+        # Tasks are created in priority order; the FIFO semaphore starts them in that order
+        tasks = [(name, asyncio.create_task(limited(strategy))) for _, name, strategy in ordered]
+        pending = {task for _, task in tasks}
+
+        try:
+            while True:
+                for name, task in tasks:
+                    if not task.done():
+                        break  # a preferred strategy is still running; wait for it
+                    if not task.cancelled() and task.exception() is None and is_success(task.result()):
+                        return name, task.result()
+                else:
+                    return None, None
+
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            leftovers = [task for _, task in tasks if not task.done()] + \
+                        [task for task in self._requests.values() if not task.done()]
+            for task in leftovers:
+                task.cancel()
+            if leftovers:
+                await asyncio.gather(*leftovers, return_exceptions=True)
@@ -0,0 +1,143 @@
+# tools/circuit_breaker.py - Per-provider circuit breakers for external news APIs
+import time
+from typing import Dict, Any, Optional
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Cool-down windows (seconds) by failure kind
+AUTH_COOLDOWN = 1800       # 401/403 - key is invalid, no point retrying soon
+RATE_LIMIT_COOLDOWN = 900  # 426/429 - quota exhausted or plan limit hit
+TRANSIENT_COOLDOWN = 60    # timeouts, 5xx, network errors
+MAX_COOLDOWN = 3600
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker for a single provider.
+
+    Transient errors open the breaker after `failure_threshold` consecutive
+    failures; auth and rate-limit errors open it immediately. Once the
+    cool-down expires a single probe request is let through (half-open): a
+    success closes the breaker, a failure re-opens it with a doubled cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, probe_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.probe_timeout = probe_timeout
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.cooldown = 0.0
+        self.last_failure_reason: Optional[str] = None
+        self.last_failure_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+        # Counters for the health endpoint
+        self.total_successes = 0
+        self.total_failures = 0
+        self.times_opened = 0
+        self.calls_skipped = 0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent; moves open -> half-open after the cool-down"""
+        now = time.time()
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if now < self.open_until:
+                self.calls_skipped += 1
+                return False
+            self.state = HALF_OPEN
+            self.probe_started_at = None
+
+        # Half-open: allow one probe at a time (a probe that never reported back expires)
+        if self.probe_started_at is None or now - self.probe_started_at > self.probe_timeout:
+            self.probe_started_at = now
+            return True
+        self.calls_skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker"""
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        self.cooldown = 0.0
+        self.probe_started_at = None
+        self.state = CLOSED
+
+    def record_failure(self, reason: str, cooldown: float = TRANSIENT_COOLDOWN, trip: bool = False) -> None:
+        """
+        Record a failed call with the reason it failed.
+        trip=True opens the breaker immediately (auth/rate-limit errors).
+        """
+        now = time.time()
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self.last_failure_reason = reason
+        self.last_failure_at = now
+
+        if self.state == HALF_OPEN:
+            # Probe failed: back off harder than last time
+            self._open(now, min(max(cooldown, self.cooldown * 2), MAX_COOLDOWN))
+        elif trip or self.consecutive_failures >= self.failure_threshold:
+            self._open(now, cooldown)
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot when a probe was cancelled without an outcome"""
+        self.probe_started_at = None
+
+    def _open(self, now: float, cooldown: float) -> None:
+        self.state = OPEN
+        self.cooldown = cooldown
+        self.open_until = now + cooldown
+        self.probe_started_at = None
+        self.times_opened += 1
+
+    def get_state(self) -> Dict[str, Any]:
+        """Snapshot of the breaker for monitoring"""
+        now = time.time()
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "last_failure_reason": self.last_failure_reason,
+            "last_failure_at": self.last_failure_at,
+            "retry_in_seconds": max(0.0, round(self.open_until - now, 1)) if self.state == OPEN else 0.0,
+            "total_successes": self.total_successes,
+            "total_failures": self.total_failures,
+            "times_opened": self.times_opened,
+            "calls_skipped": self.calls_skipped
+        }
+
+
+def classify_status(status: int) -> Optional[tuple]:
+    """Map an HTTP error status to (reason, cooldown, trip) or None for success"""
+    if status == 200:
+        return None
+    if status in (401, 403):
+        return (f"HTTP {status}: invalid or unauthorized API key", AUTH_COOLDOWN, True)
+    if status in (426, 429):
+        return (f"HTTP {status}: rate limit or plan limit exceeded", RATE_LIMIT_COOLDOWN, True)
+    return (f"HTTP {status}", TRANSIENT_COOLDOWN, False)
+
+
+# Process-wide registry shared across requests
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Get (or create) the breaker for a provider"""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(provider)
+    return breaker
+
+
+def get_all_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every provider's breaker"""
+    return {name: breaker.get_state() for name, breaker in sorted(_breakers.items())}
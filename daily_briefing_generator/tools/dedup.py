@@ -0,0 +1,174 @@
+# tools/dedup.py - MinHash/LSH near-duplicate detection for merged article lists
+import os
+import re
+import zlib
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# MinHash signature shape: NUM_PERM hashes, banded ROWS_PER_BAND at a time
+NUM_PERM = 64
+ROWS_PER_BAND = 2
+
+# Universal hashing (a * x + b) mod p with p < 2^31 keeps a * x inside uint64
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(7)
+_HASH_A = _rng.randint(1, int(_MERSENNE_PRIME), size=NUM_PERM).astype(np.uint64)
+_HASH_B = _rng.randint(0, int(_MERSENNE_PRIME), size=NUM_PERM).astype(np.uint64)
+
+# Descriptions shorter than this are too generic to compare ("Read more", "Live updates")
+MIN_DESCRIPTION_WORDS = 8
+
+# Query parameters that only track the click, never select the content
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ocid", "cmpid",
+                   "ito", "ref", "ref_src", "smid", "partner", "ncid", "taid", "at_medium", "at_campaign"}
+TRACKING_PREFIXES = ("utm_", "ns_", "__twitter")
+DEFAULT_PORTS = {":80", ":443"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so the same story matches across providers:
+    https scheme, lower-case host without www./default port, tracking
+    parameters (utm_*, fbclid, ...) and fragment dropped, query sorted.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    host = parts.netloc.lower()
+    for port in DEFAULT_PORTS:
+        if host.endswith(port):
+            host = host[:-len(port)]
+    if host.startswith("www."):
+        host = host[4:]
+
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def word_set(text: str) -> Set[str]:
+    """Lower-cased word shingles of a text"""
+    return set(_WORD_RE.findall(text.lower())) if text else set()
+
+
+def overlap_similarity(a: Set[str], b: Set[str]) -> float:
+    """Shared words over the larger set - the measure the aggregator has always used"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / max(len(a), len(b))
+
+
+def band_keys(words: Set[str]) -> List[bytes]:
+    """LSH bucket keys of the MinHash signature of a word set"""
+    hashes = np.fromiter((zlib.crc32(w.encode("utf-8")) for w in words), dtype=np.uint64, count=len(words))
+    signature = ((np.outer(_HASH_A, hashes) + _HASH_B[:, None]) % _MERSENNE_PRIME).min(axis=1)
+    r = ROWS_PER_BAND
+    return [bytes([band]) + signature[band * r:(band + 1) * r].tobytes() for band in range(NUM_PERM // r)]
+
+
+class ArticleFingerprint:
+    """Everything dedup needs to know about an article, computed once"""
+    __slots__ = ("canonical_url", "title_words", "title_keys", "description_words", "description_keys")
+
+    def __init__(self, article: Dict):
+        self.canonical_url = canonicalize_url(article.get("url", ""))
+        self.title_words = word_set(article.get("title", ""))
+        self.title_keys = band_keys(self.title_words) if self.title_words else []
+
+        description_words = word_set(article.get("description", ""))
+        if len(description_words) >= MIN_DESCRIPTION_WORDS:
+            self.description_words = description_words
+            self.description_keys = band_keys(description_words)
+        else:
+            self.description_words = None
+            self.description_keys = None
+
+
+class NearDuplicateIndex:
+    """
+    Incremental near-duplicate index over article titles, descriptions and URLs.
+
+    Each title/description is reduced to a MinHash signature and bucketed by LSH
+    banding, so a new article is only compared against the few earlier articles
+    that share a bucket instead of against every one of them. Candidates are
+    confirmed with the exact word-overlap measure, so `threshold` keeps its old
+    meaning (0.7 = 70% of words shared). Articles with the same canonical URL
+    are always duplicates.
+
+    Pass the shared SeenArticleIndex as `seen_index` to reuse fingerprints
+    computed by earlier requests.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, seen_index=None):
+        self.threshold = threshold if threshold is not None else float(os.getenv("DEDUP_SIMILARITY", "0.7"))
+        self.seen_index = seen_index
+
+        self._urls: Set[str] = set()
+        self._fingerprints: List[ArticleFingerprint] = []
+        self._title_buckets: Dict[bytes, List[int]] = {}
+        self._description_buckets: Dict[bytes, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def add(self, article: Dict) -> bool:
+        """Index an article unless it duplicates one already seen; returns True if added"""
+        if self.seen_index is not None:
+            fp = self.seen_index.fingerprint(article)
+        else:
+            fp = ArticleFingerprint(article)
+        if not fp.title_words:
+            return False
+        if fp.canonical_url and fp.canonical_url in self._urls:
+            return False
+
+        if self._has_near_duplicate(self._title_buckets, fp.title_keys, fp.title_words, "title_words"):
+            return False
+        if fp.description_words and self._has_near_duplicate(
+                self._description_buckets, fp.description_keys, fp.description_words, "description_words"):
+            return False
+
+        doc_id = len(self._fingerprints)
+        self._fingerprints.append(fp)
+        if fp.canonical_url:
+            self._urls.add(fp.canonical_url)
+        for key in fp.title_keys:
+            self._title_buckets.setdefault(key, []).append(doc_id)
+        for key in fp.description_keys or ():
+            self._description_buckets.setdefault(key, []).append(doc_id)
+        return True
+
+    def _has_near_duplicate(self, buckets: Dict[bytes, List[int]], keys: List[bytes], words: Set[str], field: str) -> bool:
+        checked = set()
+        for key in keys:
+            for doc_id in buckets.get(key, ()):
+                if doc_id in checked:
+                    continue
+                checked.add(doc_id)
+                if overlap_similarity(words, getattr(self._fingerprints[doc_id], field)) > self.threshold:
+                    return True
+        return False
+
+
+def remove_near_duplicates(articles: List[Dict], threshold: Optional[float] = None, seen_index=None) -> List[Dict]:
+    """Return articles in order with near-duplicates (title, description or URL) removed"""
+    index = NearDuplicateIndex(threshold, seen_index)
+    return [article for article in articles if index.add(article)]
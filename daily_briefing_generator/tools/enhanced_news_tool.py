@@ -1,19 +1,67 @@
 # tools/enhanced_news_tool.py - Comprehensive Multi-API News System
 import asyncio
 import aiohttp
-import feedparser
+import contextvars
 import os
 import json
-from typing import Dict, List, Any
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+try:
+    from tools.http_pool import HTTPConnectionPool, get_http_pool
+    from tools.circuit_breaker import get_circuit_breaker, classify_status, TRANSIENT_COOLDOWN
+    from tools.quota import get_quota_manager
+    from tools.latency import get_latency_tracker
+    from tools.feed_parser_pool import get_feed_parser_pool
+    from tools.stream_feed_parser import StreamingFeedParser
+    from tools.dedup import NearDuplicateIndex
+    from tools.seen_index import get_seen_index
+    from tools.timestamps import stamp_articles, age_cutoff, filter_by_age
+    from tools.article import Article, as_dicts
+    from tools.ranking import rank_articles
+    from tools.query import keyword_query, normalize_keywords
+    from tools.providers import ProviderPlan, get_capabilities, plan_call
+    from tools.yield_tracker import get_yield_tracker
+    from tools.news_cache import get_news_cache, news_cache_key
+except ImportError:
+    from http_pool import HTTPConnectionPool, get_http_pool
+    from circuit_breaker import get_circuit_breaker, classify_status, TRANSIENT_COOLDOWN
+    from quota import get_quota_manager
+    from latency import get_latency_tracker
+    from feed_parser_pool import get_feed_parser_pool
+    from stream_feed_parser import StreamingFeedParser
+    from dedup import NearDuplicateIndex
+    from seen_index import get_seen_index
+    from timestamps import stamp_articles, age_cutoff, filter_by_age
+    from article import Article, as_dicts
+    from ranking import rank_articles
+    from query import keyword_query, normalize_keywords
+    from providers import ProviderPlan, get_capabilities, plan_call
+    from yield_tracker import get_yield_tracker
+    from news_cache import get_news_cache, news_cache_key
+
 # Load environment variables
 load_dotenv()
 
+# get_comprehensive_news modes: wait for every provider, or stop once enough articles arrive
+MODE_COMPLETE = "complete"
+MODE_FIRST_SUFFICIENT = "first_sufficient"
+
+# Monotonic time by which the current get_comprehensive_news call must finish (None = no deadline)
+_deadline_at = contextvars.ContextVar("news_deadline_at", default=None)
+
+# Failed requests of the provider call running in the current task (see _tracked_call)
+_call_failures = contextvars.ContextVar("news_call_failures", default=None)
+
 class MultiSourceNewsAggregator:
-    def __init__(self):
+    def __init__(self, http_pool: HTTPConnectionPool = None):
         """Enhanced news aggregator using multiple APIs and sources for maximum coverage"""
+        # Shared keep-alive connection pool (injected by the web app lifespan)
+        self.http_pool = http_pool or get_http_pool()
+        
         # Multiple News APIs
         self.news_api_key = os.getenv("NEWS_API_KEY")  # newsapi.org
         self.newsdata_api_key = os.getenv("NEWSDATA_API_KEY")  # newsdata.io
@@ -23,6 +71,13 @@ class MultiSourceNewsAggregator:
         self.worldnews_api_key = os.getenv("WORLDNEWS_API_KEY") or os.getenv("WORLD_NEWS_API_KEY")  # worldnewsapi.com
         self.newscatcher_api_key = os.getenv("NEWSCATCHER_API_KEY")  # newscatcherapi.com
         
+        # RSS fan-out: how many feeds to request at once and the shared deadline (seconds)
+        self.rss_feed_budget = int(os.getenv("RSS_FEED_BUDGET", "8"))
+        self.rss_deadline = float(os.getenv("RSS_DEADLINE", "6"))
+        
+        # Articles older than this are dropped (0 = keep everything)
+        self.max_age_hours = float(os.getenv("NEWS_MAX_AGE_HOURS", "72"))
+        
         # Enhanced RSS feeds for different categories and regions
         self.rss_feeds = {
             "general": {
@@ -105,99 +160,305 @@ class MultiSourceNewsAggregator:
     async def get_comprehensive_news(self, 
                                    category: str = "general",
                                    region: str = "global",
-                                   max_articles: int = 10) -> Dict[str, Any]:
+                                   max_articles: int = 10,
+                                   mode: str = MODE_COMPLETE,
+                                   deadline: float = None,
+                                   since: int = None,
+                                   max_age_hours: float = None,
+                                   keywords: List[str] = None,
+                                   location: str = None) -> Dict[str, Any]:
         """
         Get news from multiple sources with comprehensive coverage
         Uses multiple APIs and RSS feeds for maximum reliability
-        """
-        all_articles = []
-        sources_tried = []
-        apis_used = []
-        
-        # Strategy 1: Try multiple news APIs in parallel
-        api_tasks = []
-        
-        # GNews API (usually most reliable)
-        if self.gnews_api_key:
-            api_tasks.append(self._fetch_from_gnews(category, region, max_articles // 2))
-        
-        # NewsAPI.org
-        if self.news_api_key:
-            api_tasks.append(self._fetch_from_newsapi(category, region, max_articles // 2))
-        
-        # NewsData.io
-        if self.newsdata_api_key:
-            api_tasks.append(self._fetch_from_newsdata(category, region, max_articles // 2))
-        
-        # MediaStack
-        if self.mediastack_api_key:
-            api_tasks.append(self._fetch_from_mediastack(category, region, max_articles // 2))
-        
-        # Currents API
-        if self.currents_api_key:
-            api_tasks.append(self._fetch_from_currents(category, region, max_articles // 2))
         
-        # WorldNews API
-        if self.worldnews_api_key:
-            api_tasks.append(self._fetch_from_worldnews(category, region, max_articles // 2))
-        
-        # NewsCatcher API
-        if self.newscatcher_api_key:
-            api_tasks.append(self._fetch_from_newscatcher(category, region, max_articles // 2))
+        mode="complete" waits for every provider; mode="first_sufficient" returns as soon
+        as max_articles unique articles have arrived and cancels the slower providers.
+        deadline (seconds) caps every provider timeout to the time left in this call.
+        since (UTC epoch seconds, e.g. the previous briefing) and max_age_hours drop older
+        articles; articles carry a numeric published_ts and come back best-ranked first.
+        keywords and location (e.g. a city) are sent to every provider's native search
+        parameter so filtering happens server-side, and feed into the final ranking.
+        
+        With ENABLE_CACHE, results are shared through the process-wide news cache
+        (tools/news_cache.py): identical requests within CACHE_TTL, or in flight at the
+        same time, reuse one fan-out; `since` is then applied to the cached articles.
+        Results cut short by the deadline are not cached, and first_sufficient results
+        are only shared with other first_sufficient callers.
+        """
+        if max_age_hours is None:
+            max_age_hours = self.max_age_hours
+        keywords = normalize_keywords(keywords)
+        location = self._location_term(location, region)
         
-        # Execute API calls in parallel
-        if api_tasks:
+        async def fetch(cutoff: int) -> Dict[str, Any]:
+            token = _deadline_at.set(time.monotonic() + deadline if deadline is not None else None)
             try:
-                api_results = await asyncio.gather(*api_tasks, return_exceptions=True)
-                for i, result in enumerate(api_results):
-                    if isinstance(result, dict) and result.get('articles'):
-                        all_articles.extend(result['articles'])
-                        if i == 0 and self.gnews_api_key: apis_used.append("GNews")
-                        elif i == 1 and self.news_api_key: apis_used.append("NewsAPI") 
-                        elif i == 2 and self.newsdata_api_key: apis_used.append("NewsData")
-                        elif i == 3 and self.mediastack_api_key: apis_used.append("MediaStack")
-                        elif i == 4 and self.currents_api_key: apis_used.append("Currents")
-                        elif i == 5 and self.worldnews_api_key: apis_used.append("WorldNews")
-                        elif i == 6 and self.newscatcher_api_key: apis_used.append("NewsCatcher")
-            except Exception as e:
-                print(f"Error in parallel API calls: {e}")
-        
-        # Strategy 2: RSS feeds (very reliable fallback)
-        if len(all_articles) < max_articles:
-            rss_articles = await self._fetch_from_rss(category, region, max_articles - len(all_articles))
-            if rss_articles:
-                all_articles.extend(rss_articles)
-                sources_tried.append("RSS")
-        
-        # Strategy 3: Try alternative regions if needed
-        if len(all_articles) < max_articles // 2:
-            fallback_regions = ["global", "us", "india", "uk"]
-            for fallback_region in fallback_regions:
-                if fallback_region != region:
-                    fallback_articles = await self._fetch_from_rss(category, fallback_region, max_articles - len(all_articles))
-                    if fallback_articles:
-                        all_articles.extend(fallback_articles)
+                return await self._collect_news(category, region, max_articles, mode, cutoff, keywords, location)
+            finally:
+                _deadline_at.reset(token)
+        
+        cache = get_news_cache()
+        if not cache.enabled:
+            return await fetch(age_cutoff(since, max_age_hours))
+        
+        key = news_cache_key(category, region, keywords, max_articles, location, max_age_hours, mode)
+        result = await cache.get_or_fetch(key, lambda: fetch(age_cutoff(None, max_age_hours)))
+        if since:
+            result["articles"] = filter_by_age(result.get("articles", []), age_cutoff(since, max_age_hours))
+        return result
+    
+    async def _collect_news(self, category: str, region: str, max_articles: int, mode: str,
+                            cutoff: int = 0, keywords: List[str] = None, location: str = None) -> Dict[str, Any]:
+        """Run the provider, RSS and fallback-region strategies for get_comprehensive_news"""
+        sources_tried = []
+        apis_used = []
+        apis_cancelled = []
+        
+        # Strategy 1: Try multiple news APIs in parallel, skipping providers that have
+        # stopped yielding for this category/region or cannot serve it, whose breaker is
+        # open or whose rate/daily budget is spent (RSS covers the gap). Each provider is
+        # asked for its share of the articles based on what it contributed before.
+        api_tasks = {}
+        requested = {}
+        apis_skipped = {}
+        quota = get_quota_manager()
+        yields = get_yield_tracker()
+        fetchers = []
+        for provider, fetcher in self._get_api_fetchers():
+            call, reason = yields.should_call(provider, category, region)
+            if call:
+                fetchers.append((provider, fetcher))
+            else:
+                apis_skipped[provider] = f"low yield: {reason}"
+        allocation = yields.allocate([provider for provider, _ in fetchers], category, region,
+                                     max_articles, default=max_articles // 2)
+        for provider, fetcher in fetchers:
+            plan, reason = plan_call(provider, category, region, allocation[provider])
+            if plan is None:
+                apis_skipped[provider] = f"unsupported: {reason}"
+                continue
+            breaker = get_circuit_breaker(provider)
+            if not breaker.allow_request():
+                apis_skipped[provider] = breaker.last_failure_reason
+                continue
+            allowed, reason = quota.try_acquire(provider)
+            if not allowed:
+                breaker.release_probe()
+                apis_skipped[provider] = f"quota: {reason}"
+                continue
+            task = asyncio.create_task(self._tracked_call(fetcher, category, region, plan.page_size,
+                                                          keywords, location, plan=plan))
+            api_tasks[task] = provider
+            requested[task] = plan.page_size
+        
+        # Consume provider results as they complete, deduplicating incrementally
+        # (fingerprints of articles seen by earlier requests are reused)
+        dedup_index = NearDuplicateIndex(seen_index=get_seen_index())
+        unique_articles = []
+        pending = set(api_tasks)
+        deadline_reached = False
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=self._remaining_time(),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            out_of_time = not done
+            deadline_reached = deadline_reached or out_of_time
+            for task in done:
+                provider = api_tasks[task]
+                try:
+                    result, failed = task.result()
+                    raw_articles = self._articles_from_result(result)
+                    self._drop_teasers(provider, raw_articles)
+                    articles = self._ingest(raw_articles, cutoff)
+                except Exception as e:
+                    print(f"Error in {provider} API call: {e}")
+                    yields.record(provider, category, region, requested[task], failed=True)
+                    continue
+                added = [a for a in articles if dedup_index.add(a)]
+                if articles:
+                    apis_used.append(provider)
+                    unique_articles.extend(added)
+                fresh_cutoff = yields.fresh_cutoff()
+                yields.record(provider, category, region, requested[task], len(raw_articles), len(added),
+                              sum(1 for a in added if (a.get("published_ts") or 0) >= fresh_cutoff),
+                              failed=failed)
+            
+            enough = mode == MODE_FIRST_SUFFICIENT and len(unique_articles) >= max_articles
+            if pending and (enough or out_of_time):
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                apis_cancelled = [api_tasks[task] for task in pending]
+                break
+        
+        # Feeds downloaded during this request, shared by the RSS and fallback-region stages;
+        # a feed one stage stopped waiting for may still arrive in time for the next
+        feed_cache = {}
+        try:
+            # Strategy 2: RSS feeds (very reliable fallback, also absorbs quota-skipped providers)
+            if len(unique_articles) < max_articles:
+                rss_articles = await self._fetch_from_rss(category, region, max_articles - len(unique_articles),
+                                                          feed_cache=feed_cache)
+                rss_articles = self._ingest(rss_articles, cutoff)
+                if rss_articles:
+                    unique_articles.extend(a for a in rss_articles if dedup_index.add(a))
+                    sources_tried.append("RSS")
+            
+            # Strategy 3: Try alternative regions concurrently if needed, preferring the
+            # earlier regions in the list and reusing any feed already downloaded
+            if len(unique_articles) < max_articles // 2:
+                fallback_regions = [r for r in ["global", "us", "india", "uk"] if r != region]
+                needed = max_articles - len(unique_articles)
+                region_results = await asyncio.gather(
+                    *[self._fetch_from_rss(category, r, needed, feed_cache=feed_cache) for r in fallback_regions],
+                    return_exceptions=True
+                )
+                for fallback_region, fallback_articles in zip(fallback_regions, region_results):
+                    if isinstance(fallback_articles, list):
+                        fallback_articles = self._ingest(fallback_articles, cutoff)
+                    if isinstance(fallback_articles, list) and fallback_articles:
+                        added = [a for a in fallback_articles if dedup_index.add(a)]
+                        unique_articles.extend(added)
                         sources_tried.append(f"RSS-{fallback_region}")
-                        break
-        
-        # Remove duplicates and sort by publish date
-        unique_articles = self._remove_duplicates(all_articles)
-        sorted_articles = sorted(unique_articles, key=lambda x: x.get('published_at', ''), reverse=True)
+                        needed -= len(added)
+                        if needed <= 0:
+                            break
+        finally:
+            await self._cancel_feeds(feed_cache.values())
+        
+        # Keep the best of the deduplicated articles: BM25 relevance to the category and
+        # region, blended with freshness and source weight (best first)
+        ranked_articles = rank_articles(unique_articles, category, keywords,
+                                        location=location or self._get_country_name(region), top_k=max_articles)
+        remaining = self._remaining_time()
+        deadline_reached = deadline_reached or (remaining is not None and remaining <= 0)
         
         return {
             "status": "success",
-            "total_results": len(sorted_articles),
-            "articles": sorted_articles[:max_articles],
+            "total_results": len(unique_articles),
+            "articles": ranked_articles,
             "apis_used": apis_used,
             "sources_used": sources_tried,
+            "apis_cancelled": apis_cancelled,
+            "apis_skipped": apis_skipped,
+            "mode": mode,
+            "deadline_reached": deadline_reached,
             "timestamp": datetime.now().isoformat()
         }
     
-    async def _fetch_from_rss(self, category: str, region: str, max_articles: int) -> List[Dict]:
-        """Fetch news from RSS feeds"""
+    def _get_api_fetchers(self) -> List[tuple]:
+        """List (provider name, fetch method) for every news API with a configured key"""
+        fetchers = [
+            ("GNews", self.gnews_api_key, self._fetch_from_gnews),  # usually most reliable
+            ("NewsAPI", self.news_api_key, self._fetch_from_newsapi),
+            ("NewsData", self.newsdata_api_key, self._fetch_from_newsdata),
+            ("MediaStack", self.mediastack_api_key, self._fetch_from_mediastack),
+            ("Currents", self.currents_api_key, self._fetch_from_currents),
+            ("WorldNews", self.worldnews_api_key, self._fetch_from_worldnews),
+            ("NewsCatcher", self.newscatcher_api_key, self._fetch_from_newscatcher),
+        ]
+        return [(name, fetcher) for name, api_key, fetcher in fetchers if api_key]
+    
+    async def _tracked_call(self, fetcher, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Run a provider fetcher in its own task and return (result, failed). Fetchers
+        swallow their errors, so _get_json notes this call's failed requests instead.
+        """
+        failures = []
+        token = _call_failures.set(failures)
+        try:
+            result = await fetcher(*args, **kwargs)
+        finally:
+            _call_failures.reset(token)
+        return result, bool(failures)
+    
+    def _location_term(self, location: str, region: str) -> str:
+        """Location to search for, unless it only repeats the region the providers already filter on"""
+        if not location or location.lower() in ("default", "none", region.lower(),
+                                                 (self._get_country_name(region) or "").lower()):
+            return None
+        return location.strip()
+    
+    def _plan(self, provider: str, category: str, region: str, max_articles: int,
+              plan: ProviderPlan = None) -> ProviderPlan:
+        """The given call plan, or a fresh one for direct fetcher calls (None if unsupported)"""
+        if plan is None:
+            plan, reason = plan_call(provider, category, region, max_articles)
+            if plan is None:
+                print(f"Skipping {provider}: {reason}")
+        return plan
+    
+    def _ingest(self, articles: List[Dict], cutoff: int) -> List[Dict]:
+        """Give articles a numeric published_ts and drop those older than cutoff"""
+        stamp_articles(articles)
+        return filter_by_age(articles, cutoff)
+    
+    def _drop_teasers(self, provider: str, articles: List[Dict]) -> None:
+        """Clear the truncated "content" teaser of providers without full content (see ProviderCapabilities)"""
+        caps = get_capabilities(provider)
+        if caps is None or caps.full_content:
+            return
+        for article in articles:
+            article["content"] = None  # content then falls back to the description
+    
+    def _articles_from_result(self, result: Any) -> List[Dict]:
+        """Fetchers return either {"articles": [...]} or a bare list"""
+        if isinstance(result, dict):
+            return result.get("articles", [])
+        return result or []
+    
+    async def _fetch_from_rss(self, category: str, region: str, max_articles: int,
+                              deadline: float = None, feed_cache: Dict[str, asyncio.Task] = None) -> List[Dict]:
+        """
+        Fetch news from RSS feeds concurrently.
+        All feeds in the budget are requested at once under one shared deadline;
+        whatever has arrived when it expires is returned and stragglers are cancelled.
+        feed_cache (feed URL -> fetch task) lets callers share downloads within a request;
+        its tasks may still be awaited by other callers, so they are left running and
+        the cache's owner cancels what is left once every caller is done.
+        """
+        feeds = self._get_rss_feeds(category, region)[:self.rss_feed_budget]
+        remaining = self._remaining_time()
+        if not feeds or (remaining is not None and remaining <= 0):
+            return []
+        
+        deadline = deadline or self.rss_deadline
+        if remaining is not None:
+            deadline = min(deadline, remaining)
+        
+        own_cache = feed_cache is None
+        if own_cache:
+            feed_cache = {}
+        tasks = []
+        for feed_url in feeds:
+            task = feed_cache.get(feed_url)
+            if task is None:
+                task = feed_cache[feed_url] = asyncio.create_task(self._fetch_rss_feed(feed_url, max_articles))
+            tasks.append(task)
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        
+        if pending:
+            print(f"RSS deadline reached, dropped {len(pending)} slow feed(s)")
+            if own_cache:
+                await self._cancel_feeds(pending)
+        
+        # Keep configured feed order so preferred sources come first
         articles = []
+        for task in tasks:
+            if task in done and not task.cancelled() and task.exception() is None:
+                articles.extend(task.result())
         
-        # Get appropriate RSS feeds
+        return articles
+    
+    async def _cancel_feeds(self, tasks) -> None:
+        """Cancel feed downloads nobody waits for any more"""
+        tasks = [task for task in tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _get_rss_feeds(self, category: str, region: str) -> List[str]:
+        """Get the RSS feeds configured for a category/region, with fallbacks"""
         feeds = []
         if category in self.rss_feeds:
             if region in self.rss_feeds[category]:
@@ -212,316 +473,403 @@ class MultiSourceNewsAggregator:
             else:
                 feeds.extend(self.rss_feeds["general"]["global"])
         
-        # Fetch from each RSS feed
-        for feed_url in feeds[:3]:  # Limit to 3 feeds to avoid too many requests
+        return feeds
+    
+    async def _fetch_rss_feed(self, feed_url: str, max_articles: int) -> List[Dict]:
+        """
+        Fetch a single RSS feed, parsing it incrementally as the body arrives and
+        closing the connection once max_articles entries are collected. Malformed
+        or unrecognized feeds fall back to feedparser on the parser pool.
+        Redirector links (feedburner) are resolved to the publisher URL.
+        """
+        try:
+            articles = await self._download_rss_feed(feed_url, max_articles)
+            await get_seen_index().resolve_links(articles)
+            return articles
+        except Exception as e:
+            print(f"RSS feed error for {feed_url}: {e}")
+        
+        return []
+    
+    async def _download_rss_feed(self, feed_url: str, max_articles: int) -> List[Dict]:
+        session = await self.http_pool.get_session()
+        async with session.get(feed_url, timeout=aiohttp.ClientTimeout(total=self.rss_deadline)) as response:
+            if response.status != 200:
+                return []
+            
+            parser = StreamingFeedParser(max_articles)
+            received = bytearray()
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(feed_url, timeout=10) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            feed = feedparser.parse(content)
-                            
-                            for entry in feed.entries[:max_articles]:
-                                articles.append({
-                                    "title": entry.get("title", ""),
-                                    "description": entry.get("summary", entry.get("description", "")),
-                                    "url": entry.get("link", ""),
-                                    "published_at": entry.get("published", ""),
-                                    "source": {"name": feed.feed.get("title", "RSS Source")},
-                                    "content": entry.get("content", [{}])[0].get("value", "") if entry.get("content") else ""
-                                })
-            except Exception as e:
-                print(f"RSS feed error for {feed_url}: {e}")
-                continue
+                async for chunk in response.content.iter_chunked(16384):
+                    received.extend(chunk)
+                    parser.feed(chunk)
+                    if parser.done:
+                        return parser.articles  # stop reading the socket
+                parser.close()
+                if parser.articles:
+                    return parser.articles
+            except ET.ParseError:
+                received.extend(await response.read())
+            raw = bytes(received)
+        return await get_feed_parser_pool().parse(raw, max_articles)
+    
+    def _remaining_time(self) -> float:
+        """Seconds left before the current request's deadline, or None"""
+        deadline_at = _deadline_at.get()
+        return None if deadline_at is None else deadline_at - time.monotonic()
+    
+    async def _get_json(self, provider: str, url: str, params: Dict = None, headers: Dict = None,
+                        timeout: float = None) -> Any:
+        """
+        GET a JSON document through the shared connection pool; returns None on non-200.
+        Every outcome is reported to the provider's circuit breaker. Unless given, the
+        timeout comes from the provider's observed p95 latency and the remaining deadline.
+        """
+        latency = get_latency_tracker()
+        if timeout is None:
+            timeout = latency.timeout_for(provider, self._remaining_time())
         
-        return articles
+        breaker = get_circuit_breaker(provider)
+        session = await self.http_pool.get_session()
+        started = time.monotonic()
+        try:
+            async with session.get(url, params=params, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                failure = classify_status(response.status)
+                if failure is None:
+                    data = await response.json()
+                    # Headers and body: the timeout has to cover both
+                    latency.record(provider, time.monotonic() - started)
+                    breaker.record_success()
+                    return data
+                
+                latency.record(provider, time.monotonic() - started)
+                reason, cooldown, trip = failure
+                retry_after = response.headers.get("Retry-After", "")
+                if trip and retry_after.isdigit():
+                    cooldown = int(retry_after)
+                breaker.record_failure(reason, cooldown=cooldown, trip=trip)
+                self._note_failure(reason)
+                print(f"{provider} API returned {reason}")
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except asyncio.TimeoutError:
+            latency.record_timeout(provider, timeout)
+            breaker.record_failure(f"timeout after {timeout:.1f}s", cooldown=TRANSIENT_COOLDOWN)
+            self._note_failure("timeout")
+            raise
+        except Exception as e:
+            breaker.record_failure(f"{type(e).__name__}: {e}", cooldown=TRANSIENT_COOLDOWN)
+            self._note_failure(type(e).__name__)
+            raise
+        return None
     
-    async def _fetch_from_gnews(self, category: str, region: str, max_articles: int) -> Dict[str, Any]:
+    def _note_failure(self, reason: str) -> None:
+        """Mark the provider call running in this task as failed (see _tracked_call)"""
+        failures = _call_failures.get()
+        if failures is not None:
+            failures.append(reason)
+    
+    async def _fetch_from_gnews(self, category: str, region: str, max_articles: int,
+                                keywords: List[str] = None, location: str = None,
+                                plan: ProviderPlan = None) -> Dict[str, Any]:
         """Fetch from GNews API - usually most reliable"""
-        if not self.gnews_api_key:
+        plan = self._plan("GNews", category, region, max_articles, plan)
+        if not self.gnews_api_key or plan is None:
             return {"articles": []}
         
         try:
-            country_code = self._get_country_code(region)
+            params = {
+                "token": self.gnews_api_key,
+                "lang": "en",
+                "country": plan.country,
+                "category": plan.provider_category,
+                "max": plan.page_size,
+                "q": keyword_query(keywords, location, required=plan.search_terms),
+            }
+            params = {k: v for k, v in params.items() if v}  # Remove empty values
             
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "token": self.gnews_api_key,
-                    "lang": "en",
-                    "country": country_code,
-                    "max": min(max_articles, 10),
-                    "q": category if category != "general" else "",
-                }
-                params = {k: v for k, v in params.items() if v}  # Remove empty values
-                
-                async with session.get("https://gnews.io/api/v4/top-headlines", params=params, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("articles", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("description", ""),
-                                "url": article.get("url", ""),
-                                "published_at": article.get("publishedAt", ""),
-                                "source": {"name": article.get("source", {}).get("name", "GNews")},
-                                "content": article.get("content", "")
-                            })
-                        return {"articles": articles}
+            data = await self._get_json("GNews", "https://gnews.io/api/v4/top-headlines", params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("articles", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("description", ""),
+                        url=article.get("url", ""),
+                        published_at=article.get("publishedAt", ""),
+                        source_name=article.get("source", {}).get("name", "GNews"),
+                        content=article.get("content", "")
+                    ))
+                return {"articles": articles}
         except Exception as e:
             print(f"GNews API error: {e}")
         
         return {"articles": []}
     
-    async def _fetch_from_mediastack(self, category: str, region: str, max_articles: int) -> Dict[str, Any]:
+    async def _fetch_from_mediastack(self, category: str, region: str, max_articles: int,
+                                     keywords: List[str] = None, location: str = None,
+                                     plan: ProviderPlan = None) -> Dict[str, Any]:
         """Fetch from MediaStack API"""
-        if not self.mediastack_api_key:
+        plan = self._plan("MediaStack", category, region, max_articles, plan)
+        if not self.mediastack_api_key or plan is None:
             return {"articles": []}
         
         try:
-            countries = self._get_mediastack_countries(region)
+            params = {
+                "access_key": self.mediastack_api_key,
+                "limit": plan.page_size,
+                "languages": "en",
+                "sort": "published_desc"
+            }
+            if plan.country:
+                params["countries"] = plan.country
+            if plan.provider_category:
+                params["categories"] = plan.provider_category
+            search = keyword_query(keywords, location, boolean=False, required=plan.search_terms)
+            if search:
+                params["keywords"] = search
             
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "access_key": self.mediastack_api_key,
-                    "countries": countries,
-                    "limit": min(max_articles, 25),
-                    "languages": "en",
-                    "sort": "published_desc"
-                }
-                if category != "general":
-                    params["categories"] = category
-                
-                async with session.get("http://api.mediastack.com/v1/news", params=params, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("data", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("description", ""),
-                                "url": article.get("url", ""),
-                                "published_at": article.get("published_at", ""),
-                                "source": {"name": article.get("source", "MediaStack")},
-                                "content": article.get("description", "")  # MediaStack doesn't provide full content
-                            })
-                        return {"articles": articles}
+            data = await self._get_json("MediaStack", "http://api.mediastack.com/v1/news", params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("data", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("description", ""),
+                        url=article.get("url", ""),
+                        published_at=article.get("published_at", ""),
+                        source_name=article.get("source", "MediaStack")  # no full content; Article falls back to the description
+                    ))
+                return {"articles": articles}
         except Exception as e:
             print(f"MediaStack API error: {e}")
         
         return {"articles": []}
     
-    async def _fetch_from_currents(self, category: str, region: str, max_articles: int) -> Dict[str, Any]:
+    async def _fetch_from_currents(self, category: str, region: str, max_articles: int,
+                                   keywords: List[str] = None, location: str = None,
+                                   plan: ProviderPlan = None) -> Dict[str, Any]:
         """Fetch from Currents API"""
-        if not self.currents_api_key:
+        plan = self._plan("Currents", category, region, max_articles, plan)
+        if not self.currents_api_key or plan is None:
             return {"articles": []}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "apiKey": self.currents_api_key,
-                    "language": "en",
-                    "page_size": min(max_articles, 200),
-                }
-                if region != "global":
-                    country_name = self._get_country_name(region)
-                    if country_name:
-                        params["keywords"] = f"{country_name} OR {category}"
-                else:
-                    params["keywords"] = category
-                
-                async with session.get("https://api.currentsapi.services/v1/search", params=params, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("news", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("description", ""),
-                                "url": article.get("url", ""),
-                                "published_at": article.get("published", ""),
-                                "source": {"name": article.get("author", "Currents")},
-                                "content": article.get("description", "")
-                            })
-                        return {"articles": articles}
+            params = {
+                "apiKey": self.currents_api_key,
+                "language": "en",
+                "page_size": plan.page_size,
+                "country": plan.country,
+                "category": plan.provider_category,
+                "keywords": keyword_query(keywords, location, boolean=False, required=plan.search_terms),
+            }
+            params = {k: v for k, v in params.items() if v}  # Remove empty values
+            
+            data = await self._get_json("Currents", "https://api.currentsapi.services/v1/search", params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("news", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("description", ""),
+                        url=article.get("url", ""),
+                        published_at=article.get("published", ""),
+                        source_name=article.get("author", "Currents")
+                    ))
+                return {"articles": articles}
         except Exception as e:
             print(f"Currents API error: {e}")
         
         return {"articles": []}
     
-    async def _fetch_from_worldnews(self, category: str, region: str, max_articles: int) -> Dict[str, Any]:
+    async def _fetch_from_worldnews(self, category: str, region: str, max_articles: int,
+                                    keywords: List[str] = None, location: str = None,
+                                    plan: ProviderPlan = None) -> Dict[str, Any]:
         """Fetch from WorldNews API"""
-        if not self.worldnews_api_key:
+        plan = self._plan("WorldNews", category, region, max_articles, plan)
+        if not self.worldnews_api_key or plan is None:
             return {"articles": []}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "api-key": self.worldnews_api_key,
-                    "number": min(max_articles, 100),
-                    "language": "en",
-                    "sort": "publish-time",
-                    "sort-direction": "DESC"
-                }
-                
-                # Add location-based filtering
-                if region == "india":
-                    params["location-filter"] = "IN"
-                elif region == "us":
-                    params["location-filter"] = "US"
-                elif region == "uk":
-                    params["location-filter"] = "GB"
-                
-                # Add category-based text filtering
-                if category != "general":
-                    params["text"] = category
-                
-                async with session.get("https://api.worldnewsapi.com/search-news", params=params, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("news", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("summary", ""),
-                                "url": article.get("url", ""),
-                                "published_at": article.get("publish_date", ""),
-                                "source": {"name": article.get("source_country", "WorldNews")},
-                                "content": article.get("text", "")
-                            })
-                        return {"articles": articles}
+            params = {
+                "api-key": self.worldnews_api_key,
+                "number": plan.page_size,
+                "language": "en",
+                "sort": "publish-time",
+                "sort-direction": "DESC"
+            }
+            
+            # Country of the publishing source and category, in WorldNews' vocabulary
+            if plan.country:
+                params["source-country"] = plan.country
+            if plan.provider_category:
+                params["categories"] = plan.provider_category
+            
+            # Add keyword text filtering
+            search = keyword_query(keywords, location, boolean=False, required=plan.search_terms)
+            if search:
+                params["text"] = search
+            
+            data = await self._get_json("WorldNews", "https://api.worldnewsapi.com/search-news", params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("news", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("summary", ""),
+                        url=article.get("url", ""),
+                        published_at=article.get("publish_date", ""),
+                        source_name=article.get("source_country", "WorldNews"),
+                        content=article.get("text", "")
+                    ))
+                return {"articles": articles}
         except Exception as e:
             print(f"WorldNews API error: {e}")
         
         return {"articles": []}
     
-    async def _fetch_from_newscatcher(self, category: str, region: str, max_articles: int) -> Dict[str, Any]:
+    async def _fetch_from_newscatcher(self, category: str, region: str, max_articles: int,
+                                      keywords: List[str] = None, location: str = None,
+                                      plan: ProviderPlan = None) -> Dict[str, Any]:
         """Fetch from NewsCatcher API"""
-        if not self.newscatcher_api_key:
+        plan = self._plan("NewsCatcher", category, region, max_articles, plan)
+        if not self.newscatcher_api_key or plan is None:
             return {"articles": []}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"x-api-key": self.newscatcher_api_key}
-                params = {
-                    "lang": "en",
-                    "page_size": min(max_articles, 100),
-                    "sort_by": "date"
-                }
-                
-                # Add country filtering
-                if region == "india":
-                    params["countries"] = "IN"
-                elif region == "us":
-                    params["countries"] = "US" 
-                elif region == "uk":
-                    params["countries"] = "GB"
-                
-                # Add category/topic filtering
-                if category != "general":
-                    params["q"] = category
-                
-                async with session.get("https://api.newscatcherapi.com/v2/search", 
-                                     params=params, headers=headers, timeout=15) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("articles", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("excerpt", ""),
-                                "url": article.get("link", ""),
-                                "published_at": article.get("published_date", ""),
-                                "source": {"name": article.get("clean_url", "NewsCatcher")},
-                                "content": article.get("summary", "")
-                            })
-                        return {"articles": articles}
+            headers = {"x-api-key": self.newscatcher_api_key}
+            params = {
+                "lang": "en",
+                "page_size": plan.page_size,
+            }
+            if plan.country:
+                params["countries"] = plan.country
+            if plan.provider_category:
+                params["topic"] = plan.provider_category
+            
+            # /search requires a query; without one, use the latest headlines for the topic
+            search = keyword_query(keywords, location, required=plan.search_terms)
+            if search:
+                url = "https://api.newscatcherapi.com/v2/search"
+                params["q"] = search
+                params["sort_by"] = "date"
+            else:
+                url = "https://api.newscatcherapi.com/v2/latest_headlines"
+            
+            data = await self._get_json("NewsCatcher", url, params=params, headers=headers)
+            if data is not None:
+                articles = []
+                for article in data.get("articles", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("excerpt", ""),
+                        url=article.get("link", ""),
+                        published_at=article.get("published_date", ""),
+                        source_name=article.get("clean_url", "NewsCatcher"),
+                        content=article.get("summary", "")
+                    ))
+                return {"articles": articles}
         except Exception as e:
             print(f"NewsCatcher API error: {e}")
         
         return {"articles": []}
     
-    async def _fetch_from_newsapi(self, category: str, region: str, max_articles: int) -> List[Dict]:
+    async def _fetch_from_newsapi(self, category: str, region: str, max_articles: int,
+                                  keywords: List[str] = None, location: str = None,
+                                  plan: ProviderPlan = None) -> List[Dict]:
         """Fetch from original News API with improved parameters"""
+        plan = self._plan("NewsAPI", category, region, max_articles, plan)
+        if plan is None:
+            return []
+        
         try:
-            country_code = self._get_country_code(region)
-            
-            async with aiohttp.ClientSession() as session:
-                # Try top headlines first
+            search = keyword_query(keywords, location, required=plan.search_terms)
+            if search:
+                # Keyword and country-name searches go to /everything, which covers far more
+                # sources but has no category filter (so the category becomes a search term)
+                if plan.provider_category and not keywords:
+                    search = keyword_query(keywords, location, required=plan.search_terms + [plan.provider_category])
+                url = "https://newsapi.org/v2/everything"
+                params = {
+                    "apiKey": self.news_api_key,
+                    "q": search,
+                    "language": "en",
+                    "sortBy": "publishedAt",
+                    "pageSize": plan.page_size,
+                    "from": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+                }
+            else:
+                # Otherwise top headlines
+                url = "https://newsapi.org/v2/top-headlines"
                 params = {
                     "apiKey": self.news_api_key,
-                    "country": country_code,
-                    "category": category if category != "general" else None,
-                    "pageSize": max_articles
+                    "country": plan.country,
+                    "category": plan.provider_category,
+                    "pageSize": plan.page_size
                 }
                 params = {k: v for k, v in params.items() if v is not None}
-                
-                async with session.get("https://newsapi.org/v2/top-headlines", params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("articles", []):
-                            if article.get("title") and "[Removed]" not in article.get("title", ""):
-                                articles.append({
-                                    "title": article["title"],
-                                    "description": article.get("description", ""),
-                                    "url": article.get("url", ""),
-                                    "published_at": article.get("publishedAt", ""),
-                                    "source": article.get("source", {}),
-                                    "content": article.get("content", "")
-                                })
-                        return articles
+            
+            data = await self._get_json("NewsAPI", url, params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("articles", []):
+                    if article.get("title") and "[Removed]" not in article.get("title", ""):
+                        articles.append(Article(
+                            title=article["title"],
+                            description=article.get("description", ""),
+                            url=article.get("url", ""),
+                            published_at=article.get("publishedAt", ""),
+                            source_name=article.get("source", {}).get("name", "NewsAPI"),
+                            content=article.get("content", "")
+                        ))
+                return articles
         except Exception as e:
             print(f"NewsAPI error: {e}")
         
         return []
     
-    async def _fetch_from_newsdata(self, category: str, region: str, max_articles: int) -> List[Dict]:
+    async def _fetch_from_newsdata(self, category: str, region: str, max_articles: int,
+                                   keywords: List[str] = None, location: str = None,
+                                   plan: ProviderPlan = None) -> List[Dict]:
         """Fetch from NewsData.io API"""
-        if not self.newsdata_api_key:
+        plan = self._plan("NewsData", category, region, max_articles, plan)
+        if not self.newsdata_api_key or plan is None:
             return []
         
         try:
-            country_code = self._get_country_code(region)
+            params = {
+                "apikey": self.newsdata_api_key,
+                "language": "en",
+                "size": plan.page_size
+            }
+            if plan.provider_category:
+                params["category"] = plan.provider_category
+            if plan.country:
+                params["country"] = plan.country
+            search = keyword_query(keywords, location, required=plan.search_terms)
+            if search:
+                params["q"] = search
             
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "apikey": self.newsdata_api_key,
-                    "country": country_code,
-                    "category": category,
-                    "language": "en",
-                    "size": max_articles
-                }
-                
-                async with session.get("https://newsdata.io/api/1/news", params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        for article in data.get("results", []):
-                            articles.append({
-                                "title": article.get("title", ""),
-                                "description": article.get("description", ""),
-                                "url": article.get("link", ""),
-                                "published_at": article.get("pubDate", ""),
-                                "source": {"name": article.get("source_id", "NewsData")},
-                                "content": article.get("content", "")
-                            })
-                        return articles
+            data = await self._get_json("NewsData", "https://newsdata.io/api/1/news", params=params)
+            if data is not None:
+                articles = []
+                for article in data.get("results", []):
+                    articles.append(Article(
+                        title=article.get("title", ""),
+                        description=article.get("description", ""),
+                        url=article.get("link", ""),
+                        published_at=article.get("pubDate", ""),
+                        source_name=article.get("source_id", "NewsData"),
+                        content=article.get("content", "")
+                    ))
+                return articles
         except Exception as e:
             print(f"NewsData error: {e}")
         
         return []
     
-    def _get_country_code(self, region: str) -> str:
-        """Convert region to appropriate country code"""
-        region_map = {
-            "india": "in",
-            "us": "us",
-            "uk": "gb",
-            "global": "us"  # Default to US for global
-        }
-        return region_map.get(region.lower(), "us")
-    
     def _get_country_name(self, region: str) -> str:
         """Convert region to country name for APIs that need full names"""
         region_map = {
@@ -531,40 +879,6 @@ class MultiSourceNewsAggregator:
             "global": None
         }
         return region_map.get(region.lower())
-    
-    def _get_mediastack_countries(self, region: str) -> str:
-        """Get MediaStack-specific country codes"""
-        region_map = {
-            "india": "in",
-            "us": "us",
-            "uk": "gb",
-            "global": "us,gb,in,au,ca"  # Multiple countries for global
-        }
-        return region_map.get(region.lower(), "us")
-    
-    def _remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """Remove duplicate articles based on title similarity"""
-        seen_titles = set()
-        unique_articles = []
-        
-        for article in articles:
-            title = article.get("title", "").lower().strip()
-            # Simple duplicate detection
-            title_words = set(title.split())
-            is_duplicate = False
-            
-            for seen_title in seen_titles:
-                seen_words = set(seen_title.split())
-                # If 70% of words match, consider it a duplicate
-                if len(title_words & seen_words) / max(len(title_words), len(seen_words)) > 0.7:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate and title:
-                seen_titles.add(title)
-                unique_articles.append(article)
-        
-        return unique_articles
 
 
 # Enhanced wrapper function to maintain compatibility
@@ -572,7 +886,12 @@ async def get_news_data(
     query: str = "technology", 
     country: str = "us", 
     category: str = "general",
-    max_articles: int = 5
+    max_articles: int = 5,
+    mode: str = MODE_COMPLETE,
+    deadline: float = None,
+    since: int = None,
+    keywords: List[str] = None,
+    location: str = None
 ) -> Dict[str, Any]:
     """
     Enhanced news fetching using multiple sources for better coverage
@@ -588,13 +907,14 @@ async def get_news_data(
     }
     region = region_map.get(country, "global")
     
-    result = await aggregator.get_comprehensive_news(category, region, max_articles)
+    result = await aggregator.get_comprehensive_news(category, region, max_articles, mode=mode, deadline=deadline,
+                                                     since=since, keywords=keywords, location=location)
     
     # Convert to expected format
     return {
         "status": result["status"],
         "total_results": result["total_results"],
-        "articles": result["articles"],
+        "articles": as_dicts(result["articles"]),
         "apis_used": result.get("apis_used", []),
         "sources_used": result.get("sources_used", [])
     }
@@ -0,0 +1,144 @@
+# tools/feed_parser_pool.py - Off-event-loop RSS/Atom parsing on a bounded worker pool
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+import feedparser
+
+try:
+    from tools.article import Article
+except ImportError:
+    from article import Article
+
+
+def parse_feed(raw: bytes, max_entries: int) -> Tuple[List[Article], float]:
+    """
+    Parse a raw feed document into Articles.
+    Runs inside a worker; returns (articles, parse seconds). Module-level so it
+    can be pickled for a process pool.
+    """
+    started = time.perf_counter()
+    feed = feedparser.parse(raw)
+    source_name = feed.feed.get("title", "RSS Source")
+
+    articles = []
+    for entry in feed.entries[:max_entries]:
+        articles.append(Article(
+            title=entry.get("title", ""),
+            description=entry.get("summary", entry.get("description", "")),
+            url=entry.get("feedburner_origlink") or entry.get("link", ""),
+            published_at=entry.get("published", ""),
+            source_name=source_name,
+            content=entry.get("content", [{}])[0].get("value", "") if entry.get("content") else ""
+        ))
+    return articles, time.perf_counter() - started
+
+
+class FeedParserPool:
+    """
+    Bounded worker pool for feedparser, so large feeds never block the event loop.
+
+    At most `max_queue` parse jobs may be submitted at once; further callers wait
+    their turn on the event loop. FEED_PARSER_EXECUTOR=process isolates parsing
+    from the server process entirely (no GIL contention); the default thread pool
+    avoids process start-up and pickling costs.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None,
+                 executor_type: Optional[str] = None):
+        self.max_workers = max_workers or int(os.getenv("FEED_PARSER_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.max_queue = max_queue or int(os.getenv("FEED_PARSER_QUEUE", str(self.max_workers * 4)))
+        self.executor_type = (executor_type or os.getenv("FEED_PARSER_EXECUTOR", "thread")).lower()
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Metrics
+        self.jobs = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.waiting = 0
+        self.bytes_parsed = 0
+        self.total_parse_seconds = 0.0
+        self.max_parse_seconds = 0.0
+        self.total_queue_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="feed-parser")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_queue)
+            self._loop = loop
+        return self._semaphore
+
+    async def parse(self, raw: bytes, max_entries: int) -> List[Article]:
+        """Parse raw feed bytes on the worker pool and return Articles"""
+        semaphore = self._get_semaphore()
+        queued = time.perf_counter()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.total_queue_seconds += time.perf_counter() - queued
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            articles, parse_seconds = await loop.run_in_executor(self._get_executor(), parse_feed, raw, max_entries)
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+        self.jobs += 1
+        self.bytes_parsed += len(raw)
+        self.total_parse_seconds += parse_seconds
+        self.max_parse_seconds = max(self.max_parse_seconds, parse_seconds)
+        return articles
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Parse-time metrics for monitoring"""
+        return {
+            "executor": self.executor_type,
+            "workers": self.max_workers,
+            "queue_limit": self.max_queue,
+            "jobs": self.jobs,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "bytes_parsed": self.bytes_parsed,
+            "avg_parse_ms": round(self.total_parse_seconds / self.jobs * 1000, 2) if self.jobs else 0.0,
+            "max_parse_ms": round(self.max_parse_seconds * 1000, 2),
+            "avg_queue_ms": round(self.total_queue_seconds / self.jobs * 1000, 2) if self.jobs else 0.0
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers (used on app shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Process-wide parser pool shared by all aggregators
+_feed_parser_pool: Optional[FeedParserPool] = None
+
+
+def get_feed_parser_pool() -> FeedParserPool:
+    """Get the process-wide feed parser pool"""
+    global _feed_parser_pool
+    if _feed_parser_pool is None:
+        _feed_parser_pool = FeedParserPool()
+    return _feed_parser_pool
@@ -0,0 +1,102 @@
+# tools/http_pool.py - Shared HTTP connection pool for all data fetchers
+import asyncio
+import aiohttp
+import os
+from typing import Dict, Any, Optional
+
+
+class HTTPConnectionPool:
+    """
+    Process-wide aiohttp connection pool shared by the news and weather tools.
+
+    Keeps TCP/TLS connections alive between requests, caches DNS lookups and
+    caps the number of open sockets, so a briefing no longer pays a fresh
+    handshake to every provider host on every call.
+    """
+
+    def __init__(self,
+                 limit: Optional[int] = None,
+                 limit_per_host: Optional[int] = None,
+                 dns_cache_ttl: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None):
+        self.limit = limit if limit is not None else int(os.getenv("HTTP_POOL_LIMIT", "100"))
+        self.limit_per_host = limit_per_host if limit_per_host is not None else int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+        self.dns_cache_ttl = dns_cache_ttl if dns_cache_ttl is not None else int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+        self.keepalive_timeout = keepalive_timeout if keepalive_timeout is not None else float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use in the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        if self._lock is None or self._loop is not loop:
+            # Locks and sessions are bound to a loop; CLI scripts may call asyncio.run()
+            # repeatedly, so the previous loop's session is closed instead of leaked
+            if self._session is not None and not self._session.closed:
+                await self._close_in_loop(self._session, self._loop)
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            self._session = None
+
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @staticmethod
+    async def _close_in_loop(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a session created in another event loop"""
+        if loop.is_closed():
+            # Its connections died with the loop; this only marks the session closed
+            await session.close()
+        else:
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def close(self) -> None:
+        """Close the shared session and release all pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Report pool configuration and current connection usage"""
+        stats = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "dns_cache_ttl": self.dns_cache_ttl,
+            "keepalive_timeout": self.keepalive_timeout,
+            "open": self._session is not None and not self._session.closed,
+        }
+        if stats["open"]:
+            connector = self._session.connector
+            stats["acquired_connections"] = len(getattr(connector, "_acquired", ()))
+        return stats
+
+
+# Process-wide pool; the web app installs its own from the lifespan handler
+_http_pool: Optional[HTTPConnectionPool] = None
+
+
+def get_http_pool() -> HTTPConnectionPool:
+    """Get the process-wide connection pool, creating a default one if needed"""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPConnectionPool()
+    return _http_pool
+
+
+def set_http_pool(pool: Optional[HTTPConnectionPool]) -> None:
+    """Install the process-wide connection pool (used by the app lifespan)"""
+    global _http_pool
+    _http_pool = pool
@@ -0,0 +1,262 @@
+# tools/intent.py - Local rule-based parsing of briefing requests (before any LLM call)
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+# City gazetteer: lower-cased name -> (display name, ISO country code)
+CITIES = {
+    "mumbai": ("Mumbai", "in"), "bombay": ("Mumbai", "in"), "delhi": ("Delhi", "in"),
+    "new delhi": ("New Delhi", "in"), "bangalore": ("Bangalore", "in"), "bengaluru": ("Bengaluru", "in"),
+    "chennai": ("Chennai", "in"), "kolkata": ("Kolkata", "in"), "hyderabad": ("Hyderabad", "in"),
+    "pune": ("Pune", "in"), "ahmedabad": ("Ahmedabad", "in"), "jaipur": ("Jaipur", "in"),
+    "lucknow": ("Lucknow", "in"), "kochi": ("Kochi", "in"), "chandigarh": ("Chandigarh", "in"),
+    "gurgaon": ("Gurgaon", "in"), "gurugram": ("Gurugram", "in"), "noida": ("Noida", "in"),
+    "goa": ("Goa", "in"), "indore": ("Indore", "in"), "nagpur": ("Nagpur", "in"),
+    "new york": ("New York", "us"), "nyc": ("New York", "us"), "san francisco": ("San Francisco", "us"),
+    "los angeles": ("Los Angeles", "us"), "chicago": ("Chicago", "us"), "boston": ("Boston", "us"),
+    "seattle": ("Seattle", "us"), "austin": ("Austin", "us"), "miami": ("Miami", "us"),
+    "washington": ("Washington", "us"), "houston": ("Houston", "us"), "dallas": ("Dallas", "us"),
+    "atlanta": ("Atlanta", "us"), "denver": ("Denver", "us"),
+    "london": ("London", "gb"), "manchester": ("Manchester", "gb"), "birmingham": ("Birmingham", "gb"),
+    "edinburgh": ("Edinburgh", "gb"), "glasgow": ("Glasgow", "gb"), "liverpool": ("Liverpool", "gb"),
+    "paris": ("Paris", "fr"), "berlin": ("Berlin", "de"), "munich": ("Munich", "de"),
+    "madrid": ("Madrid", "es"), "rome": ("Rome", "it"), "amsterdam": ("Amsterdam", "nl"),
+    "dublin": ("Dublin", "ie"), "zurich": ("Zurich", "ch"), "tokyo": ("Tokyo", "jp"),
+    "singapore": ("Singapore", "sg"), "hong kong": ("Hong Kong", "hk"), "dubai": ("Dubai", "ae"),
+    "sydney": ("Sydney", "au"), "melbourne": ("Melbourne", "au"), "toronto": ("Toronto", "ca"),
+    "vancouver": ("Vancouver", "ca"), "beijing": ("Beijing", "cn"), "shanghai": ("Shanghai", "cn"),
+    "seoul": ("Seoul", "kr"),
+}
+
+# Country names/aliases -> (display name, ISO country code); "US" is matched case-sensitively
+COUNTRIES = {
+    "india": ("India", "in"), "usa": ("United States", "us"), "u.s.": ("United States", "us"),
+    "united states": ("United States", "us"), "america": ("United States", "us"),
+    "uk": ("United Kingdom", "gb"), "u.k.": ("United Kingdom", "gb"), "united kingdom": ("United Kingdom", "gb"),
+    "britain": ("United Kingdom", "gb"), "england": ("United Kingdom", "gb"),
+    "canada": ("Canada", "ca"), "australia": ("Australia", "au"), "germany": ("Germany", "de"),
+    "france": ("France", "fr"), "japan": ("Japan", "jp"), "china": ("China", "cn"),
+    "uae": ("United Arab Emirates", "ae"),
+}
+
+# Word -> news category; words outside GENERIC_CATEGORY_WORDS are also kept as search keywords
+CATEGORY_LEXICON = {
+    "technology": ["tech", "technology", "technological", "ai", "software", "gadgets", "startups", "startup",
+                   "cybersecurity", "internet", "smartphones", "semiconductors", "chips"],
+    "business": ["business", "markets", "market", "stocks", "stock", "economy", "economic", "finance",
+                 "financial", "earnings", "crypto", "cryptocurrency", "bitcoin", "banking", "sensex", "nifty"],
+    "sports": ["sports", "sport", "cricket", "football", "soccer", "tennis", "ipl", "f1", "nba", "olympics",
+               "hockey", "basketball"],
+    "health": ["health", "medical", "healthcare", "covid", "wellness", "medicine", "fitness"],
+    "entertainment": ["entertainment", "movies", "movie", "films", "film", "bollywood", "hollywood",
+                      "celebrity", "celebrities", "music"],
+    "science": ["science", "scientific", "space", "research", "astronomy", "nasa", "isro"],
+    "general": ["politics", "political", "election", "elections", "government", "world", "national"],
+}
+GENERIC_CATEGORY_WORDS = {"tech", "technology", "technological", "business", "sports", "sport", "health",
+                          "medical", "entertainment", "science", "scientific", "world", "national"}
+# Lexicon word -> news category ("tech" -> "technology")
+CATEGORY_OF = {word: category for category, words in CATEGORY_LEXICON.items() for word in words}
+
+WEATHER_TERMS = {"weather", "temperature", "temperatures", "forecast", "rain", "raining", "rainy", "sunny",
+                 "humidity", "humid", "windy", "snow", "snowing", "umbrella", "degrees", "storm", "monsoon",
+                 "celsius", "fahrenheit", "cloudy"}
+NEWS_TERMS = {"news", "headlines", "headline", "stories", "story", "happening", "developments", "articles"}
+BRIEFING_TERMS = {"briefing", "brief", "digest", "rundown", "summary", "roundup", "overview", "update", "updates"}
+NEGATIONS = {"no", "not", "without", "except", "skip", "don't", "dont", "exclude"}
+
+# Request filler that carries no intent of its own
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "for", "from", "to", "with", "about", "around",
+    "me", "my", "i", "we", "our", "you", "your", "us", "it", "is", "are", "be", "what", "what's", "whats",
+    "how", "how's", "hows", "give", "get", "show", "tell", "send", "need", "want", "like", "please", "can",
+    "could", "would", "some", "any", "today", "today's", "todays", "tonight", "now", "current", "currently",
+    "latest", "top", "recent", "daily", "morning", "evening", "afternoon", "good", "quick", "short", "full",
+    "complete", "key", "major", "important", "big", "local", "region", "regional", "specifically",
+    "surrounding", "area", "city", "country", "there", "here", "this", "that", "these", "do", "does",
+    "know", "all", "also", "both", "plus", "just", "only", "let", "s", "outside", "conditions",
+    "condition", "information", "info", "report", "situation", "going", "new", "day", "will", "it's",
+}
+
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+                 "nine": 9, "ten": 10}
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z.'&]*[A-Za-z]|[A-Za-z]|\d+")
+_COUNT_RE = re.compile(r"\b(\d{1,2}|" + "|".join(_NUMBER_WORDS) + r")\s+(?:top\s+|latest\s+|\w+\s+)?"
+                       r"(?:news|headlines|stories|articles|updates)\b", re.IGNORECASE)
+_PREPOSITIONS = {"in", "for", "at", "from", "around", "near"}
+
+# News country when the request names none; the news agent's analysis prompt asks for the same
+DEFAULT_NEWS_COUNTRY = "in"
+
+
+class Intent:
+    """Structured briefing request, as produced by parse_intent()"""
+    __slots__ = ("needs_weather", "needs_news", "city", "country", "location", "categories", "keywords",
+                 "count", "confidence")
+
+    def __init__(self, needs_weather: bool = False, needs_news: bool = False, city: Optional[str] = None,
+                 country: Optional[str] = None, location: Optional[str] = None,
+                 categories: Optional[List[str]] = None, keywords: Optional[List[str]] = None,
+                 count: Optional[int] = None, confidence: float = 0.0):
+        self.needs_weather = needs_weather
+        self.needs_news = needs_news
+        self.city = city              # for weather; None when only a country was named
+        self.country = country        # ISO code of the city or country
+        self.location = location      # city, else country name
+        self.categories = categories or []
+        self.keywords = keywords or []
+        self.count = count
+        self.confidence = confidence
+
+    @property
+    def category(self) -> str:
+        """Single news category for the news tools ("general" when none or ambiguous)"""
+        return self.categories[0] if self.categories else "general"
+
+    def confident(self, threshold: Optional[float] = None) -> bool:
+        """Whether the parse is good enough to skip the LLM analysis"""
+        if threshold is None:
+            threshold = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.7"))
+        return self.confidence >= threshold
+
+    def analysis_fields(self) -> Dict[str, str]:
+        """The fields MasterAgent's analysis prompt asks the LLM for, in the same form"""
+        return {
+            "NEEDS_WEATHER": "yes" if self.needs_weather else "no",
+            "WEATHER_LOCATION": self.city or "default",
+            "LOCATION_COUNTRY": self.country or "",
+            "NEEDS_NEWS": "yes" if self.needs_news else "no",
+            "NEWS_CATEGORIES": ", ".join(self.categories) or "general",
+            "NEWS_LOCATION_FOCUS": self.location or "default",
+        }
+
+    def __repr__(self) -> str:
+        return (f"Intent(weather={self.needs_weather}, news={self.needs_news}, city={self.city!r}, "
+                f"country={self.country!r}, categories={self.categories}, keywords={self.keywords}, "
+                f"count={self.count}, confidence={self.confidence:.2f})")
+
+
+def _match_places(tokens: List[str], words: List[str]) -> Tuple[List[Tuple[str, str, bool]], set]:
+    """Gazetteer matches (display name, country code, is_city) and the token positions they cover"""
+    places, used = [], set()
+    i = 0
+    while i < len(words):
+        for size in (3, 2, 1):
+            phrase = " ".join(words[i:i + size])
+            if len(words[i:i + size]) < size:
+                continue
+            if phrase in CITIES:
+                name, code = CITIES[phrase]
+                places.append((name, code, True))
+            elif phrase in COUNTRIES and (phrase != "us" or tokens[i] in ("US", "U.S.")):
+                name, code = COUNTRIES[phrase]
+                places.append((name, code, False))
+            elif phrase == "us" and tokens[i] == "US":
+                places.append(("United States", "us", False))
+            else:
+                continue
+            used.update(range(i, i + size))
+            i += size - 1
+            break
+        i += 1
+    return places, used
+
+
+def tokenize(text: str) -> List[str]:
+    """Word and number tokens of a request, with their case and inner dots ("U.S.") kept"""
+    return _TOKEN_RE.findall(text or "")
+
+
+def parse_intent(text: str) -> Intent:
+    """
+    Parse a briefing request with a city/country gazetteer, a category lexicon
+    and a few pattern rules, e.g. "Morning briefing for Mumbai with tech news".
+
+    confidence drops for anything the rules cannot account for (unknown place
+    names after "in"/"for", unrecognized content words, negations, several
+    places); callers fall back to the LLM when Intent.confident() is False.
+    """
+    tokens = tokenize(text)
+    words = [t.lower().rstrip(".") if t.lower() not in ("u.s.", "u.k.") else t.lower() for t in tokens]
+    words = [w[:-2] if w.endswith("'s") else w for w in words]
+    confidence = 1.0
+
+    places, used = _match_places(tokens, words)
+    cities = [p for p in places if p[2]]
+    distinct = {(name, code) for name, code, _ in places}
+    city = cities[0][0] if cities else None
+    country = (cities[0] if cities else places[0])[1] if places else None
+    location = (cities[0] if cities else places[0])[0] if places else None
+    if len({code for _, code in distinct}) > 1 or len(cities) > 1 and len({c[0] for c in cities}) > 1:
+        confidence -= 0.4  # several places: which one is meant?
+
+    categories, keywords, unknown = [], [], []
+    weather = news = briefing = category_words = False
+    briefing_kind = set()
+    for i, (token, word) in enumerate(zip(tokens, words)):
+        if i in used or word.isdigit() or word in _NUMBER_WORDS:
+            continue
+        if word in WEATHER_TERMS:
+            weather = True
+        elif word in NEWS_TERMS:
+            news = True
+        elif word in BRIEFING_TERMS:
+            briefing = True
+            previous = words[i - 1] if i else ""
+            if previous in WEATHER_TERMS:
+                briefing_kind.add("weather")
+            elif previous in NEWS_TERMS or previous in CATEGORY_OF:
+                briefing_kind.add("news")
+            else:
+                briefing_kind.add("both")
+        elif word in CATEGORY_OF:
+            category_words = True
+            if CATEGORY_OF[word] != "general" and CATEGORY_OF[word] not in categories:
+                categories.append(CATEGORY_OF[word])
+            if word not in GENERIC_CATEGORY_WORDS and word not in keywords:
+                keywords.append(word)
+        elif word in NEGATIONS:
+            confidence -= 0.5  # "no weather", "news except sports": leave it to the LLM
+        elif word in STOPWORDS:
+            continue
+        elif i > 0 and words[i - 1] in _PREPOSITIONS and token[0].isupper():
+            confidence -= 0.4  # probably a place we do not know
+            unknown.append(token)
+        elif token[0].isupper() and i > 0:
+            keywords.append(token)  # proper noun: a company, person, team...
+        else:
+            unknown.append(token)  # only lowers confidence; never a search filter
+
+    if category_words and not news:
+        if weather and not briefing:
+            confidence -= 0.4  # "weather for business travel": context, or news too? Ask the LLM
+        else:
+            news = True  # "tech updates", "cricket scores"
+    if briefing:
+        # "weather briefing" / "news briefing" stay single-purpose; a plain briefing covers both,
+        # even next to a qualified one ("morning briefing with technology updates")
+        if briefing_kind == {"weather"} and not news:
+            needs_weather, needs_news = True, False
+        elif briefing_kind == {"news"} and not weather:
+            needs_weather, needs_news = False, True
+        else:
+            needs_weather, needs_news = True, True
+    else:
+        needs_weather, needs_news = weather, news
+    if not (needs_weather or needs_news):
+        confidence = min(confidence, 0.2)
+
+    confidence -= 0.1 * len(unknown)
+    if len(unknown) > 3:
+        confidence = min(confidence, 0.3)
+    if needs_weather and location and not city:
+        confidence -= 0.4  # weather for a whole country needs the LLM to pick a city
+
+    count = None
+    match = _COUNT_RE.search(text or "")
+    if match:
+        value = match.group(1).lower()
+        count = int(value) if value.isdigit() else _NUMBER_WORDS[value]
+
+    return Intent(needs_weather, needs_news, city, country, location, categories, keywords[:5], count,
+                  max(0.0, min(1.0, confidence)))
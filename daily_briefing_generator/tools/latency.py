@@ -0,0 +1,102 @@
+# tools/latency.py - Rolling per-provider latency tracking and adaptive timeouts
+import os
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+class LatencyTracker:
+    """
+    Keeps the last `window` response times per provider and derives request
+    timeouts from the observed tail latency.
+
+    timeout = p95 * margin + padding, clamped to [min_timeout, max_timeout] and
+    to the caller's remaining deadline. Until `min_samples` responses have been
+    seen a provider gets `max_timeout`.
+    """
+
+    def __init__(self,
+                 window: int = 200,
+                 margin: Optional[float] = None,
+                 padding: Optional[float] = None,
+                 min_timeout: Optional[float] = None,
+                 max_timeout: Optional[float] = None,
+                 min_samples: int = 5):
+        self.window = window
+        self.margin = margin if margin is not None else float(os.getenv("TIMEOUT_P95_MARGIN", "1.5"))
+        self.padding = padding if padding is not None else float(os.getenv("TIMEOUT_PADDING", "0.5"))
+        self.min_timeout = min_timeout if min_timeout is not None else float(os.getenv("MIN_PROVIDER_TIMEOUT", "2"))
+        self.max_timeout = max_timeout if max_timeout is not None else float(os.getenv("MAX_PROVIDER_TIMEOUT", "15"))
+        self.min_samples = min_samples
+
+        self.samples: Dict[str, deque] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def record(self, provider: str, seconds: float) -> None:
+        """Record the latency of a completed response"""
+        samples = self.samples.get(provider)
+        if samples is None:
+            samples = self.samples[provider] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def record_timeout(self, provider: str, timeout: float) -> None:
+        """
+        Count a request that hit its timeout. The response took at least `timeout`,
+        so that is recorded as a sample too: otherwise a provider that slowed down
+        past its learned timeout would time out forever without the timeout growing.
+        Timeouts cut short by the caller's deadline say nothing about the provider.
+        """
+        self.timeouts[provider] = self.timeouts.get(provider, 0) + 1
+        if timeout >= self.timeout_for(provider) * 0.99:
+            self.record(provider, timeout)
+
+    def percentile(self, provider: str, q: float) -> Optional[float]:
+        """q-th percentile (0-100) of the provider's recent latencies"""
+        samples = self.samples.get(provider)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def timeout_for(self, provider: str, remaining: Optional[float] = None) -> float:
+        """Timeout for the next request to a provider, clamped by the remaining deadline"""
+        samples = self.samples.get(provider)
+        if samples is None or len(samples) < self.min_samples:
+            timeout = self.max_timeout
+        else:
+            timeout = self.percentile(provider, 95) * self.margin + self.padding
+            timeout = min(self.max_timeout, max(self.min_timeout, timeout))
+
+        if remaining is not None:
+            timeout = min(timeout, max(0.1, remaining))
+        return timeout
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latency summary per provider"""
+        stats = {}
+        for provider in sorted(set(self.samples) | set(self.timeouts)):
+            samples = self.samples.get(provider, ())
+            stats[provider] = {
+                "samples": len(samples),
+                "p50": self._rounded(self.percentile(provider, 50)),
+                "p95": self._rounded(self.percentile(provider, 95)),
+                "p99": self._rounded(self.percentile(provider, 99)),
+                "timeouts": self.timeouts.get(provider, 0),
+                "next_timeout": round(self.timeout_for(provider), 2)
+            }
+        return stats
+
+    def _rounded(self, value: Optional[float]) -> Optional[float]:
+        return round(value, 3) if value is not None else None
+
+
+# Process-wide tracker shared by all tools
+_latency_tracker: Optional[LatencyTracker] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the process-wide latency tracker"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
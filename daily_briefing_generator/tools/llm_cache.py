@@ -0,0 +1,226 @@
+# tools/llm_cache.py - Exact-match cache of model responses keyed by prompt fingerprint
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seconds a response stays valid, by prompt kind. Request analysis depends only on the
+# request text; narration and synthesis are grounded in live data and go stale quickly.
+# Calls without a kind (or with a 0 TTL) are never cached. Override with LLM_CACHE_TTL_<KIND>.
+DEFAULT_TTLS = {
+    "analysis": 86400,
+    "narration": 300,
+    "synthesis": 300,
+    "fallback": 3600,
+}
+
+
+class CachedResponse:
+    """Stand-in for a model response served from the cache (only .text is kept)"""
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def prompt_fingerprint(model_name: str, prompt: Any, generation_config: Any = None,
+                       system_instruction: str = "") -> str:
+    """SHA-256 of model, system instruction, whitespace-normalized prompt and generation config"""
+    text = prompt if isinstance(prompt, str) else json.dumps(prompt, sort_keys=True, default=str)
+    config = json.dumps(generation_config, sort_keys=True, default=str) if generation_config else ""
+    payload = "\x1f".join((model_name, " ".join(system_instruction.split()), " ".join(text.split()), config))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Bounded LRU of model response texts with a TTL per prompt kind.
+
+    Entries are keyed by prompt_fingerprint(), so only byte-for-byte identical
+    prompts (after whitespace normalization) for the same model and generation
+    config hit. With a persist file, entries survive restarts: the file is
+    loaded on start and rewritten at most every `save_interval` seconds.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttls: Optional[Dict[str, float]] = None,
+                 persist_file: Optional[str] = None, enabled: Optional[bool] = None, save_interval: float = 5.0):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+        self.enabled = enabled if enabled is not None else os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.persist_file = persist_file if persist_file is not None else os.getenv("LLM_CACHE_FILE") or None
+        self.save_interval = save_interval
+        self.ttls = {}
+        for kind, ttl in (ttls or DEFAULT_TTLS).items():
+            self.ttls[kind] = float(os.getenv(f"LLM_CACHE_TTL_{kind.upper()}", ttl))
+
+        # key -> (expires_at (wall clock, so persisted entries stay meaningful), kind, text)
+        self._entries: "OrderedDict[str, Tuple[float, str, str]]" = OrderedDict()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        # kind -> [calls, seconds, prompt tokens, cached tokens] of calls that reached the model
+        self.model_calls: Dict[str, List[float]] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    def ttl_for(self, kind: Optional[str]) -> float:
+        return self.ttls.get(kind, 0.0) if kind else 0.0
+
+    def get(self, key: str, kind: str) -> Optional[str]:
+        """Cached text for key, or None (counted as a miss)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return entry[2]
+            del self._entries[key]
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        return None
+
+    def put(self, key: str, kind: str, text: str) -> None:
+        """Store a response text for its kind's TTL"""
+        ttl = self.ttl_for(kind)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.time() + ttl, kind, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+        self._maybe_save()
+
+    def record_call(self, kind: Optional[str], seconds: float, response: Any) -> None:
+        """Latency and input tokens (as billed, from usage_metadata) of a call that reached the model"""
+        usage = getattr(response, "usage_metadata", None)
+        totals = self.model_calls.setdefault(kind or "uncached", [0, 0.0, 0, 0])
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] += getattr(usage, "prompt_token_count", 0) or 0
+        totals[3] += getattr(usage, "cached_content_token_count", 0) or 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entries plus hits, misses and hit ratio per prompt kind"""
+        kinds = {}
+        for kind in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits.get(kind, 0), self.misses.get(kind, 0)
+            kinds[kind] = {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3)}
+        model_calls = {
+            kind: {"calls": calls, "avg_seconds": round(seconds / calls, 3),
+                   "avg_prompt_tokens": round(prompt_tokens / calls, 1),
+                   "avg_cached_tokens": round(cached_tokens / calls, 1)}
+            for kind, (calls, seconds, prompt_tokens, cached_tokens) in sorted(self.model_calls.items())
+        }
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "persist_file": self.persist_file,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else None,
+            "by_kind": kinds,
+            "model_calls": model_calls
+        }
+
+    def flush(self) -> None:
+        """Write entries to disk now (used on shutdown)"""
+        if self._dirty:
+            self._save()
+
+    def _load(self) -> None:
+        if not self.persist_file:
+            return
+        try:
+            with open(self.persist_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            now = time.time()
+            for key, (expires_at, kind, text) in entries.items():
+                if expires_at > now:
+                    self._entries[key] = (expires_at, kind, text)
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def _maybe_save(self) -> None:
+        if self.persist_file and time.monotonic() - self._last_save >= self.save_interval:
+            self._save()
+
+    def _save(self) -> None:
+        if not self.persist_file:
+            return
+        tmp_file = f"{self.persist_file}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.persist_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Could not persist LLM cache: {e}")
+        self._last_save = time.monotonic()
+
+
+class CachedModel:
+    """
+    Wraps a generative model so generate_content_async() goes through the
+    shared response cache. Pass kind= ("analysis", "narration", "synthesis",
+    "fallback") to make a call cacheable; calls without a kind go straight to
+    the model. Everything else is delegated to the wrapped model.
+
+    `preamble` is prepended to string prompts; it carries the system
+    instruction for SDK versions whose models cannot take one.
+    """
+
+    def __init__(self, model: Any, cache: Optional[LLMResponseCache] = None, preamble: str = ""):
+        self.model = model
+        self.cache = cache
+        self.preamble = preamble
+        self.model_name = getattr(model, "model_name", type(model).__name__)
+        system = getattr(model, "_system_instruction", None)
+        self.system_instruction = str(system) if system else ""
+
+    async def generate_content_async(self, contents: Any, *args, kind: Optional[str] = None, **kwargs) -> Any:
+        if self.preamble and isinstance(contents, str):
+            contents = f"{self.preamble}\n\n{contents}"
+        cache = self.cache or get_llm_cache()
+        if not cache.enabled or args or cache.ttl_for(kind) <= 0:
+            return await self._call(cache, kind, contents, *args, **kwargs)
+
+        config = kwargs.get("generation_config") or getattr(self.model, "_generation_config", None)
+        key = prompt_fingerprint(self.model_name, contents, config, self.system_instruction)
+        text = cache.get(key, kind)
+        if text is not None:
+            return CachedResponse(text)
+
+        response = await self._call(cache, kind, contents, **kwargs)
+        try:
+            cache.put(key, kind, response.text)
+        except (ValueError, AttributeError):
+            pass  # blocked or empty responses have no text to cache
+        return response
+
+    async def _call(self, cache: LLMResponseCache, kind: Optional[str], contents: Any, *args, **kwargs) -> Any:
+        started = time.perf_counter()
+        response = await self.model.generate_content_async(contents, *args, **kwargs)
+        cache.record_call(kind, time.perf_counter() - started, response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
+
+# Process-wide cache shared by all agents
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
@@ -0,0 +1,224 @@
+# tools/news_cache.py - Shared TTL cache with request coalescing for aggregated news results
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+# Rough per-article and per-result bookkeeping overhead (objects, dict slots), in bytes
+ARTICLE_OVERHEAD = 200
+RESULT_OVERHEAD = 500
+
+
+def news_cache_key(category: str, region: str, keywords: Optional[Iterable[str]], max_articles: int,
+                   location: Optional[str] = None, max_age_hours: Optional[float] = None,
+                   mode: str = "complete") -> Tuple:
+    """Normalized cache key: case, whitespace and keyword order do not matter"""
+    return (
+        (category or "general").strip().lower(),
+        (region or "global").strip().lower(),
+        tuple(sorted({k.strip().lower() for k in keywords or () if k and k.strip()})),
+        int(max_articles),
+        (location or "").strip().lower(),
+        max_age_hours,
+        mode,
+    )
+
+
+def estimate_result_bytes(result: Dict[str, Any]) -> int:
+    """Approximate memory held by a result, dominated by its articles' text"""
+    size = RESULT_OVERHEAD
+    for article in result.get("articles", ()):
+        size += ARTICLE_OVERHEAD
+        if isinstance(article, dict):
+            values = article.values()
+        else:
+            # Article: read the slots directly so lazy content is not materialized
+            values = (getattr(article, slot, None) for slot in article.__slots__)
+        size += sum(len(value) for value in values if isinstance(value, str))
+    return size
+
+
+class _Entry:
+    __slots__ = ("result", "stored_at", "size")
+
+    def __init__(self, result: Dict[str, Any], size: int):
+        self.result = result
+        self.stored_at = time.monotonic()
+        self.size = size
+
+
+class NewsResultCache:
+    """
+    Process-wide cache in front of MultiSourceNewsAggregator.get_comprehensive_news.
+
+    - Fresh entries (younger than `ttl`) are served directly.
+    - Stale entries (up to `stale_ttl` past the TTL) are served immediately while
+      one background fetch refreshes them (stale-while-revalidate).
+    - Concurrent misses for the same key share a single in-flight fetch
+      (single-flight), so identical requests fan out to the providers once.
+    - Entries are kept in LRU order and evicted once their estimated size
+      exceeds `max_bytes`.
+
+    Only successful results with articles are stored, and not those cut short
+    by the caller's deadline ("deadline_reached").
+    """
+
+    def __init__(self,
+                 ttl: Optional[float] = None,
+                 stale_ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("CACHE_TTL", "300"))
+        self.stale_ttl = stale_ttl if stale_ttl is not None else float(os.getenv("NEWS_CACHE_STALE_TTL", "600"))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv("NEWS_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+        self.enabled = enabled if enabled is not None else os.getenv("ENABLE_CACHE", "False").lower() == "true"
+
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def configure(self, ttl: Optional[float] = None, enabled: Optional[bool] = None,
+                  stale_ttl: Optional[float] = None, max_bytes: Optional[int] = None) -> None:
+        """Apply settings (e.g. WebConfig.CACHE_TTL / ENABLE_CACHE) to the live cache"""
+        if ttl is not None:
+            self.ttl = ttl
+        if stale_ttl is not None:
+            self.stale_ttl = stale_ttl
+        if enabled is not None:
+            self.enabled = enabled
+            if not enabled:
+                self.clear()
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    async def get_or_fetch(self, key: Tuple, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Cached result for key, or the result of fetch() shared by every concurrent caller.
+        A shared result cut short by its starter's deadline ("deadline_reached") is
+        not reused: the later caller fetches again with its own fetch().
+        The returned dict is a copy whose "cache" field says how it was served
+        ("hit", "stale", "coalesced" or "miss").
+        """
+        if not self.enabled:
+            return await fetch()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._served(entry.result, "hit")
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._start_fetch(key, fetch)
+                return self._served(entry.result, "stale")
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            status = "coalesced"
+        else:
+            self.misses += 1
+            status = "miss"
+            task = self._start_fetch(key, fetch)
+        # Shielded so one caller giving up does not cancel the fetch for the others
+        result = await asyncio.shield(task)
+        if status == "coalesced" and result.get("deadline_reached"):
+            # Cut short by the deadline of the caller that started the fetch, which
+            # may be shorter than ours: fetch again within our own deadline
+            self.coalesced -= 1
+            self.misses += 1
+            status = "miss"
+            result = await asyncio.shield(self._start_fetch(key, fetch))
+        return self._served(result, status)
+
+    def _start_fetch(self, key: Tuple, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._fetch_done(key, t))
+        return task
+
+    def _fetch_done(self, key: Tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Background refreshes have no awaiting caller to report to
+            print(f"News cache fetch failed: {task.exception()}")
+
+    async def _fetch_and_store(self, key: Tuple, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        result = await fetch()
+        if result.get("status") == "success" and result.get("articles") and not result.get("deadline_reached"):
+            self._store(key, result)
+        return result
+
+    def _store(self, key: Tuple, result: Dict[str, Any]) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old.size
+        entry = _Entry(result, estimate_result_bytes(result))
+        if entry.size > self.max_bytes:
+            return  # would evict everything else
+        self._entries[key] = entry
+        self.bytes += entry.size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+
+    def _served(self, result: Dict[str, Any], status: str) -> Dict[str, Any]:
+        served = dict(result, cache=status)
+        if "articles" in served:
+            served["articles"] = list(served["articles"])
+        return served
+
+    def clear(self) -> None:
+        """Drop every cached result (in-flight fetches still complete)"""
+        self._entries.clear()
+        self.bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the cache"""
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "hit_rate": round((lookups - self.misses) / lookups, 3) if lookups else None
+        }
+
+
+# Process-wide cache shared by all aggregators
+_news_cache: Optional[NewsResultCache] = None
+
+
+def get_news_cache() -> NewsResultCache:
+    """Get the process-wide news result cache"""
+    global _news_cache
+    if _news_cache is None:
+        _news_cache = NewsResultCache()
+    return _news_cache
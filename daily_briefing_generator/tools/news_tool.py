@@ -3,16 +3,46 @@ import asyncio
 import aiohttp
 import os
 import sys
-from typing import Dict, List, Any
+import time
+from typing import Callable, Dict, List, Any
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 # Try to import the enhanced multi-API system
 try:
-    from enhanced_news_tool import MultiSourceNewsAggregator
+    from tools.enhanced_news_tool import MultiSourceNewsAggregator
     ENHANCED_AVAILABLE = True
 except ImportError:
-    ENHANCED_AVAILABLE = False
+    try:
+        from enhanced_news_tool import MultiSourceNewsAggregator
+        ENHANCED_AVAILABLE = True
+    except ImportError:
+        ENHANCED_AVAILABLE = False
+
+try:
+    from tools.http_pool import get_http_pool
+    from tools.circuit_breaker import get_circuit_breaker, classify_status, TRANSIENT_COOLDOWN
+    from tools.quota import get_quota_manager
+    from tools.latency import get_latency_tracker
+    from tools.cascade import SpeculativeCascade
+    from tools.dedup import NearDuplicateIndex
+    from tools.seen_index import get_seen_index
+    from tools.timestamps import age_cutoff, filter_by_age
+    from tools.article import Article, as_dicts
+    from tools.ranking import rank_articles
+    from tools.query import keyword_query, normalize_keywords
+except ImportError:
+    from http_pool import get_http_pool
+    from circuit_breaker import get_circuit_breaker, classify_status, TRANSIENT_COOLDOWN
+    from quota import get_quota_manager
+    from latency import get_latency_tracker
+    from cascade import SpeculativeCascade
+    from dedup import NearDuplicateIndex
+    from seen_index import get_seen_index
+    from timestamps import age_cutoff, filter_by_age
+    from article import Article, as_dicts
+    from ranking import rank_articles
+    from query import keyword_query, normalize_keywords
 
 # Load environment variables
 load_dotenv()
@@ -22,7 +52,12 @@ async def get_news_data(
     query: str = "technology", 
     country: str = "us", 
     category: str = "general",
-    max_articles: int = 5
+    max_articles: int = 5,
+    mode: str = "complete",
+    deadline: float = None,
+    since: int = None,
+    keywords: List[str] = None,
+    location: str = None
 ) -> Dict[str, Any]:
     """
     Enhanced news fetching with multiple APIs and RSS feeds for maximum coverage.
@@ -38,7 +73,15 @@ async def get_news_data(
     - RSS feeds (fallback)
     
     The more API keys you configure, the better the coverage!
+    
+    mode="first_sufficient" trades completeness for latency: the aggregator returns
+    as soon as enough unique articles have arrived instead of waiting for every API.
+    deadline (seconds) bounds every provider timeout by the time left for the call.
+    since (UTC epoch seconds, e.g. the last briefing) limits results to newer articles.
+    keywords (list or comma-separated string) and location (e.g. a city) are passed to
+    each provider's native search parameter, so filtering happens server-side.
     """
+    keywords = normalize_keywords(keywords)
     
     # Try enhanced multi-API system first
     if ENHANCED_AVAILABLE:
@@ -54,13 +97,14 @@ async def get_news_data(
             }
             region = region_map.get(country, "global")
             
-            result = await aggregator.get_comprehensive_news(category, region, max_articles)
+            result = await aggregator.get_comprehensive_news(category, region, max_articles, mode=mode, deadline=deadline,
+                                                             since=since, keywords=keywords, location=location)
             
             # Convert to expected format
             return {
                 "status": result["status"],
                 "total_results": result["total_results"],
-                "articles": result["articles"],
+                "articles": as_dicts(result["articles"]),
                 "apis_used": result.get("apis_used", []),
                 "sources_used": result.get("sources_used", [])
             }
@@ -68,40 +112,53 @@ async def get_news_data(
             print(f"Enhanced system error, falling back to basic: {e}")
     
     # Fallback to original enhanced NewsAPI system
-    return await _get_news_data_fallback(query, country, category, max_articles)
+    return await _get_news_data_fallback(query, country, category, max_articles, since, keywords, location)
 
 
-async def _get_news_data_fallback(query: str, country: str, category: str, max_articles: int) -> Dict[str, Any]:
+async def _get_news_data_fallback(query: str, country: str, category: str, max_articles: int,
+                                  since: int = None, keywords: List[str] = None,
+                                  location: str = None) -> Dict[str, Any]:
     """
-    Fallback news system using enhanced NewsAPI strategies
+    Fallback news system using enhanced NewsAPI strategies.
+    
+    The strategies run speculatively in parallel (see tools/cascade.py): the most
+    preferred one that succeeds wins, the rest are cancelled, and identical API
+    requests issued by several strategies are only sent once.
     """
-    # Strategy 1: Try enhanced NewsAPI search
-    result = await _fetch_with_enhanced_newsapi(query, country, category, max_articles)
-    if result.get("status") == "success" and result.get("articles"):
-        return result
+    cascade = SpeculativeCascade(max_concurrency=int(os.getenv("FALLBACK_CASCADE_CONCURRENCY", "3")))
+    
+    async def request(url: str, params: Dict) -> Dict[str, Any]:
+        return await cascade.dedupe((url, tuple(sorted(params.items()))), lambda: _make_api_request(url, params))
+    
+    # Strategy 1: Try enhanced NewsAPI search (keyword-filtered when keywords were given)
+    search = keyword_query(keywords, location)
+    cascade.add(0, "enhanced", lambda: _fetch_with_enhanced_newsapi(query, country, category, max_articles, request,
+                                                                    search))
     
     # Strategy 2: Try different search terms and parameters
-    result = await _fetch_with_broader_search(query, country, category, max_articles)
-    if result.get("status") == "success" and result.get("articles"):
-        return result
+    cascade.add(1, "broader", lambda: _fetch_with_broader_search(query, country, category, max_articles, request))
     
     # Strategy 3: Try fallback countries
     fallback_countries = ["us", "in", "gb", "au", "ca"]
-    if country not in fallback_countries:
-        fallback_countries.insert(0, country)
-    
-    for fallback_country in fallback_countries:
+    for priority, fallback_country in enumerate(fallback_countries, start=2):
         if fallback_country == country:
             continue
-        result = await _fetch_with_enhanced_newsapi(query, fallback_country, category, max_articles)
-        if result.get("status") == "success" and result.get("articles"):
-            return result
+        cascade.add(priority, f"country-{fallback_country}",
+                    lambda c=fallback_country: _fetch_with_enhanced_newsapi(query, c, category, max_articles, request))
     
     # Strategy 4: Try general category if specific category fails
     if category != "general":
-        result = await _fetch_with_enhanced_newsapi(query, country, "general", max_articles)
-        if result.get("status") == "success" and result.get("articles"):
-            return result
+        cascade.add(len(fallback_countries) + 2, "general",
+                    lambda: _fetch_with_enhanced_newsapi(query, country, "general", max_articles, request))
+    
+    def succeeded(result: Dict[str, Any]) -> bool:
+        return result.get("status") == "success" and bool(result.get("articles"))
+    
+    strategy, result = await cascade.run(succeeded)
+    if strategy is not None:
+        articles = filter_by_age(result["articles"], age_cutoff(since))
+        articles = rank_articles(articles, category, keywords, location, top_k=max_articles)
+        return dict(result, articles=as_dicts(articles), total_results=len(articles))
     
     # If all strategies fail, return a meaningful error
     return {
@@ -114,24 +171,26 @@ async def _get_news_data_fallback(query: str, country: str, category: str, max_a
     }
 
 
-async def _fetch_with_enhanced_newsapi(query: str, country: str, category: str, max_articles: int) -> Dict[str, Any]:
-    """Enhanced NewsAPI fetching with better parameters"""
+async def _fetch_with_enhanced_newsapi(query: str, country: str, category: str, max_articles: int,
+                                      request: Callable = None, search: str = None) -> Dict[str, Any]:
+    """Enhanced NewsAPI fetching with better parameters; `search` is a keyword query"""
     api_key = os.getenv("NEWS_API_KEY")
     if not api_key:
         return {"status": "error", "error": "NewsAPI key not found", "articles": []}
     
     # Try top headlines first
-    result = await _try_top_headlines(api_key, country, category, max_articles)
+    result = await _try_top_headlines(api_key, country, category, max_articles, request, search)
     if result.get("articles"):
         return result
     
     # Try everything endpoint with enhanced search
-    search_terms = _create_enhanced_search_terms(query, country, category)
-    result = await _try_everything_search(api_key, search_terms, max_articles)
+    search_terms = search or _create_enhanced_search_terms(query, country, category)
+    result = await _try_everything_search(api_key, search_terms, max_articles, request)
     return result
 
 
-async def _try_top_headlines(api_key: str, country: str, category: str, max_articles: int) -> Dict[str, Any]:
+async def _try_top_headlines(api_key: str, country: str, category: str, max_articles: int,
+                             request: Callable = None, search: str = None) -> Dict[str, Any]:
     """Try top headlines endpoint"""
     base_url = "https://newsapi.org/v2/top-headlines"
     params = {
@@ -144,11 +203,14 @@ async def _try_top_headlines(api_key: str, country: str, category: str, max_arti
     # Only add category if it's valid for top headlines
     if category in ["business", "entertainment", "general", "health", "science", "sports", "technology"]:
         params["category"] = category
+    if search:
+        params["q"] = search
     
-    return await _make_api_request(base_url, params)
+    return await (request or _make_api_request)(base_url, params)
 
 
-async def _try_everything_search(api_key: str, search_terms: str, max_articles: int) -> Dict[str, Any]:
+async def _try_everything_search(api_key: str, search_terms: str, max_articles: int,
+                                 request: Callable = None) -> Dict[str, Any]:
     """Try everything endpoint with enhanced search"""
     base_url = "https://newsapi.org/v2/everything"
     params = {
@@ -160,7 +222,7 @@ async def _try_everything_search(api_key: str, search_terms: str, max_articles:
         "from": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")  # Last 2 days
     }
     
-    return await _make_api_request(base_url, params)
+    return await (request or _make_api_request)(base_url, params)
 
 
 def _create_enhanced_search_terms(query: str, country: str, category: str) -> str:
@@ -190,7 +252,8 @@ def _create_enhanced_search_terms(query: str, country: str, category: str) -> st
     return " OR ".join(base_terms)
 
 
-async def _fetch_with_broader_search(query: str, country: str, category: str, max_articles: int) -> Dict[str, Any]:
+async def _fetch_with_broader_search(query: str, country: str, category: str, max_articles: int,
+                                    request: Callable = None) -> Dict[str, Any]:
     """Try with broader, more flexible search parameters"""
     api_key = os.getenv("NEWS_API_KEY")
     if not api_key:
@@ -216,39 +279,68 @@ async def _fetch_with_broader_search(query: str, country: str, category: str, ma
         "from": (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")  # Last 3 days
     }
     
-    return await _make_api_request(base_url, params)
+    return await (request or _make_api_request)(base_url, params)
 
 
-async def _make_api_request(url: str, params: Dict) -> Dict[str, Any]:
+async def _make_api_request(url: str, params: Dict, provider: str = "NewsAPI") -> Dict[str, Any]:
     """Make API request with enhanced error handling and article filtering"""
+    breaker = get_circuit_breaker(provider)
+    if not breaker.allow_request():
+        return {"status": "error", "error": f"{provider} temporarily disabled: {breaker.last_failure_reason}", "articles": []}
+    allowed, reason = get_quota_manager().try_acquire(provider)
+    if not allowed:
+        breaker.release_probe()
+        return {"status": "error", "error": f"{provider} over budget: {reason}", "articles": []}
+    
+    latency = get_latency_tracker()
+    timeout = latency.timeout_for(provider)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=15) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    articles = data.get("articles", [])
-                    
-                    # Enhanced article filtering
-                    valid_articles = []
-                    for article in articles:
-                        if _is_valid_article(article):
-                            valid_articles.append(_normalize_article(article))
-                    
-                    return {
-                        "status": "success",
-                        "total_results": len(valid_articles),
-                        "articles": valid_articles
-                    }
-                elif response.status == 426:
-                    return {"status": "error", "error": "API rate limit exceeded", "articles": []}
-                elif response.status == 401:
-                    return {"status": "error", "error": "Invalid API key", "articles": []}
-                else:
-                    return {"status": "error", "error": f"API request failed with status {response.status}", "articles": []}
+        session = await get_http_pool().get_session()
+        started = time.monotonic()
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            # Latency covers the body too: the timeout has to
+            data = await response.json() if response.status == 200 else None
+            latency.record(provider, time.monotonic() - started)
+            failure = classify_status(response.status)
+            if failure is not None:
+                breaker.record_failure(*failure)
+            
+            if response.status == 200:
+                breaker.record_success()
+                articles = data.get("articles", [])
+                
+                # Enhanced article filtering; articles already normalized by an
+                # earlier request are reused, syndicated copies are dropped
+                seen = get_seen_index()
+                dedup_index = NearDuplicateIndex(seen_index=seen)
+                valid_articles = []
+                for article in articles:
+                    if _is_valid_article(article):
+                        normalized = seen.processed("news_tool", article, _normalize_article)
+                        if dedup_index.add(normalized):
+                            valid_articles.append(normalized)
+                
+                return {
+                    "status": "success",
+                    "total_results": len(valid_articles),
+                    "articles": valid_articles
+                }
+            elif response.status == 426:
+                return {"status": "error", "error": "API rate limit exceeded", "articles": []}
+            elif response.status == 401:
+                return {"status": "error", "error": "Invalid API key", "articles": []}
+            else:
+                return {"status": "error", "error": f"API request failed with status {response.status}", "articles": []}
     
+    except asyncio.CancelledError:
+        breaker.release_probe()
+        raise
     except asyncio.TimeoutError:
+        latency.record_timeout(provider, timeout)
+        breaker.record_failure(f"timeout after {timeout:.1f}s", TRANSIENT_COOLDOWN)
         return {"status": "error", "error": "Request timeout", "articles": []}
     except Exception as e:
+        breaker.record_failure(f"{type(e).__name__}: {e}", TRANSIENT_COOLDOWN)
         return {"status": "error", "error": f"Network error: {str(e)}", "articles": []}
 
 
@@ -277,17 +369,9 @@ def _is_valid_article(article: Dict) -> bool:
     return True
 
 
-def _normalize_article(article: Dict) -> Dict:
+def _normalize_article(article: Dict) -> Article:
     """Normalize article data to consistent format"""
-    return {
-        "title": article.get("title", "").strip(),
-        "description": article.get("description", "").strip(),
-        "url": article.get("url", ""),
-        "publishedAt": article.get("publishedAt", ""),
-        "source": article.get("source", {}),
-        "content": article.get("content", ""),
-        "urlToImage": article.get("urlToImage", "")
-    }
+    return Article.from_dict(article)
 
 
 # Quick test function
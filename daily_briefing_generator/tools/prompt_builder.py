@@ -0,0 +1,151 @@
+# tools/prompt_builder.py - Token-budgeted assembly of LLM prompts
+import html
+import math
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from tools.article import Article
+except ImportError:
+    from article import Article
+
+# Rough size of a Gemini token for English text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+
+# Per-prompt-name token statistics, for monitoring
+_prompt_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer round-trip)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def clean_text(text: str, single_line: bool = False) -> str:
+    """Strip HTML tags/entities and collapse whitespace (and newlines, if single_line)"""
+    if not text:
+        return ""
+    if "<" in text or "&" in text:
+        text = html.unescape(_TAG_RE.sub(" ", text))
+    if single_line:
+        return " ".join(text.split())
+    return _BLANK_LINES_RE.sub("\n\n", _SPACE_RE.sub(" ", text)).strip()
+
+
+def truncate_to_tokens(text: str, max_tokens: Optional[int]) -> str:
+    """Cut text to roughly max_tokens, at a word boundary, marking the cut with an ellipsis"""
+    if max_tokens is None or estimate_tokens(text) <= max_tokens:
+        return text
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN - 1)
+    cut = text[:max_chars]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+class PromptBuilder:
+    """
+    Builds a prompt out of sections, each with an optional token budget.
+
+    Fixed instructions are added without a budget; variable content (articles,
+    sub-agent outputs) is cleaned and cut to its budget. Article lists are
+    expected in rank order: the lowest-ranked articles are dropped first when
+    the section runs out of budget. build() returns the prompt and records its
+    estimated token count, available from report() and get_prompt_stats().
+    `system` is the system instruction the prompt is sent with, counted
+    separately since it is not part of the per-call prompt.
+    """
+
+    def __init__(self, name: str, system: Optional[str] = None):
+        self.name = name
+        self.system_tokens = estimate_tokens(system) if system else 0
+        self._parts: List[str] = []
+        self._sections: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, text: str, budget: Optional[int] = None, name: Optional[str] = None) -> "PromptBuilder":
+        """Append a text section, cleaned and truncated when a budget is given"""
+        if budget is not None:
+            original = estimate_tokens(text)
+            text = truncate_to_tokens(clean_text(text), budget)
+            self._sections[name or f"section_{len(self._parts)}"] = {
+                "tokens": estimate_tokens(text),
+                "budget": budget,
+                "truncated_from": original if estimate_tokens(text) < original else None
+            }
+        self._parts.append(text)
+        return self
+
+    def add_articles(self, articles: Iterable[Any], budget: Optional[int] = None,
+                     description_tokens: Optional[int] = None, name: str = "articles") -> "PromptBuilder":
+        """
+        Append a numbered article list within `budget` tokens. Descriptions are
+        stripped of HTML and cut to `description_tokens`; articles without a
+        title or description are skipped.
+        """
+        if budget is None:
+            budget = int(os.getenv("PROMPT_ARTICLE_TOKENS", "1500"))
+        if description_tokens is None:
+            description_tokens = int(os.getenv("PROMPT_DESCRIPTION_TOKENS", "80"))
+
+        articles = list(articles)
+        entries = []
+        used = 0
+        for article in articles:
+            article = Article.from_dict(article)
+            title = clean_text(article.title, single_line=True)
+            description = truncate_to_tokens(clean_text(article.description, single_line=True), description_tokens)
+            if not title or not description:
+                continue
+
+            entry = f"""
+Article {len(entries) + 1}:
+Title: {title}
+Source: {article.source_name}
+Description: {description}
+Published: {article.published_at}
+"""
+            tokens = estimate_tokens(entry)
+            if used + tokens > budget:
+                break  # everything after this ranks lower
+            entries.append(entry)
+            used += tokens
+
+        self._sections[name] = {"tokens": used, "budget": budget, "articles": len(entries),
+                                "dropped": len(articles) - len(entries)}
+        self._parts.append("\n".join(entries))
+        return self
+
+    def build(self) -> str:
+        """Join the sections and record the prompt size"""
+        prompt = "\n".join(self._parts)
+        self._sections["total"] = {"tokens": estimate_tokens(prompt), "system_tokens": self.system_tokens}
+        _record(self.name, self._sections["total"]["tokens"], self.system_tokens)
+        return prompt
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Estimated tokens per budgeted section (plus "total" after build())"""
+        return self._sections
+
+
+def _record(name: str, tokens: int, system_tokens: int = 0) -> None:
+    stats = _prompt_stats.get(name)
+    if stats is None:
+        stats = _prompt_stats[name] = {"prompts": 0, "total_tokens": 0, "max_tokens": 0}
+    stats["prompts"] += 1
+    stats["total_tokens"] += tokens
+    stats["max_tokens"] = max(stats["max_tokens"], tokens)
+    stats["last_tokens"] = tokens
+    stats["system_tokens"] = system_tokens
+
+
+def get_prompt_stats() -> Dict[str, Dict[str, Any]]:
+    """Estimated prompt sizes per prompt name (system_tokens: its system instruction, sent separately)"""
+    return {
+        name: dict(stats, avg_tokens=round(stats["total_tokens"] / stats["prompts"], 1))
+        for name, stats in _prompt_stats.items()
+    }
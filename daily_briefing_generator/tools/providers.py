@@ -0,0 +1,136 @@
+# tools/providers.py - Declarative news provider capabilities and call planning
+from typing import Dict, List, Optional, Tuple
+
+# Our region names -> country names, for providers that can only search for a country
+REGION_NAMES = {"india": "India", "us": "United States", "uk": "United Kingdom"}
+
+
+class ProviderCapabilities:
+    """
+    What a news provider can do, in its own vocabulary.
+
+    categories maps our category to the provider's value (None = the provider
+    needs no filter for it); a category missing from the map is unsupported.
+    countries maps our region to the provider's country value the same way.
+    Every provider we call has a free-text search parameter, so unsupported
+    categories, and regions with a name in REGION_NAMES, become search terms.
+    full_content says whether the provider's article text is the full story;
+    without it the "content" field is a truncated teaser ("... [+2345 chars]").
+    """
+    __slots__ = ("name", "categories", "countries", "languages", "max_page_size", "full_content")
+
+    def __init__(self, name: str, categories: Dict[str, Optional[str]], countries: Dict[str, Optional[str]],
+                 languages: Tuple[str, ...] = ("en",), max_page_size: int = 10, full_content: bool = False):
+        self.name = name
+        self.categories = categories
+        self.countries = countries
+        self.languages = languages
+        self.max_page_size = max_page_size
+        self.full_content = full_content
+
+
+_STANDARD_CATEGORIES = {c: c for c in ("business", "entertainment", "health", "science", "sports", "technology")}
+
+PROVIDER_CAPABILITIES: Dict[str, ProviderCapabilities] = {
+    "GNews": ProviderCapabilities(
+        "GNews",
+        categories=dict(_STANDARD_CATEGORIES, general="general", world="world"),
+        countries={"global": None, "india": "in", "us": "us", "uk": "gb"},
+        max_page_size=10, full_content=True),
+    # top-headlines only reliably serves US sources (and needs some filter, so global = US);
+    # other regions become a country-name search, which goes to /everything
+    "NewsAPI": ProviderCapabilities(
+        "NewsAPI",
+        categories=dict(_STANDARD_CATEGORIES, general=None),
+        countries={"global": "us", "us": "us"},
+        max_page_size=100),
+    # NewsData has no "general" category; "top" is its front page
+    "NewsData": ProviderCapabilities(
+        "NewsData",
+        categories=dict(_STANDARD_CATEGORIES, general="top", world="world", politics="politics"),
+        countries={"global": None, "india": "in", "us": "us", "uk": "gb"},
+        max_page_size=10),
+    "MediaStack": ProviderCapabilities(
+        "MediaStack",
+        categories=dict(_STANDARD_CATEGORIES, general="general"),
+        countries={"global": "us,gb,in,au,ca", "india": "in", "us": "us", "uk": "gb"},
+        max_page_size=100),
+    "Currents": ProviderCapabilities(
+        "Currents",
+        categories=dict(_STANDARD_CATEGORIES, general=None, world="world", politics="politics"),
+        countries={"global": None, "india": "IN", "us": "US", "uk": "GB"},
+        max_page_size=200),
+    "WorldNews": ProviderCapabilities(
+        "WorldNews",
+        categories=dict(_STANDARD_CATEGORIES, general=None, politics="politics"),
+        countries={"global": None, "india": "in", "us": "us", "uk": "gb"},
+        max_page_size=100, full_content=True),
+    # NewsCatcher calls its categories "topics" and has no health topic
+    "NewsCatcher": ProviderCapabilities(
+        "NewsCatcher",
+        categories={"general": "news", "technology": "tech", "business": "business", "sports": "sport",
+                    "entertainment": "entertainment", "science": "science", "politics": "politics",
+                    "world": "world"},
+        countries={"global": None, "india": "IN", "us": "US", "uk": "GB"},
+        max_page_size=100, full_content=True),
+}
+
+
+class ProviderPlan:
+    """One planned provider call, already translated into the provider's vocabulary"""
+    __slots__ = ("provider", "category", "region", "page_size", "provider_category", "country", "search_terms")
+
+    def __init__(self, provider: str, category: str, region: str, page_size: int,
+                 provider_category: Optional[str] = None, country: Optional[str] = None,
+                 search_terms: Optional[List[str]] = None):
+        self.provider = provider
+        self.category = category
+        self.region = region
+        self.page_size = page_size
+        self.provider_category = provider_category
+        self.country = country
+        # Terms the query must contain because no filter parameter could express them
+        self.search_terms = search_terms or []
+
+    def __repr__(self) -> str:
+        return (f"ProviderPlan({self.provider}: category={self.provider_category!r}, country={self.country!r}, "
+                f"search_terms={self.search_terms!r}, page_size={self.page_size})")
+
+
+def plan_call(provider: str, category: str, region: str, max_articles: int,
+              language: str = "en") -> Tuple[Optional[ProviderPlan], str]:
+    """
+    Plan a call to `provider` for (category, region); returns (plan, "") or
+    (None, reason) when the provider cannot return useful results for it.
+    """
+    caps = PROVIDER_CAPABILITIES.get(provider)
+    if caps is None:
+        return None, "unknown provider"
+    if language not in caps.languages:
+        return None, f"language '{language}' not supported"
+
+    category = (category or "general").lower()
+    region = (region or "global").lower()
+    search_terms = []
+
+    if category in caps.categories:
+        provider_category = caps.categories[category]
+    else:
+        provider_category = None
+        search_terms.append(category)
+
+    if region in caps.countries:
+        country = caps.countries[region]
+    elif region in REGION_NAMES:
+        country = None
+        search_terms.append(REGION_NAMES[region])
+    else:
+        return None, f"region '{region}' not supported"
+
+    page_size = max(1, min(max_articles, caps.max_page_size))
+    return ProviderPlan(provider, category, region, page_size, provider_category, country, search_terms), ""
+
+
+def get_capabilities(provider: str) -> Optional[ProviderCapabilities]:
+    """Capabilities of a provider, or None if unknown"""
+    return PROVIDER_CAPABILITIES.get(provider)
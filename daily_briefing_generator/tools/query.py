@@ -0,0 +1,49 @@
+# tools/query.py - Building provider search queries from request keywords and location
+from typing import Iterable, List, Optional, Union
+
+# Providers reject or silently truncate very long queries
+MAX_QUERY_TERMS = 5
+
+
+def normalize_keywords(keywords: Union[str, Iterable[str], None]) -> List[str]:
+    """Keywords as a clean list; accepts a list or a comma-separated string ("None" = no keywords)"""
+    if not keywords:
+        return []
+    if isinstance(keywords, str):
+        keywords = keywords.strip("[]").split(",")
+    cleaned = []
+    for keyword in keywords:
+        keyword = keyword.strip().strip('"\'')
+        if keyword and keyword.lower() != "none" and keyword.lower() not in (k.lower() for k in cleaned):
+            cleaned.append(keyword)
+    return cleaned[:MAX_QUERY_TERMS]
+
+
+def _quote(term: str) -> str:
+    return f'"{term}"' if " " in term else term
+
+
+def keyword_query(keywords: Optional[List[str]], location: Optional[str] = None, boolean: bool = True,
+                  required: Optional[List[str]] = None) -> str:
+    """
+    Provider query string for the keywords (any of them) and location (required).
+
+    boolean=True produces `(a OR "b c") AND location` for providers with query
+    syntax (GNews, NewsAPI, NewsCatcher, NewsData); boolean=False produces plain
+    space-separated terms for free-text parameters (Currents, WorldNews,
+    MediaStack). `required` terms are AND-ed in like the location (used for a
+    category or country the provider has no filter for). Returns "" when there
+    is nothing to search for.
+    """
+    terms = normalize_keywords(keywords)
+    musts = [term for term in [location] + list(required or []) if term]
+    musts = [term for i, term in enumerate(musts) if term.lower() not in (m.lower() for m in musts[:i])]
+    if not boolean:
+        return " ".join(terms + musts)
+
+    query = " OR ".join(_quote(term) for term in terms)
+    if len(terms) > 1 and musts:
+        query = f"({query})"
+    for term in musts:
+        query = f"{query} AND {_quote(term)}" if query else _quote(term)
+    return query
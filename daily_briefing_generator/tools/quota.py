@@ -0,0 +1,184 @@
+# tools/quota.py - Per-provider rate limiting and daily quota accounting
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
+
+# Free-tier limits per provider: (requests per minute, requests per day).
+# Monthly plans are spread evenly over 30 days. Override with e.g.
+# GNEWS_PER_MINUTE / GNEWS_DAILY_QUOTA in the environment.
+DEFAULT_LIMITS = {
+    "NewsAPI": (30, 1000),
+    "GNews": (10, 100),
+    "NewsData": (30, 200),
+    "MediaStack": (5, 16),        # 500 / month
+    "Currents": (30, 600),
+    "WorldNews": (10, 100),
+    "NewsCatcher": (30, 333),     # 10,000 / month
+    "OpenWeatherMap": (60, 1000),
+}
+
+# Share of the daily budget usable at any moment on top of the paced allowance,
+# so the first requests of the day are not starved
+BURST_FRACTION = 0.1
+
+DEFAULT_STATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".quota_state.json")
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `rate_per_minute`"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, float(rate_per_minute))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available; never waits"""
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+
+
+class QuotaManager:
+    """
+    Tracks per-minute and per-day usage for every news/weather provider.
+
+    Daily counters are persisted to a JSON file so restarts do not reset them,
+    and the daily budget is paced across the (UTC) day: at any moment a provider
+    may only have used its pro-rata share plus a small burst allowance.
+    """
+
+    def __init__(self, state_file: Optional[str] = None, limits: Optional[Dict[str, Tuple[int, int]]] = None,
+                 save_interval: float = 2.0):
+        self.state_file = state_file or os.getenv("QUOTA_STATE_FILE", DEFAULT_STATE_FILE)
+        self.save_interval = save_interval
+        self.limits = {}
+        for provider, (per_minute, per_day) in (limits or DEFAULT_LIMITS).items():
+            prefix = provider.upper()
+            self.limits[provider] = (
+                int(os.getenv(f"{prefix}_PER_MINUTE", per_minute)),
+                int(os.getenv(f"{prefix}_DAILY_QUOTA", per_day))
+            )
+
+        self.buckets = {provider: TokenBucket(per_minute) for provider, (per_minute, _) in self.limits.items()}
+        self.day = self._today()
+        self.usage: Dict[str, int] = {}
+        self.denied: Dict[str, int] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    def try_acquire(self, provider: str) -> Tuple[bool, str]:
+        """
+        Reserve one request for a provider.
+        Returns (allowed, reason); reason explains a refusal.
+        """
+        self._roll_day()
+        if provider not in self.limits:
+            return True, ""
+
+        _, per_day = self.limits[provider]
+        used = self.usage.get(provider, 0)
+        if used >= per_day:
+            return self._deny(provider, f"daily quota exhausted ({used}/{per_day})")
+        if used >= self._paced_allowance(per_day):
+            return self._deny(provider, f"daily budget paced ({used}/{per_day} used, allowance {self._paced_allowance(per_day)})")
+        if not self.buckets[provider].try_acquire():
+            return self._deny(provider, "per-minute rate limit")
+
+        self.usage[provider] = used + 1
+        self._dirty = True
+        self._maybe_save()
+        return True, ""
+
+    def utilization(self) -> Dict[str, Dict[str, Any]]:
+        """Usage report per provider"""
+        self._roll_day()
+        report = {}
+        for provider, (per_minute, per_day) in sorted(self.limits.items()):
+            used = self.usage.get(provider, 0)
+            report[provider] = {
+                "used_today": used,
+                "daily_quota": per_day,
+                "utilization": round(used / per_day, 3) if per_day else 0.0,
+                "paced_allowance": self._paced_allowance(per_day),
+                "per_minute_limit": per_minute,
+                "tokens_available": round(self.buckets[provider].available(), 2),
+                "denied_today": self.denied.get(provider, 0)
+            }
+        return report
+
+    def flush(self) -> None:
+        """Write counters to disk now (used on shutdown)"""
+        if self._dirty:
+            self._save()
+
+    def _deny(self, provider: str, reason: str) -> Tuple[bool, str]:
+        self.denied[provider] = self.denied.get(provider, 0) + 1
+        return False, reason
+
+    def _paced_allowance(self, per_day: int) -> int:
+        now = datetime.now(timezone.utc)
+        elapsed = (now.hour * 3600 + now.minute * 60 + now.second) / 86400
+        return min(per_day, int(per_day * elapsed + max(1, per_day * BURST_FRACTION)))
+
+    def _today(self) -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self.day:
+            self.day = today
+            self.usage = {}
+            self.denied = {}
+            self._dirty = True
+
+    def _load(self) -> None:
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("day") == self.day:
+                self.usage = {k: int(v) for k, v in state.get("usage", {}).items()}
+        except (OSError, ValueError):
+            pass
+
+    def _maybe_save(self) -> None:
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self._save()
+
+    def _save(self) -> None:
+        tmp_file = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"day": self.day, "usage": self.usage}, f)
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"Could not persist quota state: {e}")
+        self._last_save = time.monotonic()
+
+
+# Process-wide quota manager shared by all tools
+_quota_manager: Optional[QuotaManager] = None
+
+
+def get_quota_manager() -> QuotaManager:
+    """Get the process-wide quota manager"""
+    global _quota_manager
+    if _quota_manager is None:
+        _quota_manager = QuotaManager()
+    return _quota_manager
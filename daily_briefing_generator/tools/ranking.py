@@ -0,0 +1,172 @@
+# tools/ranking.py - Local BM25 relevance ranking of fetched articles
+import math
+import os
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "its", "of", "on", "or", "that", "the", "this", "to", "was", "were", "will", "with", "news",
+    "today", "latest", "top", "give", "me", "show", "any", "what", "about", "general", "none"
+}
+
+# Query expansion for our categories, so "technology" also matches "AI", "chip", "startup"...
+CATEGORY_TERMS = {
+    "technology": ["technology", "tech", "software", "ai", "artificial", "intelligence", "startup",
+                   "chip", "semiconductor", "cyber", "digital", "app", "internet", "smartphone"],
+    "business": ["business", "market", "markets", "economy", "stocks", "shares", "company", "earnings",
+                 "investors", "trade", "bank", "finance", "revenue", "inflation"],
+    "health": ["health", "medical", "hospital", "disease", "vaccine", "virus", "patients", "doctors",
+               "drug", "healthcare", "outbreak", "cancer"],
+    "sports": ["sports", "sport", "match", "cricket", "football", "tennis", "league", "cup", "team",
+               "tournament", "olympic", "coach", "win"],
+    "entertainment": ["entertainment", "film", "movie", "music", "celebrity", "actor", "box", "office",
+                      "series", "album", "bollywood", "hollywood"],
+    "science": ["science", "research", "scientists", "space", "nasa", "study", "climate", "discovery"],
+}
+
+# Editorial weight by source (matched as a substring of the lower-cased source name)
+SOURCE_WEIGHTS = {
+    "reuters": 1.0, "associated press": 1.0, "ap news": 1.0, "bbc": 1.0, "bloomberg": 1.0,
+    "the guardian": 0.95, "financial times": 0.95, "new york times": 0.95, "washington post": 0.95,
+    "the hindu": 0.95, "indian express": 0.9, "hindustan times": 0.9, "times of india": 0.85,
+    "ndtv": 0.85, "cnbc": 0.9, "cnn": 0.9, "npr": 0.9, "al jazeera": 0.9, "the verge": 0.85,
+    "techcrunch": 0.85, "ars technica": 0.85, "wired": 0.85, "economic times": 0.9,
+}
+DEFAULT_SOURCE_WEIGHT = 0.7
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens without stopwords"""
+    return [t for t in _WORD_RE.findall(text.lower()) if t not in STOPWORDS] if text else []
+
+
+def build_query(category: str = "general", keywords: Optional[Iterable[str]] = None,
+                location: Optional[str] = None) -> List[str]:
+    """Query terms for a request: category expansion, user keywords and location"""
+    terms = list(CATEGORY_TERMS.get((category or "").lower(), tokenize(category or "")))
+    for keyword in keywords or ():
+        terms.extend(tokenize(keyword))
+    if location:
+        terms.extend(tokenize(location))
+    return list(dict.fromkeys(terms))  # de-duplicated, order kept
+
+
+class ArticleRanker:
+    """
+    Ranks articles by a blend of BM25 relevance, freshness and source weight.
+
+    BM25 runs over title (counted twice) + description against the query terms,
+    as a (documents x query terms) term-frequency matrix in NumPy, and is
+    normalized to [0, 1] by the best match. Freshness decays exponentially with
+    a `half_life_hours` half-life (unknown dates score 0).
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75,
+                 relevance_weight: Optional[float] = None,
+                 freshness_weight: Optional[float] = None,
+                 source_weight: Optional[float] = None,
+                 half_life_hours: Optional[float] = None):
+        self.k1 = k1
+        self.b = b
+        self.relevance_weight = relevance_weight if relevance_weight is not None else float(os.getenv("RANK_RELEVANCE_WEIGHT", "0.6"))
+        self.freshness_weight = freshness_weight if freshness_weight is not None else float(os.getenv("RANK_FRESHNESS_WEIGHT", "0.3"))
+        self.source_weight = source_weight if source_weight is not None else float(os.getenv("RANK_SOURCE_WEIGHT", "0.1"))
+        self.half_life_hours = half_life_hours or float(os.getenv("RANK_HALF_LIFE_HOURS", "12"))
+        self._source_cache: Dict[str, float] = {}
+
+    def bm25(self, articles: Sequence[Any], query: Sequence[str]) -> np.ndarray:
+        """BM25 score per article, normalized to [0, 1]"""
+        n = len(articles)
+        if not n or not query:
+            return np.zeros(n)
+
+        column = {term: j for j, term in enumerate(query)}
+        tf = np.zeros((n, len(query)))
+        lengths = np.empty(n)
+        for i, article in enumerate(articles):
+            title = tokenize(article.get("title", ""))
+            tokens = title + title + tokenize(article.get("description", ""))
+            lengths[i] = len(tokens)
+            for term, count in Counter(tokens).items():
+                j = column.get(term)
+                if j is not None:
+                    tf[i, j] = count
+
+        df = (tf > 0).sum(axis=0)
+        idf = np.log((n - df + 0.5) / (df + 0.5) + 1.0)
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        scores = (idf * tf * (self.k1 + 1) / (tf + norm[:, None])).sum(axis=1)
+
+        best = scores.max()
+        return scores / best if best > 0 else scores
+
+    def freshness(self, articles: Sequence[Any], now: Optional[float] = None) -> np.ndarray:
+        """Exponential freshness decay in [0, 1]"""
+        now = now or time.time()
+        published = np.array([article.get("published_ts") or 0 for article in articles], dtype=float)
+        age_hours = np.clip((now - published) / 3600.0, 0, None)
+        return np.where(published > 0, np.exp(-math.log(2) * age_hours / self.half_life_hours), 0.0)
+
+    def source_weights(self, articles: Sequence[Any]) -> np.ndarray:
+        """Editorial weight of each article's source"""
+        return np.array([self._weight_for(self._source_name(article)) for article in articles])
+
+    def score(self, articles: Sequence[Any], query: Sequence[str], now: Optional[float] = None) -> np.ndarray:
+        """Blended score per article"""
+        if not articles:
+            return np.zeros(0)
+        return (self.relevance_weight * self.bm25(articles, query)
+                + self.freshness_weight * self.freshness(articles, now)
+                + self.source_weight * self.source_weights(articles))
+
+    def rank(self, articles: Sequence[Any], query: Sequence[str], top_k: Optional[int] = None,
+             now: Optional[float] = None) -> List[Any]:
+        """Articles best-first (ties keep their input order), optionally cut to top_k"""
+        articles = list(articles)
+        if not articles:
+            return []
+        order = np.argsort(-self.score(articles, query, now), kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+        return [articles[i] for i in order]
+
+    def _source_name(self, article: Any) -> str:
+        source_name = getattr(article, "source_name", None)
+        if source_name is None:
+            source = article.get("source") or {}
+            source_name = source.get("name", "") if isinstance(source, dict) else str(source)
+        return source_name or ""
+
+    def _weight_for(self, source_name: str) -> float:
+        weight = self._source_cache.get(source_name)
+        if weight is None:
+            lowered = source_name.lower()
+            weight = next((w for name, w in SOURCE_WEIGHTS.items() if name in lowered), DEFAULT_SOURCE_WEIGHT)
+            self._source_cache[source_name] = weight
+        return weight
+
+
+# Process-wide ranker (stateless apart from its source-weight cache)
+_ranker: Optional[ArticleRanker] = None
+
+
+def get_ranker() -> ArticleRanker:
+    """Get the process-wide article ranker"""
+    global _ranker
+    if _ranker is None:
+        _ranker = ArticleRanker()
+    return _ranker
+
+
+def rank_articles(articles: Sequence[Any], category: str = "general", keywords: Optional[Iterable[str]] = None,
+                  location: Optional[str] = None, top_k: Optional[int] = None) -> List[Any]:
+    """Rank articles for a request (category, keywords, location) and keep the top_k"""
+    return get_ranker().rank(articles, build_query(category, keywords, location), top_k)
@@ -0,0 +1,178 @@
+# tools/seen_index.py - Cross-request memory of already-processed articles
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+try:
+    from tools.dedup import ArticleFingerprint
+    from tools.http_pool import get_http_pool
+except ImportError:
+    from dedup import ArticleFingerprint
+    from http_pool import get_http_pool
+
+# Redirector hosts whose links hide the publisher URL
+REDIRECT_HOSTS = ("feeds.feedburner.com", "feedproxy.google.com", "feeds.feedblitz.com")
+
+
+class SeenArticleIndex:
+    """
+    Bounded, time-evicted index of articles the news tools have already processed.
+
+    The same story comes back from several providers and from every request for
+    the same topic. Entries are keyed by (raw URL, title) and remember the
+    article's fingerprint (canonical URL, title/description shingles and LSH
+    keys) plus, optionally, the normalized form a tool built from it, so repeat
+    sightings skip URL canonicalization, tokenizing and MinHashing. Entries
+    expire `ttl` seconds after first being seen; beyond `max_entries` the least
+    recently used are dropped.
+
+    Feedburner-style redirector links are resolved to the publisher URL with a
+    HEAD request; resolutions are cached the same way.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None,
+                 resolve_redirects: Optional[bool] = None, resolve_timeout: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("SEEN_ARTICLE_TTL", "21600"))
+        self.max_entries = max_entries or int(os.getenv("SEEN_ARTICLE_MAX", "20000"))
+        if resolve_redirects is None:
+            resolve_redirects = os.getenv("RESOLVE_FEED_REDIRECTS", "true").lower() == "true"
+        self.resolve_redirects = resolve_redirects
+        self.resolve_timeout = resolve_timeout or float(os.getenv("REDIRECT_RESOLVE_TIMEOUT", "2"))
+
+        # key -> (expires_at, fingerprint, {tool: normalized article})
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, ArticleFingerprint, Dict[str, Any]]]" = OrderedDict()
+        # redirector URL -> (expires_at, resolved URL)
+        self._redirects: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redirects_resolved = 0
+        self.redirect_failures = 0
+
+    def _key(self, article: Dict) -> Tuple[str, str]:
+        return ((article.get("url") or "").strip(), (article.get("title") or "").strip())
+
+    def _entry(self, key: Tuple[str, str], now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            self.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Tuple[str, str], fingerprint: ArticleFingerprint, now: float):
+        entry = self._entries[key] = (now + self.ttl, fingerprint, {})
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def fingerprint(self, article: Dict) -> ArticleFingerprint:
+        """Fingerprint of an article, computed once per TTL"""
+        key = self._key(article)
+        now = time.monotonic()
+        entry = self._entry(key, now)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return self._store(key, ArticleFingerprint(article), now)[1]
+
+    def processed(self, tool: str, raw_article: Dict, process: Callable[[Dict], Dict]) -> Dict:
+        """
+        Return `process(raw_article)`, reusing the result from an earlier sighting by
+        the same tool. Callers get their own copy, so ranking scores, stamps or trims
+        one request applies never leak into the stored article or other requests.
+        """
+        key = self._key(raw_article)
+        now = time.monotonic()
+        entry = self._entry(key, now)
+        if entry is not None and tool in entry[2]:
+            self.hits += 1
+            return entry[2][tool].copy()
+        self.misses += 1
+        result = process(raw_article)
+        if entry is None:
+            entry = self._store(key, ArticleFingerprint(result), now)
+        entry[2][tool] = result
+        return result.copy()
+
+    async def resolve_links(self, articles: List[Dict]) -> None:
+        """Replace redirector links (feedburner etc.) with the publisher URL, in place"""
+        if not self.resolve_redirects:
+            return
+        links = {a["url"] for a in articles if a.get("url") and self._is_redirector(a["url"])}
+        if not links:
+            return
+        links = list(links)
+        resolved = await asyncio.gather(*[self._resolve(link) for link in links])
+        mapping = dict(zip(links, resolved))
+        for article in articles:
+            if article.get("url") in mapping:
+                article["url"] = mapping[article["url"]]
+
+    def _is_redirector(self, url: str) -> bool:
+        host = url.split("://", 1)[-1].split("/", 1)[0].lower()
+        return host in REDIRECT_HOSTS
+
+    async def _resolve(self, url: str) -> str:
+        now = time.monotonic()
+        cached = self._redirects.get(url)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        resolved = url
+        try:
+            session = await get_http_pool().get_session()
+            async with session.head(url, allow_redirects=True,
+                                    timeout=aiohttp.ClientTimeout(total=self.resolve_timeout)) as response:
+                resolved = str(response.url)
+            self.redirects_resolved += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Keep the redirector link; it still works for readers
+            self.redirect_failures += 1
+
+        self._redirects[url] = (now + self.ttl, resolved)
+        self._redirects.move_to_end(url)
+        while len(self._redirects) > self.max_entries:
+            self._redirects.popitem(last=False)
+        return resolved
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index metrics for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "redirects_cached": len(self._redirects),
+            "redirects_resolved": self.redirects_resolved,
+            "redirect_failures": self.redirect_failures
+        }
+
+
+# Process-wide index shared by all news tools
+_seen_index: Optional[SeenArticleIndex] = None
+
+
+def get_seen_index() -> SeenArticleIndex:
+    """Get the process-wide seen-article index"""
+    global _seen_index
+    if _seen_index is None:
+        _seen_index = SeenArticleIndex()
+    return _seen_index
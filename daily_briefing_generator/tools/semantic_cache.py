@@ -0,0 +1,220 @@
+# tools/semantic_cache.py - Similarity cache of finished briefings for paraphrased requests
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from tools.intent import (BRIEFING_TERMS, CATEGORY_OF, GENERIC_CATEGORY_WORDS, NEWS_TERMS, STOPWORDS,
+                              WEATHER_TERMS, Intent, parse_intent, tokenize)
+except ImportError:
+    from intent import (BRIEFING_TERMS, CATEGORY_OF, GENERIC_CATEGORY_WORDS, NEWS_TERMS, STOPWORDS,
+                        WEATHER_TERMS, Intent, parse_intent, tokenize)
+
+# Weight of the parsed intent features relative to the request's own words
+INTENT_WEIGHT = 1.0
+WORD_WEIGHT = 0.5
+
+
+def _canonical_word(word: str) -> Optional[str]:
+    """Word reduced to the vocabulary the intent parser uses, or None for filler"""
+    if word in STOPWORDS:
+        return None
+    if word in WEATHER_TERMS:
+        return "weather"
+    if word in NEWS_TERMS:
+        return "news"
+    if word in BRIEFING_TERMS:
+        return "briefing"
+    if word in GENERIC_CATEGORY_WORDS:
+        return CATEGORY_OF[word]  # "tech" -> "technology", "medical" -> "health"
+    return word
+
+
+def request_features(text: str, intent: Intent) -> Dict[str, float]:
+    """Weighted features of a request: its parsed intent plus its distinct content words"""
+    features: Dict[str, float] = {}
+    if intent.needs_weather:
+        features["needs:weather"] = INTENT_WEIGHT
+    if intent.needs_news:
+        features["needs:news"] = INTENT_WEIGHT
+    if intent.location:
+        features[f"location:{intent.location.lower()}"] = INTENT_WEIGHT
+    for category in intent.categories:
+        features[f"category:{category}"] = INTENT_WEIGHT
+    for keyword in intent.keywords:
+        features[f"keyword:{keyword.lower()}"] = INTENT_WEIGHT
+    if intent.count:
+        features[f"count:{intent.count}"] = INTENT_WEIGHT
+
+    words = {_canonical_word(token.lower().rstrip(".")) for token in tokenize(text)}
+    # "briefing" already shows up as needs:weather + needs:news
+    words.discard("briefing")
+    words.discard(None)
+    for word in words:
+        features.setdefault(f"word:{word}", WORD_WEIGHT)
+    return features
+
+
+def embed(features: Dict[str, float], dim: int) -> np.ndarray:
+    """Signed feature hashing into a unit-length float32 vector"""
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, weight in features.items():
+        h = zlib.crc32(feature.encode("utf-8"))
+        vector[h % dim] += weight if h & 0x80000000 else -weight
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+def plan_signature(intent: Intent, mode: str) -> int:
+    """Hash of what decides the data fetched: a cached briefing is only reused for the same plan"""
+    plan = "|".join((
+        mode,
+        "w" if intent.needs_weather else "",
+        "n" if intent.needs_news else "",
+        (intent.location or "").lower(),
+        intent.country or "",
+        ",".join(intent.categories),
+        ",".join(sorted(keyword.lower() for keyword in intent.keywords)),
+        str(intent.count or ""),
+    ))
+    return zlib.crc32(plan.encode("utf-8"))
+
+
+class SemanticRequestCache:
+    """
+    Cache of finished briefings in front of MasterAgent.run_with_recovery that
+    also serves paraphrases ("Tech news and weather for Mumbai" / "Mumbai
+    morning briefing with technology updates").
+
+    Requests are parsed with parse_intent() and embedded with a local hashing
+    vectorizer over the parsed intent and the request's content words. A
+    lookup is a single matrix-vector product over a fixed-size float32 index
+    (`max_entries` x `dim`), so it stays well under a millisecond. A cached
+    briefing is served when:
+
+    - the request's parse is confident (otherwise its plan is not known),
+    - the plan signature matches exactly (mode, weather/news, location,
+      categories, search keywords, count), so similar wording never swaps
+      the data, and
+    - the cosine similarity is at least `threshold` and the entry is younger
+      than `ttl`, i.e. the weather and news it was built from are still fresh.
+
+    When full, the least recently used slot is overwritten.
+    """
+
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 dim: Optional[int] = None,
+                 threshold: Optional[float] = None,
+                 ttl: Optional[float] = None,
+                 enabled: Optional[bool] = None):
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "256"))
+        self.dim = dim if dim is not None else int(os.getenv("SEMANTIC_CACHE_DIM", "512"))
+        self.threshold = threshold if threshold is not None else float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("SEMANTIC_CACHE_TTL", "300"))
+        self.enabled = enabled if enabled is not None else os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+
+        self._vectors = np.zeros((self.max_entries, self.dim), dtype=np.float32)
+        self._signatures = np.zeros(self.max_entries, dtype=np.int64)
+        self._expires = np.zeros(self.max_entries, dtype=np.float64)  # 0 = empty slot
+        self._last_used = np.zeros(self.max_entries, dtype=np.float64)
+        self._requests: List[Optional[str]] = [None] * self.max_entries
+        self._responses: List[Optional[str]] = [None] * self.max_entries
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.last_lookup_ms = 0.0
+
+    def _prepare(self, user_request: str, mode: str) -> Optional[Tuple[np.ndarray, int]]:
+        intent = parse_intent(user_request)
+        if not intent.confident() or not (intent.needs_weather or intent.needs_news):
+            return None
+        return embed(request_features(user_request, intent), self.dim), plan_signature(intent, mode)
+
+    def lookup(self, user_request: str, mode: str) -> Optional[Tuple[str, str, float]]:
+        """(briefing, cached request, similarity) for a fresh cached paraphrase, else None"""
+        if not self.enabled:
+            return None
+        started = time.perf_counter()
+        prepared = self._prepare(user_request, mode)
+        if prepared is None:
+            self.skipped += 1
+            return None
+        vector, signature = prepared
+
+        now = time.time()
+        scores = self._vectors @ vector
+        scores[(self._signatures != signature) | (self._expires <= now)] = -1.0
+        slot = int(np.argmax(scores))
+        similarity = float(scores[slot])
+        self.last_lookup_ms = (time.perf_counter() - started) * 1000
+
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._last_used[slot] = now
+        return self._responses[slot], self._requests[slot], similarity
+
+    def store(self, user_request: str, mode: str, response: str) -> None:
+        """Remember a successful briefing for its request"""
+        if not self.enabled or not response:
+            return
+        prepared = self._prepare(user_request, mode)
+        if prepared is None:
+            return
+        vector, signature = prepared
+
+        now = time.time()
+        # Replace a near-identical entry for the same plan, else an empty/expired slot, else the LRU one
+        scores = self._vectors @ vector
+        scores[self._signatures != signature] = -1.0
+        slot = int(np.argmax(scores))
+        if scores[slot] < 0.99:
+            free = np.flatnonzero(self._expires <= now)
+            slot = int(free[0]) if len(free) else int(np.argmin(self._last_used))
+
+        self._vectors[slot] = vector
+        self._signatures[slot] = signature
+        self._expires[slot] = now + self.ttl
+        self._last_used[slot] = now
+        self._requests[slot] = user_request
+        self._responses[slot] = response
+
+    def clear(self) -> None:
+        self._expires[:] = 0.0
+        self._requests = [None] * self.max_entries
+        self._responses = [None] * self.max_entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy of the index"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": int(np.count_nonzero(self._expires > time.time())),
+            "max_entries": self.max_entries,
+            "dim": self.dim,
+            "index_bytes": int(self._vectors.nbytes),
+            "threshold": self.threshold,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped_unparsed": self.skipped,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "last_lookup_ms": round(self.last_lookup_ms, 3)
+        }
+
+
+# Process-wide cache shared by all master agents
+_semantic_cache: Optional[SemanticRequestCache] = None
+
+
+def get_semantic_cache() -> SemanticRequestCache:
+    """Get the process-wide semantic request cache"""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticRequestCache()
+    return _semantic_cache
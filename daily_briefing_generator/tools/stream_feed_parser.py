@@ -0,0 +1,106 @@
+# tools/stream_feed_parser.py - Incremental, early-terminating RSS/Atom parser
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+try:
+    from tools.article import Article
+except ImportError:
+    from article import Article
+
+# Child elements we read from an RSS <item> / Atom <entry>, by local tag name
+ENTRY_TAGS = {"item", "entry"}
+TITLE_TAGS = {"title"}
+DESCRIPTION_TAGS = {"description", "summary"}
+CONTENT_TAGS = {"encoded", "content"}          # content:encoded (RSS), content (Atom)
+DATE_TAGS = {"pubDate", "published", "updated", "date"}
+ORIGINAL_LINK_TAGS = {"origLink"}              # feedburner:origLink
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag"""
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
+
+
+class StreamingFeedParser:
+    """
+    Parses an RSS 2.0 / RSS 1.0 / Atom document chunk by chunk as it arrives.
+
+    Feed it bytes with `feed()`; once `max_entries` entries have been collected
+    `done` becomes True and the caller can stop reading the socket. Malformed
+    XML raises xml.etree.ElementTree.ParseError so the caller can fall back to
+    feedparser, which tolerates broken feeds.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.articles: List[Article] = []
+        self.source_name: Optional[str] = None
+        self.bytes_read = 0
+
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._current: Optional[Dict[str, str]] = None
+
+    @property
+    def done(self) -> bool:
+        return len(self.articles) >= self.max_entries
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse another chunk of the document"""
+        self.bytes_read += len(chunk)
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> None:
+        """Signal end of document (raises ParseError if it was truncated)"""
+        self._parser.close()
+        self._drain()
+
+    def _drain(self) -> None:
+        for event, elem in self._parser.read_events():
+            if self.done:
+                return
+            tag = _local(elem.tag)
+
+            if event == "start":
+                if tag in ENTRY_TAGS and self._current is None:
+                    self._current = {}
+                continue
+
+            if self._current is None:
+                # Channel/feed-level title, seen before the first entry
+                if tag == "title" and self.source_name is None and elem.text:
+                    self.source_name = elem.text.strip()
+                continue
+
+            if tag in ENTRY_TAGS:
+                self._finish_entry()
+                elem.clear()
+            elif tag in TITLE_TAGS:
+                self._current.setdefault("title", (elem.text or "").strip())
+            elif tag == "link":
+                # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+                href = elem.get("href")
+                if href and elem.get("rel", "alternate") == "alternate":
+                    self._current.setdefault("link", href)
+                elif elem.text and elem.text.strip():
+                    self._current.setdefault("link", elem.text.strip())
+            elif tag in ORIGINAL_LINK_TAGS and elem.text:
+                self._current["orig_link"] = elem.text.strip()
+            elif tag in DESCRIPTION_TAGS:
+                self._current.setdefault("description", (elem.text or "").strip())
+            elif tag in CONTENT_TAGS:
+                self._current.setdefault("content", (elem.text or "").strip())
+            elif tag in DATE_TAGS and elem.text:
+                self._current.setdefault("published", elem.text.strip())
+
+    def _finish_entry(self) -> None:
+        entry = self._current
+        self._current = None
+        self.articles.append(Article(
+            title=entry.get("title", ""),
+            description=entry.get("description", entry.get("content", "")),
+            url=entry.get("orig_link") or entry.get("link", ""),
+            published_at=entry.get("published", ""),
+            source_name=self.source_name or "RSS Source",
+            content=entry.get("content", "")
+        ))
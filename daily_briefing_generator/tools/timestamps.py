@@ -0,0 +1,122 @@
+# tools/timestamps.py - Fast normalization of provider publish dates to UTC epoch seconds
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+# A timestamp's "shape": digits collapsed, so every "2024-05-01 10:00:00" string shares one key
+_DIGITS_RE = re.compile(r"\d+")
+
+# strptime formats seen from providers that fromisoformat/RFC 822 do not cover
+STRPTIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S %z",       # Currents: 2024-05-01 10:00:00 +0000
+    "%Y-%m-%dT%H:%M:%S.%f%z",     # 2024-05-01T10:00:00.000Z
+    "%a, %d %b %Y %H:%M:%S %Z",   # RSS with named zone
+    "%d %b %Y %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S",
+]
+
+
+def _to_epoch(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)  # providers without an offset report UTC
+    return int(dt.timestamp())
+
+
+def _parse_iso(value: str) -> int:
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return _to_epoch(datetime.fromisoformat(value))
+
+
+def _parse_rfc822(value: str) -> int:
+    return _to_epoch(parsedate_to_datetime(value))
+
+
+def _parse_unix(value: str) -> int:
+    if not value.replace(".", "", 1).isdigit() or len(value) < 9:
+        raise ValueError(f"not a unix timestamp: {value!r}")
+    seconds = float(value)
+    return int(seconds / 1000 if seconds > 1e11 else seconds)  # milliseconds
+
+
+def _strptime_parser(fmt: str) -> Callable[[str], int]:
+    def parse(value: str) -> int:
+        normalized = value[:-1] + "+0000" if fmt.endswith("%z") and value.endswith("Z") else value
+        return _to_epoch(datetime.strptime(normalized, fmt))
+    return parse
+
+
+PARSERS = [_parse_iso, _parse_rfc822, _parse_unix] + [_strptime_parser(fmt) for fmt in STRPTIME_FORMATS]
+
+# shape -> parser that last succeeded for it (None = no parser understands it)
+_format_cache: Dict[str, Optional[Callable[[str], int]]] = {}
+_FORMAT_CACHE_MAX = 512
+
+
+def to_epoch(value) -> Optional[int]:
+    """
+    Convert a provider publish date (RFC 822, ISO 8601, provider-specific
+    strings, unix seconds/ms) to UTC epoch seconds; None if unparseable.
+    The parser that handled a timestamp shape is cached so subsequent
+    timestamps of the same shape are parsed with a single attempt.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        try:
+            return _parse_unix(str(value))
+        except ValueError:
+            return None  # 0, negative or too small to be a publish time
+    if isinstance(value, datetime):
+        return _to_epoch(value)
+
+    value = str(value).strip()
+    shape = _DIGITS_RE.sub("0", value)
+    if shape in _format_cache:
+        parser = _format_cache[shape]
+        if parser is None:
+            return None
+        try:
+            return parser(value)
+        except (ValueError, TypeError, OverflowError):
+            pass  # same shape, different format (e.g. month names); search again
+
+    for parser in PARSERS:
+        try:
+            epoch = parser(value)
+        except (ValueError, TypeError, OverflowError, IndexError):
+            continue
+        _remember(shape, parser)
+        return epoch
+    _remember(shape, None)
+    return None
+
+
+def _remember(shape: str, parser: Optional[Callable[[str], int]]) -> None:
+    if len(_format_cache) >= _FORMAT_CACHE_MAX:
+        _format_cache.clear()
+    _format_cache[shape] = parser
+
+
+def stamp_articles(articles, field: str = "published_at") -> None:
+    """Set `published_ts` (UTC epoch seconds, 0 if unknown) on articles that lack it"""
+    for article in articles:
+        if "published_ts" not in article:
+            article["published_ts"] = to_epoch(article.get(field)) or 0
+
+
+def age_cutoff(since: Optional[int] = None, max_age_hours: Optional[float] = None) -> int:
+    """Oldest acceptable publish time (epoch seconds) for a "since" and/or max-age filter; 0 = no limit"""
+    cutoff = since or 0
+    if max_age_hours:
+        cutoff = max(cutoff, int(time.time() - max_age_hours * 3600))
+    return cutoff
+
+
+def filter_by_age(articles, cutoff: int):
+    """Keep articles published at or after `cutoff`; articles with an unknown date (published_ts 0) are kept"""
+    if not cutoff:
+        return list(articles)
+    return [a for a in articles if not a.get("published_ts") or a["published_ts"] >= cutoff]
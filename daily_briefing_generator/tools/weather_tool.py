@@ -2,13 +2,27 @@
 import asyncio
 import aiohttp
 import os
+import time
 from typing import Dict, Any
 
-async def get_weather_data(city: str, country_code: str = "US") -> Dict[str, Any]:
+try:
+    from tools.http_pool import HTTPConnectionPool, get_http_pool
+    from tools.quota import get_quota_manager
+except ImportError:
+    from http_pool import HTTPConnectionPool, get_http_pool
+    from quota import get_quota_manager
+
+# Last good observation per location, served when the OpenWeatherMap budget is spent
+_last_weather: Dict[tuple, tuple] = {}
+STALE_WEATHER_MAX_AGE = 3 * 3600
+
+async def get_weather_data(city: str, country_code: str = "US", http_pool: HTTPConnectionPool = None) -> Dict[str, Any]:
     """
     Fetch current weather data for a specified city.
     
     This is your agent's 'hand' to reach into the real world and grab weather data.
+    Requests go through the shared keep-alive pool unless one is passed in.
+    When the provider budget is spent, the last observation for the city is reused.
     """
     api_key = os.getenv("OPENWEATHERMAP_API_KEY")
     if not api_key:
@@ -22,12 +36,22 @@ async def get_weather_data(city: str, country_code: str = "US") -> Dict[str, Any
         "units": "metric"  # Celsius temperatures
     }
     
+    cache_key = (city.lower(), country_code.lower())
+    allowed, reason = get_quota_manager().try_acquire("OpenWeatherMap")
+    if not allowed:
+        cached = _last_weather.get(cache_key)
+        if cached and time.time() - cached[0] < STALE_WEATHER_MAX_AGE:
+            return cached[1]
+        return {"error": f"Weather API over budget: {reason}"}
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(base_url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {"error": f"API request failed with status {response.status}"}
+        session = await (http_pool or get_http_pool()).get_session()
+        async with session.get(base_url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status == 200:
+                data = await response.json()
+                _last_weather[cache_key] = (time.time(), data)
+                return data
+            else:
+                return {"error": f"API request failed with status {response.status}"}
     except Exception as e:
         return {"error": f"Network error: {str(e)}"}
@@ -0,0 +1,147 @@
+# tools/yield_tracker.py - Per-provider article yield per (category, region), driving request sizes
+import math
+import os
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class _Yield:
+    """Exponentially weighted yield of one provider for one (category, region)"""
+    __slots__ = ("calls", "requested", "returned", "unique", "fresh", "failure", "skipped_since_call", "last_call")
+
+    def __init__(self):
+        self.calls = 0
+        self.requested = 0.0
+        self.returned = 0.0
+        self.unique = 0.0
+        self.fresh = 0.0
+        self.failure = 0.0
+        self.skipped_since_call = 0
+        self.last_call = 0.0
+
+
+class ProviderYieldTracker:
+    """
+    Tracks how many unique, fresh articles each provider actually contributes
+    per (category, region) after age filtering and deduplication, and how often
+    it fails, as EWMAs over its recent calls.
+
+    allocate() splits a request's article budget between providers in
+    proportion to their expected useful yield (unique * freshness * success),
+    asking each for enough raw articles to cover its dedup losses, plus
+    `headroom` for call-to-call variance. Providers with no history get the
+    default request size. Once a provider has `min_samples` calls for a key
+    and yields fewer than `min_unique` articles or fails more than
+    `max_failure_rate` of the time, should_call() skips it, except for every
+    `explore_every`-th request so it can recover.
+    """
+
+    def __init__(self,
+                 alpha: Optional[float] = None,
+                 min_samples: Optional[int] = None,
+                 min_unique: Optional[float] = None,
+                 max_failure_rate: Optional[float] = None,
+                 explore_every: Optional[int] = None,
+                 fresh_hours: Optional[float] = None,
+                 headroom: Optional[float] = None,
+                 min_request: int = 2):
+        self.alpha = alpha if alpha is not None else float(os.getenv("YIELD_EWMA_ALPHA", "0.3"))
+        self.min_samples = min_samples if min_samples is not None else int(os.getenv("YIELD_MIN_SAMPLES", "3"))
+        self.min_unique = min_unique if min_unique is not None else float(os.getenv("YIELD_MIN_UNIQUE", "0.5"))
+        self.max_failure_rate = max_failure_rate if max_failure_rate is not None else float(os.getenv("YIELD_MAX_FAILURE_RATE", "0.8"))
+        self.explore_every = explore_every if explore_every is not None else int(os.getenv("YIELD_EXPLORE_EVERY", "10"))
+        self.fresh_hours = fresh_hours if fresh_hours is not None else float(os.getenv("YIELD_FRESH_HOURS", "24"))
+        self.headroom = headroom if headroom is not None else float(os.getenv("YIELD_HEADROOM", "1.5"))
+        self.min_request = min_request
+        self.stats: Dict[Tuple[str, str, str], _Yield] = {}
+
+    def _key(self, provider: str, category: str, region: str) -> Tuple[str, str, str]:
+        return provider, (category or "general").lower(), (region or "global").lower()
+
+    def record(self, provider: str, category: str, region: str, requested: int, returned: int = 0,
+               unique: int = 0, fresh: int = 0, failed: bool = False) -> None:
+        """Record one completed call: articles asked for, returned, surviving dedup, and fresh among those"""
+        key = self._key(provider, category, region)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = _Yield()
+        # The first sample seeds the averages instead of being diluted towards zero
+        alpha = 1.0 if stats.calls == 0 else self.alpha
+        stats.requested += alpha * (requested - stats.requested)
+        stats.returned += alpha * (returned - stats.returned)
+        stats.unique += alpha * (unique - stats.unique)
+        stats.fresh += alpha * ((fresh / unique if unique else 0.0) - stats.fresh)
+        stats.failure += alpha * ((1.0 if failed else 0.0) - stats.failure)
+        stats.calls += 1
+        stats.skipped_since_call = 0
+        stats.last_call = time.time()
+
+    def fresh_cutoff(self, now: Optional[float] = None) -> float:
+        """published_ts at or after which an article counts as fresh"""
+        return (now or time.time()) - self.fresh_hours * 3600
+
+    def should_call(self, provider: str, category: str, region: str) -> Tuple[bool, str]:
+        """Whether to call the provider for this key; (False, reason) for a low-yield provider"""
+        stats = self.stats.get(self._key(provider, category, region))
+        if stats is None or stats.calls < self.min_samples:
+            return True, ""
+
+        if stats.failure > self.max_failure_rate:
+            reason = f"failure rate {stats.failure:.0%}"
+        elif stats.unique < self.min_unique:
+            reason = f"{stats.unique:.1f} unique articles per call"
+        else:
+            return True, ""
+
+        stats.skipped_since_call += 1
+        if self.explore_every and stats.skipped_since_call >= self.explore_every:
+            return True, ""  # occasional probe so a recovered provider is noticed
+        return False, reason
+
+    def allocate(self, providers: Iterable[str], category: str, region: str, total: int,
+                 default: int) -> Dict[str, int]:
+        """Articles to request from each provider so that together they cover `total` unique articles"""
+        providers = list(providers)
+        values = {}
+        for provider in providers:
+            stats = self.stats.get(self._key(provider, category, region))
+            if stats is not None and stats.calls >= self.min_samples:
+                values[provider] = stats.unique * (0.5 + 0.5 * stats.fresh) * (1.0 - stats.failure)
+
+        allocation = {provider: default for provider in providers if provider not in values}
+        known_value = sum(values.values())
+        for provider, value in values.items():
+            stats = self.stats[self._key(provider, category, region)]
+            share = total * value / known_value if known_value else 0.0
+            # Ask for the raw articles it usually takes to get `share` unique ones
+            survival = stats.unique / stats.returned if stats.returned else 1.0
+            request = math.ceil(self.headroom * share / max(survival, 0.1))
+            allocation[provider] = max(self.min_request, min(default * 2, request))
+        return allocation
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Yield per provider and "category/region" key"""
+        report: Dict[str, Dict[str, Any]] = {}
+        for (provider, category, region), stats in sorted(self.stats.items()):
+            report.setdefault(provider, {})[f"{category}/{region}"] = {
+                "calls": stats.calls,
+                "requested": round(stats.requested, 1),
+                "returned": round(stats.returned, 1),
+                "unique": round(stats.unique, 1),
+                "fresh_ratio": round(stats.fresh, 2),
+                "failure_rate": round(stats.failure, 2),
+                "skipped_since_call": stats.skipped_since_call
+            }
+        return report
+
+
+# Process-wide tracker shared by all aggregators
+_yield_tracker: Optional[ProviderYieldTracker] = None
+
+
+def get_yield_tracker() -> ProviderYieldTracker:
+    """Get the process-wide provider yield tracker"""
+    global _yield_tracker
+    if _yield_tracker is None:
+        _yield_tracker = ProviderYieldTracker()
+    return _yield_tracker
@@ -18,19 +18,38 @@ from contextlib import asynccontextmanager
 
 # Add parent directories to path for agent imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# Web config lives beside the backend; imported as a module since "config" is the core package
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config"))
 
 from orchestrator.master_agent import MasterAgent
+from tools.http_pool import HTTPConnectionPool, set_http_pool
+from tools.quota import get_quota_manager
+from tools.feed_parser_pool import get_feed_parser_pool
+from tools.news_cache import get_news_cache
+from tools.llm_cache import get_llm_cache
+from web_config import config
 from routes.briefing import briefing_router
 from routes.health import health_router
 
 # Global master agent instance
 master_agent = None
 
+# Global HTTP connection pool shared by all data fetchers
+http_pool = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
-    global master_agent
+    global master_agent, http_pool
     print("🚀 Initializing Daily Briefing Agent...")
+    http_pool = HTTPConnectionPool(
+        limit=config.HTTP_POOL_LIMIT,
+        limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl=config.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT
+    )
+    set_http_pool(http_pool)
+    get_news_cache().configure(ttl=config.CACHE_TTL, enabled=config.ENABLE_CACHE)
     try:
         master_agent = MasterAgent()
         print("✅ Master Agent initialized successfully")
@@ -41,6 +60,11 @@ async def lifespan(app: FastAPI):
     yield
     
     print("🔄 Shutting down Daily Briefing Agent...")
+    await http_pool.close()
+    set_http_pool(None)
+    get_quota_manager().flush()
+    get_llm_cache().flush()
+    get_feed_parser_pool().shutdown()
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,6 +11,9 @@ from pydantic import BaseModel
 from typing import Optional, List
 import asyncio
 import logging
+import time
+
+from orchestrator.master_agent import MODE_AGENTS, ORCHESTRATION_MODES
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,6 +26,7 @@ class BriefingRequest(BaseModel):
     location: Optional[str] = None
     categories: Optional[List[str]] = None
     use_recovery: Optional[bool] = True
+    mode: Optional[str] = MODE_AGENTS
 
 class BriefingResponse(BaseModel):
     success: bool
@@ -42,7 +46,15 @@ async def create_briefing(request: BriefingRequest):
     - **location**: Optional specific location for weather
     - **categories**: Optional news categories filter
     - **use_recovery**: Enable error recovery (default: True)
+    - **mode**: "agents" (sub-agents analyze and narrate) or "single_pass" (one synthesis call over the raw data)
     """
+    mode = request.mode or MODE_AGENTS
+    if mode not in ORCHESTRATION_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid mode. Available: {list(ORCHESTRATION_MODES)}"
+        )
+    
     try:
         # Import here to avoid circular imports
         from app import get_master_agent
@@ -59,10 +71,13 @@ async def create_briefing(request: BriefingRequest):
         logger.info(f"Processing briefing request: {enhanced_query}")
         
         # Generate briefing with or without recovery
+        started = time.perf_counter()
         if request.use_recovery:
-            content = await master_agent.run_with_recovery(enhanced_query)
-        else:
+            content = await master_agent.run_with_recovery(enhanced_query, mode=mode)
+        elif mode == MODE_AGENTS:
             content = await master_agent.process_request(enhanced_query)
+        else:
+            content = await master_agent.process_request_single_pass(enhanced_query)
         
         return BriefingResponse(
             success=True,
@@ -71,7 +86,9 @@ async def create_briefing(request: BriefingRequest):
                 "query": enhanced_query,
                 "location": request.location,
                 "categories": request.categories,
-                "recovery_enabled": request.use_recovery
+                "recovery_enabled": request.use_recovery,
+                "mode": mode,
+                "elapsed_seconds": round(time.perf_counter() - started, 3)
             }
         )
         
@@ -83,12 +100,13 @@ async def create_briefing(request: BriefingRequest):
         )
 
 @briefing_router.get("/briefing/quick/{briefing_type}")
-async def quick_briefing(briefing_type: str, location: Optional[str] = None):
+async def quick_briefing(briefing_type: str, location: Optional[str] = None, mode: str = MODE_AGENTS):
     """
     Generate quick briefings for common requests
     
     - **briefing_type**: weather, news, business, technology, or complete
     - **location**: Optional location for weather briefings
+    - **mode**: "agents" or "single_pass" orchestration
     """
     try:
         from app import get_master_agent
@@ -109,11 +127,17 @@ async def quick_briefing(briefing_type: str, location: Optional[str] = None):
                 status_code=400,
                 detail=f"Invalid briefing type. Available: {list(templates.keys())}"
             )
+        if mode not in ORCHESTRATION_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid mode. Available: {list(ORCHESTRATION_MODES)}"
+            )
         
         query = templates[briefing_type]
         logger.info(f"Processing quick briefing: {query}")
         
-        content = await master_agent.run_with_recovery(query)
+        started = time.perf_counter()
+        content = await master_agent.run_with_recovery(query, mode=mode)
         
         return BriefingResponse(
             success=True,
@@ -121,7 +145,9 @@ async def quick_briefing(briefing_type: str, location: Optional[str] = None):
             metadata={
                 "briefing_type": briefing_type,
                 "location": location,
-                "query": query
+                "query": query,
+                "mode": mode,
+                "elapsed_seconds": round(time.perf_counter() - started, 3)
             }
         )
         
@@ -13,6 +13,18 @@ from datetime import datetime
 import psutil
 import os
 
+from tools.circuit_breaker import get_all_breaker_states
+from tools.quota import get_quota_manager
+from tools.latency import get_latency_tracker
+from tools.feed_parser_pool import get_feed_parser_pool
+from tools.seen_index import get_seen_index
+from tools.prompt_builder import get_prompt_stats
+from tools.prompts import get_system_prompt_stats
+from tools.yield_tracker import get_yield_tracker
+from tools.news_cache import get_news_cache
+from tools.llm_cache import get_llm_cache
+from tools.semantic_cache import get_semantic_cache
+
 health_router = APIRouter(tags=["health"])
 
 class HealthResponse(BaseModel):
@@ -152,6 +164,29 @@ async def agents_health_check():
             "agents": {}
         }
 
+@health_router.get("/health/providers")
+async def providers_health_check():
+    """Circuit breaker state, quota utilization and latency of each external provider"""
+    breakers = get_all_breaker_states()
+    open_providers = [name for name, state in breakers.items() if state["state"] != "closed"]
+    
+    return {
+        "status": "degraded" if open_providers else "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "unavailable_providers": open_providers,
+        "circuit_breakers": breakers,
+        "quota": get_quota_manager().utilization(),
+        "latency": get_latency_tracker().get_stats(),
+        "feed_parsing": get_feed_parser_pool().get_stats(),
+        "seen_articles": get_seen_index().get_stats(),
+        "article_yield": get_yield_tracker().get_stats(),
+        "news_cache": get_news_cache().get_stats(),
+        "llm_cache": get_llm_cache().get_stats(),
+        "semantic_cache": get_semantic_cache().get_stats(),
+        "prompts": get_prompt_stats(),
+        "system_prompts": get_system_prompt_stats()
+    }
+
 @health_router.get("/health/ready")
 async def readiness_check():
     """Kubernetes-style readiness check"""
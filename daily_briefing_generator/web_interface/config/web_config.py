@@ -52,7 +52,7 @@ class WebConfig:
     # Health Check Configuration
     HEALTH_CHECK_INTERVAL: int = int(os.getenv("HEALTH_CHECK_INTERVAL", "30"))
     
-    # Cache Configuration (for future use)
+    # News result cache (tools/news_cache.py): freshness window and on/off switch
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "300"))  # 5 minutes
     ENABLE_CACHE: bool = os.getenv("ENABLE_CACHE", "False").lower() == "true"
     
@@ -63,6 +63,12 @@ class WebConfig:
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     RETRY_DELAY: int = int(os.getenv("RETRY_DELAY", "1"))
     
+    # HTTP Connection Pool (shared by news and weather fetchers)
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    
     # UI Configuration
     MAX_BRIEFING_LENGTH: int = int(os.getenv("MAX_BRIEFING_LENGTH", "10000"))
     DEFAULT_LOCATION: str = os.getenv("DEFAULT_LOCATION", "London")